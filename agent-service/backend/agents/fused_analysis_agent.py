@@ -0,0 +1,70 @@
+from backend.agents.recommendation_agent import clean_recommendations, fallback_recommendations
+from backend.agents.state import AgentState
+from backend.llm.decoding import generate_structured
+from backend.llm.schemas import FusedAnalysis
+from backend.utils.match_scoring import score_match
+
+async def analyze_fused(state: AgentState, gemini_client) -> dict:
+    prompt = f"""
+        COMBINED SCREENING ASSISTANT
+
+        ROLE
+        You are the Combined Screening Assistant for the AI-powered resume screening system. In a single answer you parse the resume, parse the job description, explain how well they match and recommend resume improvements. Use ONLY the provided resume and job description text—do not invent or assume any information not explicitly present.
+
+        TASKS
+        1. parsed_resume: extract personal details, skills (languages, frontend, backend, ai_ml, databases, tools_devops, concepts), education, work experience, projects and certifications exactly as written in the resume
+        2. parsed_jd: extract the job title, must-have vs nice-to-have skills (required/mandatory/essential vs preferred/desired/plus/bonus), experience level, education requirements, key responsibilities, industry keywords, soft skills, employment type and company size indicators
+        3. match_explanation: explain in under 60 words each how the resume meets the job's skills, experience, education and soft skills requirements, naming matched and missing items
+        4. recommendations: 5-10 actionable resume improvements under 15 words each, highest impact first (missing must-have skills, experience gaps, then keywords and formatting)
+
+        OUTPUT FORMAT
+        Return ONLY valid JSON with these EXACT top-level keys (do not change key names):
+
+        {{
+            "parsed_resume": {{"personal_details": {{}}, "skills": {{}}, "education": [], "work_experience": [], "certifications_and_projects": {{"projects": [], "certifications": []}}}},
+            "parsed_jd": {{"job_title": "", "required_skills": {{"must_have": [], "nice_to_have": []}}, "experience_level_required": "", "educational_requirements": "", "key_responsibilities": [], "industry_specific_keywords": [], "soft_skills_mentioned": [], "employment_type": "", "company_size_indicators": ""}},
+            "match_explanation": {{"skills": "", "experience": "", "education": "", "soft_skills": ""}},
+            "recommendations": ["recommendation text"]
+        }}
+
+        RESPONSE REQUIREMENTS
+        - Return ONLY the JSON object, no additional text or explanations
+        - Use consistent skill naming (e.g., "JavaScript" not "JS")
+        - If information is not available, use empty strings and empty arrays in parsed_resume and "Not specified" for strings in parsed_jd
+
+        Resume Text: {state["resume_text"]}
+
+        Job Description: {state["job_description"]}
+    """
+
+    fused = await generate_structured(gemini_client, prompt, "", FusedAnalysis, node="fused")
+    parsed_resume = fused.parsed_resume.model_dump()
+    parsed_jd = fused.parsed_jd.model_dump()
+
+    # Scores stay deterministic; the model's explanation replaces the templated breakdown text
+    match_data = score_match(
+        parsed_resume,
+        parsed_jd,
+        resume_text=state.get("resume_text", ""),
+        job_description=state.get("job_description", "")
+    )
+    match_data["detailed_breakdown"] = {
+        key: getattr(fused.match_explanation, key) or default
+        for key, default in match_data["detailed_breakdown"].items()
+    }
+    match_score = match_data["overall_match_percentage"]
+
+    rec_list = clean_recommendations(fused.recommendations) or fallback_recommendations(match_score)
+
+    return {
+        "parsed_resume": parsed_resume,
+        "parsed_jd": parsed_jd,
+        "match_analysis": match_data,
+        "match_score": match_score,
+        "recommendations": rec_list,
+        "messages": [
+            "Resume and job description analyzed in one call",
+            f"Match score calculated: {match_score}%",
+            f"Generated {len(rec_list)} recommendations"
+        ]
+    }
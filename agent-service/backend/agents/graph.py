@@ -1,31 +1,148 @@
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 
+from backend.config.main import PIPELINE_MODE, TEXT_NORMALIZATION
+from backend.llm.decoding import ResponseDecodeError
 from backend.llm.gemini import GeminiClient
-from backend.agents.jd_analysis_agent import analyze_job_description
+from backend.llm.resilience import ResilientGeminiClient
+from backend.agents.fused_analysis_agent import analyze_fused
+from backend.agents.jd_analysis_agent import analyze_job_description, PROMPT_VERSION as JD_PROMPT_VERSION
 from backend.agents.match_and_score_agent import calculate_match_score
 from backend.agents.recommendation_agent import generate_recommendations
-from backend.agents.resume_parsing_agent import parse_resume
+from backend.agents.resume_parsing_agent import parse_resume, PROMPT_VERSION as RESUME_PROMPT_VERSION
 from backend.agents.state import AgentState
+from backend.utils.metrics import timed_phase
+from backend.utils.parse_cache import parse_cache as default_parse_cache
+from backend.utils.telemetry import record_cache
+from backend.utils.text_normalizer import normalize_text
+
+# State keys the fused node fills in, matching what the node graph produces
+ANALYSIS_KEYS = ("parsed_resume", "parsed_jd", "match_analysis", "match_score", "recommendations")
 
 class JDResumeAnalyzer:
-    def __init__(self):
-        self.gemini_client = GeminiClient()
+    def __init__(self, gemini_client=None, parse_cache=None, match_mode=None, pipeline_mode=None):
+        self.gemini_client = gemini_client or ResilientGeminiClient(GeminiClient())
+        self.parse_cache = parse_cache or default_parse_cache
+        self.match_mode = match_mode
+        self.pipeline_mode = pipeline_mode or PIPELINE_MODE
         self.workflow = self._create_workflow()
+        self.fused_workflow = self._create_fused_workflow()
+        self.candidate_workflow = self._create_candidate_workflow(include_recommendations=True)
+        self.screening_workflow = self._create_candidate_workflow(include_recommendations=False)
+
+    # Nodes are coroutines, so the compiled graphs must be driven with ainvoke/astream.
+    # The parsers consult the content-addressed cache first and skip the LLM call on a hit.
+    # Output seeded by create_reanalysis_state is kept and the node does nothing.
+    async def _resume_parser(self, state: AgentState) -> dict:
+        if state.get("parsed_resume"):
+            return {"messages": ["Resume reused from the previous analysis"]}
+
+        cache_args = ("resume", state["resume_text"], RESUME_PROMPT_VERSION, self.gemini_client.model)
+        cached = await self.parse_cache.get(*cache_args)
+        record_cache("resume_parser", cached is not None)
+        if cached is not None:
+            return {"parsed_resume": cached, "messages": ["Resume loaded from cache"]}
+
+        with timed_phase("resume_parser"):
+            update = await parse_resume(state, self.gemini_client)
+        await self.parse_cache.set(*cache_args, update["parsed_resume"])
+        return update
+
+    async def _jd_analyzer(self, state: AgentState) -> dict:
+        if state.get("parsed_jd"):
+            return {"messages": ["Job description reused from the previous analysis"]}
+
+        cache_args = ("jd", state["job_description"], JD_PROMPT_VERSION, self.gemini_client.model)
+        cached = await self.parse_cache.get(*cache_args)
+        record_cache("jd_analyzer", cached is not None)
+        if cached is not None:
+            return {"parsed_jd": cached, "messages": ["Job description loaded from cache"]}
+
+        with timed_phase("jd_analyzer"):
+            update = await analyze_job_description(state, self.gemini_client)
+        await self.parse_cache.set(*cache_args, update["parsed_jd"])
+        return update
+
+    # One Gemini call instead of four. An answer that cannot be decoded falls
+    # back to the node graph so the request still completes.
+    async def _fused_analyzer(self, state: AgentState) -> dict:
+        try:
+            with timed_phase("fused"):
+                return await analyze_fused(state, self.gemini_client)
+        except ResponseDecodeError as e:
+            print(f"Fused analysis could not be decoded, running the node graph: {e}")
+            result = await self.workflow.ainvoke(state)
+            return {
+                **{key: result[key] for key in ANALYSIS_KEYS},
+                "messages": ["Fused analysis failed, used the node graph"] + result["messages"]
+            }
+
+    def workflow_for(self, pipeline_mode: str = None):
+        return self.fused_workflow if (pipeline_mode or self.pipeline_mode) == "fused" else self.workflow
+
+    async def aclose(self):
+        await self.gemini_client.aclose()
+
+    async def parse_job_description(self, job_description: str) -> dict:
+        if TEXT_NORMALIZATION:
+            job_description, _ = normalize_text(job_description, "jd")
+        update = await self._jd_analyzer({"job_description": job_description, "messages": []})
+        return update["parsed_jd"]
+
+    async def _matcher(self, state: AgentState) -> dict:
+        with timed_phase("matcher"):
+            return await calculate_match_score(state, self.gemini_client, self.match_mode)
+
+    async def _recommender(self, state: AgentState) -> dict:
+        if state.get("recommendations"):
+            return {"messages": ["Recommendations reused from the previous analysis"]}
+        with timed_phase("recommender"):
+            return await generate_recommendations(state, self.gemini_client)
     
     def _create_workflow(self):
         workflow = StateGraph(AgentState)
         
         # Add agent nodes
-        workflow.add_node("resume_parser", lambda s: parse_resume(s, self.gemini_client))
-        workflow.add_node("jd_analyzer", lambda s: analyze_job_description(s, self.gemini_client))
-        workflow.add_node("matcher", lambda s: calculate_match_score(s, self.gemini_client))
-        workflow.add_node("recommender", lambda s: generate_recommendations(s, self.gemini_client))
-        
-        # Define workflow edges
-        workflow.set_entry_point("resume_parser")
-        workflow.add_edge("resume_parser", "jd_analyzer")
-        workflow.add_edge("jd_analyzer", "matcher")
+        workflow.add_node("resume_parser", self._resume_parser)
+        workflow.add_node("jd_analyzer", self._jd_analyzer)
+        workflow.add_node("matcher", self._matcher)
+        workflow.add_node("recommender", self._recommender)
+        
+        # Resume parsing and JD analysis are independent, so fan them out and
+        # join before the matcher. Nodes return partial updates only; messages
+        # are merged by the operator.add reducer on AgentState.
+        workflow.add_edge(START, "resume_parser")
+        workflow.add_edge(START, "jd_analyzer")
+        workflow.add_edge(["resume_parser", "jd_analyzer"], "matcher")
         workflow.add_edge("matcher", "recommender")
         workflow.add_edge("recommender", END)
         
         return workflow.compile()
+
+    def _create_fused_workflow(self):
+        workflow = StateGraph(AgentState)
+        
+        workflow.add_node("fused", self._fused_analyzer)
+        workflow.add_edge(START, "fused")
+        workflow.add_edge("fused", END)
+        
+        return workflow.compile()
+
+    # Per-candidate graph for batch screening: parsed_jd is seeded in the initial
+    # state, so the JD is analyzed once per batch instead of once per resume.
+    def _create_candidate_workflow(self, include_recommendations: bool):
+        workflow = StateGraph(AgentState)
+        
+        workflow.add_node("resume_parser", self._resume_parser)
+        workflow.add_node("matcher", self._matcher)
+        
+        workflow.add_edge(START, "resume_parser")
+        workflow.add_edge("resume_parser", "matcher")
+        
+        if include_recommendations:
+            workflow.add_node("recommender", self._recommender)
+            workflow.add_edge("matcher", "recommender")
+            workflow.add_edge("recommender", END)
+        else:
+            workflow.add_edge("matcher", END)
+        
+        return workflow.compile()
@@ -1,7 +1,11 @@
 from backend.agents.state import AgentState
-import json
+from backend.llm.decoding import ResponseDecodeError, generate_structured
+from backend.llm.schemas import ParsedJobDescription
 
-def analyze_job_description(state: AgentState, gemini_client) -> AgentState:
+# Bump when the prompt or output schema changes so cached parses are not reused
+PROMPT_VERSION = "2"
+
+async def analyze_job_description(state: AgentState, gemini_client) -> dict:
     prompt = """
         JOB DESCRIPTION ANALYSIS ASSISTANT
 
@@ -72,80 +76,16 @@ def analyze_job_description(state: AgentState, gemini_client) -> AgentState:
     """
     print("Job analysis prompt loaded successfully")
     
-    jd_analysis = gemini_client.analyze_text(prompt, state["job_description"])
-    
     try:
-        
-        cleaned_response = jd_analysis.strip()
-        
-        if cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response.replace('```json', '').replace('```', '')
-        elif cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response.replace('```', '')
-        
-        parsed_jd = json.loads(cleaned_response)
-        
-        required_structure = {
-            "job_title": "Not specified",
-            "required_skills": {
-                "must_have": [],
-                "nice_to_have": []
-            },
-            "experience_level_required": "Not specified",
-            "educational_requirements": "Not specified", 
-            "key_responsibilities": [],
-            "industry_specific_keywords": [],
-            "soft_skills_mentioned": [],
-            "employment_type": "Not specified",
-            "company_size_indicators": "Not specified"
-        }
-        
-        for key, default_value in required_structure.items():
-            if key not in parsed_jd:
-                parsed_jd[key] = default_value
-            elif key == "required_skills" and isinstance(parsed_jd[key], dict):
-                if "must_have" not in parsed_jd[key]:
-                    parsed_jd[key]["must_have"] = []
-                if "nice_to_have" not in parsed_jd[key]:
-                    parsed_jd[key]["nice_to_have"] = []
-        
-        state["parsed_jd"] = parsed_jd
-        
-    except json.JSONDecodeError as e:
+        parsed_jd = (await generate_structured(gemini_client, prompt, state["job_description"], ParsedJobDescription, node="jd_analyzer")).model_dump()
+
+    except ResponseDecodeError as e:
         print(f"JSON parsing error: {e}")
-        print(f"Raw response: {jd_analysis}")
-        
-        state["parsed_jd"] = {
-            "job_title": "Not specified",
-            "required_skills": {
-                "must_have": [],
-                "nice_to_have": []
-            },
-            "experience_level_required": "Not specified",
-            "educational_requirements": "Not specified",
-            "key_responsibilities": [],
-            "industry_specific_keywords": [],
-            "soft_skills_mentioned": [],
-            "employment_type": "Not specified", 
-            "company_size_indicators": "Not specified",
-            "raw_analysis": jd_analysis,
+        print(f"Raw response: {e.raw_response}")
+        parsed_jd = {
+            **ParsedJobDescription().model_dump(),
+            "raw_analysis": e.raw_response,
             "parsing_error": str(e)
         }
-    except Exception as e:
-        print(f"Unexpected error: {e}")
-        state["parsed_jd"] = {
-            "job_title": "Error in analysis",
-            "required_skills": {"must_have": [], "nice_to_have": []},
-            "experience_level_required": "Error in analysis",
-            "educational_requirements": "Error in analysis",
-            "key_responsibilities": [],
-            "industry_specific_keywords": [],
-            "soft_skills_mentioned": [],
-            "employment_type": "Error in analysis",
-            "company_size_indicators": "Error in analysis",
-            "raw_analysis": jd_analysis,
-            "error": str(e)
-        }
     
-    state["messages"].append("Job description analyzed")
-    return state
+    return {"parsed_jd": parsed_jd, "messages": ["Job description analyzed"]}
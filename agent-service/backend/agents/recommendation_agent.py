@@ -1,8 +1,53 @@
 from backend.agents.state import AgentState
-import json
-import re
+from backend.llm.decoding import ResponseDecodeError, generate_structured
+from backend.llm.schemas import Recommendations
+from backend.utils.prompt_compactor import compact_prompt_inputs
 
-def generate_recommendations(state: AgentState, gemini_client) -> AgentState:
+GENERIC_RECOMMENDATIONS = [
+    "Review job requirements and align resume content accordingly",
+    "Quantify achievements with specific metrics and results",
+    "Include relevant keywords throughout resume sections",
+    "Highlight most applicable experience and skills",
+    "Consider additional training in required technologies"
+]
+
+def clean_recommendations(recommendations: list) -> list:
+    rec_list = [rec.strip() for rec in recommendations if rec and rec.strip()]
+
+    rec_list = rec_list[:10]
+
+    return [rec for rec in rec_list if len(rec) >= 10]
+
+# Used when the model's answer cannot be decoded
+def fallback_recommendations(match_score: float) -> list:
+    rec_list = []
+    
+    if match_score < 70:
+        rec_list.extend([
+            "Add missing technical skills from job requirements",
+            "Quantify achievements with specific metrics and numbers",
+            "Include relevant keywords from job description"
+        ])
+    
+    if match_score < 50:
+        rec_list.extend([
+            "Gain additional experience in required technologies",
+            "Consider relevant certifications or training programs"
+        ])
+    
+    rec_list.extend([
+        "Optimize resume format for ATS compatibility",
+        "Highlight most relevant experience prominently"
+    ])
+    return rec_list
+
+async def generate_recommendations(state: AgentState, gemini_client) -> dict:
+    inputs = compact_prompt_inputs(
+        "recommender",
+        resume=state.get("parsed_resume"),
+        jd=state.get("parsed_jd"),
+        match=state.get("match_analysis")
+    )
     prompt = f"""
         RESUME IMPROVEMENT RECOMMENDATIONS ASSISTANT
 
@@ -90,82 +135,22 @@ def generate_recommendations(state: AgentState, gemini_client) -> AgentState:
 
         Current Analysis Data:
         Match Score: {state["match_score"]}%
-        Resume Data: {state["parsed_resume"]}
-        Job Requirements: {state["parsed_jd"]}
-        Match Analysis: {state.get("match_analysis", {})}
+        Resume Data: {inputs["resume"]}
+        Job Requirements: {inputs["jd"]}
+        Match Analysis: {inputs["match"]}
     """
     
     print("Recommendations prompt loaded successfully")
-    recommendations = gemini_client.analyze_text(prompt, "")
-    
     try:
-        cleaned_response = recommendations.strip()
-
-        if cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response.replace('```json', '').replace('```', '')
-        elif cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response.replace('```', '')
-
-        rec_list = json.loads(cleaned_response)
-
-        if not isinstance(rec_list, list):
-            raise ValueError("Response is not a JSON array")
-
-        rec_list = [str(rec).strip() for rec in rec_list if rec and str(rec).strip()]
-
-        rec_list = rec_list[:10]
-
-        rec_list = [rec for rec in rec_list if len(rec) >= 10]
-        
-    except (json.JSONDecodeError, ValueError) as e:
-        print(f"JSON parsing error for recommendations: {e}")
-        print(f"Raw response: {recommendations}")
-        
-        lines = recommendations.split('\n')
-        rec_list = []
-        
-        for line in lines:
-            clean_line = re.sub(r'^\d+\.?\s*[-- *]?\s*', '', line.strip())
-            clean_line = clean_line.strip('"\'')
-            
-            if len(clean_line) >= 10 and len(clean_line) <= 100:
-                rec_list.append(clean_line)
-        
-        rec_list = rec_list[:10]
+        recommendations = await generate_structured(gemini_client, prompt, "", Recommendations, node="recommender")
+        rec_list = clean_recommendations(recommendations.root)
     
-    except Exception as e:
-        print(f"Unexpected error generating recommendations: {e}")
-        
-        match_score = state.get("match_score", 0)
-        rec_list = []
-        
-        if match_score < 70:
-            rec_list.extend([
-                "Add missing technical skills from job requirements",
-                "Quantify achievements with specific metrics and numbers",
-                "Include relevant keywords from job description"
-            ])
-        
-        if match_score < 50:
-            rec_list.extend([
-                "Gain additional experience in required technologies",
-                "Consider relevant certifications or training programs"
-            ])
-        
-        rec_list.extend([
-            "Optimize resume format for ATS compatibility",
-            "Highlight most relevant experience prominently"
-        ])
+    except ResponseDecodeError as e:
+        print(f"JSON parsing error for recommendations: {e}")
+        print(f"Raw response: {e.raw_response}")
+        rec_list = fallback_recommendations(state.get("match_score", 0))
     
     if not rec_list:
-        rec_list = [
-            "Review job requirements and align resume content accordingly",
-            "Quantify achievements with specific metrics and results",
-            "Include relevant keywords throughout resume sections",
-            "Highlight most applicable experience and skills",
-            "Consider additional training in required technologies"
-        ]
+        rec_list = list(GENERIC_RECOMMENDATIONS)
     
-    state["recommendations"] = rec_list
-    state["messages"].append(f"Generated {len(rec_list)} recommendations")
-    return state
+    return {"recommendations": rec_list, "messages": [f"Generated {len(rec_list)} recommendations"]}
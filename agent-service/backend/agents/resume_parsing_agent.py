@@ -1,10 +1,14 @@
 from backend.agents.state import AgentState
-import json
+from backend.llm.decoding import ResponseDecodeError, generate_structured
+from backend.llm.schemas import ParsedResume
 import logging
 
 logger = logging.getLogger(__name__)
 
-def parse_resume(state: AgentState, gemini_client) -> AgentState:
+# Bump when the prompt or output schema changes so cached parses are not reused
+PROMPT_VERSION = "2"
+
+async def parse_resume(state: AgentState, gemini_client) -> dict:
     prompt = f"""
         RESUME PARSING ASSISTANT
 
@@ -111,30 +115,16 @@ def parse_resume(state: AgentState, gemini_client) -> AgentState:
     """
     
     try:
-        parsed_data = gemini_client.analyze_text(prompt, "")
-        
-        if parsed_data.startswith("Error") or "GEMINI_" in parsed_data:
-            raise Exception(f"Gemini API error in resume parsing: {parsed_data}")
+        parsed_resume = (await generate_structured(gemini_client, prompt, "", ParsedResume, node="resume_parser")).model_dump()
+        logger.info("Resume parsed successfully")
+
+    except ResponseDecodeError as e:
+        logger.error(f"JSON parsing error in resume parser: {e}")
+        logger.error(f"Raw response: {e.raw_response}")
+        parsed_resume = {"raw_analysis": e.raw_response, "parsing_error": str(e)}
 
-        try:
-            cleaned_response = parsed_data.strip()
-            if cleaned_response.startswith('```'):
-                cleaned_response = cleaned_response.replace('```json', '').replace('```', '')
-            elif cleaned_response.startswith('```'):
-                cleaned_response = cleaned_response.replace('```', '')
-            
-            state["parsed_resume"] = json.loads(cleaned_response)
-            logger.info("Resume parsed successfully")
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error in resume parser: {e}")
-            logger.error(f"Raw response: {parsed_data}")
-            state["parsed_resume"] = {"raw_analysis": parsed_data, "parsing_error": str(e)}
-        
     except Exception as e:
         logger.error(f"Error in resume parser: {str(e)}")
-        state["parsed_resume"] = {"error": str(e), "raw_analysis": ""}
         raise e
     
-    state["messages"].append("Resume parsed successfully")
-    return state
+    return {"parsed_resume": parsed_resume, "messages": ["Resume parsed successfully"]}
@@ -1,6 +1,9 @@
 from typing import TypedDict, Annotated
 import operator
 
+from backend.utils.parse_cache import is_cacheable, text_digest
+from backend.utils.text_normalizer import normalize_inputs
+
 class AgentState(TypedDict):
     resume_text: str
     job_description: str
@@ -9,4 +12,69 @@ class AgentState(TypedDict):
     parsed_jd: dict
     match_score: float
     recommendations: list
-    messages: Annotated[list, operator.add]
\ No newline at end of file
+    input_stats: dict
+    input_hashes: dict
+    messages: Annotated[list, operator.add]
+
+
+class MissingInputError(Exception):
+    pass
+
+
+# Inputs are normalized here, before any node sees them, so every prompt and
+# the parse cache key work on the cleaned text
+def create_initial_state(resume_text: str, job_description: str, **overrides) -> AgentState:
+    resume_text, job_description, input_stats = normalize_inputs(resume_text, job_description)
+    state = {
+        "resume_text": resume_text,
+        "job_description": job_description,
+        "parsed_resume": {},
+        "parsed_jd": {},
+        "match_analysis": {},
+        "match_score": 0,
+        "recommendations": [],
+        "input_stats": input_stats,
+        # Stored with the analysis, so a re-analysis can tell which inputs changed
+        "input_hashes": {"resume": text_digest(resume_text), "jd": text_digest(job_description)},
+        "messages": []
+    }
+    state.update(overrides)
+    return state
+
+
+# State for re-running a previous analysis. An input that is omitted (None) or
+# hashes the same as before keeps its stored parse; match analysis and
+# recommendations are kept only when both parses are. The local scorer reads
+# the raw text too, so when the match is rescored an omitted input needs its
+# stored normalized text (REANALYSIS_STORE_INPUTS). The graph nodes skip
+# whatever is already in the state.
+def create_reanalysis_state(previous: dict, resume_text: str = None, job_description: str = None, refresh_recommendations: bool = False) -> AgentState:
+    state = create_initial_state(resume_text or "", job_description or "")
+    previous_hashes = previous.get("input_hashes") or {}
+    previous_texts = previous.get("input_texts") or {}
+
+    for kind, text, key in (("resume", resume_text, "parsed_resume"), ("jd", job_description, "parsed_jd")):
+        if text is None:
+            state["input_hashes"][kind] = previous_hashes.get(kind)
+            state["resume_text" if kind == "resume" else "job_description"] = previous_texts.get(kind) or ""
+        elif state["input_hashes"][kind] != previous_hashes.get(kind):
+            continue
+
+        if is_cacheable(previous.get(key)):
+            state[key] = previous[key]
+        elif text is None:
+            label = "resume" if kind == "resume" else "job description"
+            raise MissingInputError(f"The previous {label} cannot be reused. Please provide it again.")
+
+    match_analysis = previous.get("match_analysis") or {}
+    if state["parsed_resume"] and state["parsed_jd"] and "overall_match_percentage" in match_analysis:
+        state["match_analysis"] = match_analysis
+        if not refresh_recommendations:
+            state["recommendations"] = previous.get("recommendations") or []
+    else:
+        for kind, text in (("resume", resume_text), ("jd", job_description)):
+            if text is None and not previous_texts.get(kind):
+                label = "resume" if kind == "resume" else "job description"
+                raise MissingInputError(f"The {label} is needed to rescore the match. Please provide it again.")
+
+    return state
@@ -1,10 +1,16 @@
+import ipaddress
 import logging
-from fastapi import FastAPI, status, Request
+import time
+from fastapi import Depends, FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from backend.config.lifespan import lifespan
+from backend.config.main import OPS_ALLOWED_NETWORKS
 from backend.routes.index import router as api_routes
+from backend.utils.parse_cache import parse_cache
+from backend.utils.job_queue import job_queue
+from backend.utils.metrics import http_request_body_bytes, http_request_duration_seconds, http_requests_total, render_metrics
 
 logging.basicConfig(level=logging.INFO)
 from dotenv import load_dotenv
@@ -32,13 +38,65 @@ app.add_middleware(
 
 
 @app.middleware("http")
-async def add_checker(request: Request, call_next):
-    data = await request.body()
-    logging.info(data)
-    return await call_next(request)
+async def record_request_metrics(request: Request, call_next):
+    # Never touches the body: uploads are streamed to the handler untouched
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        labels = {"method": request.method, "route": route.path if route else "unmatched"}
+        http_requests_total.inc(status=status_code, **labels)
+        http_request_duration_seconds.observe(time.perf_counter() - started, **labels)
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            http_request_body_bytes.observe(int(content_length), **labels)
+
+OPS_NETWORKS = [ipaddress.ip_network(network, strict=False) for network in OPS_ALLOWED_NETWORKS]
+
+# Ops endpoints are for scrapers and operators on OPS_ALLOWED_NETWORKS, not for API users
+def require_ops_network(request: Request):
+    try:
+        address = ipaddress.ip_address(request.client.host if request.client else "")
+    except ValueError:
+        address = None
+    if address is None or not any(address in network for network in OPS_NETWORKS):
+        raise HTTPException(status_code=403, detail="Not allowed from this network")
 
 @app.get("/health")
 async def health_check():
     return { "status": "healthy" }
 
+@app.get("/cache-stats", dependencies=[Depends(require_ops_network)])
+async def cache_stats():
+    return { "success": True, "data": parse_cache.stats() }
+
+@app.get("/job-stats", dependencies=[Depends(require_ops_network)])
+async def job_stats():
+    return { "success": True, "data": job_queue.stats() }
+
+@app.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_ops_network)])
+async def metrics(request: Request):
+    cache_stats = parse_cache.stats()
+    queue_stats = job_queue.stats()
+    analyzer = getattr(request.app.state, "analyzer", None)
+    breaker = getattr(getattr(analyzer, "gemini_client", None), "breaker", None)
+    return PlainTextResponse(render_metrics({
+        "parse_cache_lookups_total": ("counter", "Parse cache lookups by kind and outcome", [
+            ({"kind": kind, "outcome": outcome}, value)
+            for kind, counters in cache_stats["by_kind"].items()
+            for outcome, value in counters.items()
+        ]),
+        "parse_cache_entries": ("gauge", "Entries in the in-process parse cache", [({}, cache_stats["size"])]),
+        "analysis_jobs": ("gauge", "Analysis jobs by status", [
+            ({"status": job_status}, queue_stats[job_status]) for job_status in ("queued", "running", "completed", "failed")
+        ]),
+        "gemini_circuit_state": ("gauge", "1 for the current Gemini circuit breaker state", [
+            ({"state": state}, int(breaker.state == state)) for state in ("closed", "open", "half_open")
+        ] if breaker else []),
+    }), media_type="text/plain; version=0.0.4")
+
 app.include_router(prefix="/api", router=api_routes)
@@ -1,23 +1,73 @@
 from contextlib import asynccontextmanager
+from functools import partial
+import signal
+import threading
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 
-from backend.config.main import MONGO_URI
+from backend.agents.graph import JDResumeAnalyzer
+from backend.config.main import MONGO_URI, PARSE_CACHE_PERSISTENT, SERVER_SHUTDOWN_TIMEOUT
 from backend.models.Analysis import Analysis
+from backend.models.AnalysisJobRecord import AnalysisJobRecord
+from backend.models.ParseCacheEntry import ParseCacheEntry
+from backend.utils.parse_cache import parse_cache
+from backend.utils.job_queue import job_queue
+from backend.utils.jwt import load_public_key
+from backend.utils.reuseable_functions import shutdown_extraction_pool, warm_extraction_pool
+from backend.controllers.v1.agents import run_analysis_job
 import logging
 
 
+# uvicorn installs its exit signal handlers before the lifespan starts. Chaining in
+# front of them starts the job drain deadline at the signal, the same moment the
+# server stops accepting connections and starts its own graceful shutdown timeout.
+def drain_jobs_on_exit_signal():
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+        if not callable(previous):
+            continue
+        
+        def handler(signum, frame, previous=previous):
+            job_queue.begin_drain(SERVER_SHUTDOWN_TIMEOUT)
+            previous(signum, frame)
+        
+        signal.signal(sig, handler)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app.db = AsyncIOMotorClient(MONGO_URI)["jd-analyzer"]
     await init_beanie(
         database=app.db,
         document_models=[
-            Analysis
+            Analysis,
+            AnalysisJobRecord,
+            ParseCacheEntry
         ],
     )
+    parse_cache.persistent = PARSE_CACHE_PERSISTENT
+    job_queue.persistent = True
     logging.info("Database initialized")
+    
+    load_public_key()
+    # Built once per process: shares the Gemini connection pool and the compiled graphs.
+    # Production workers are spawned processes that each run this lifespan, so every
+    # worker gets its own Mongo client, Gemini client and extraction pool.
+    app.state.analyzer = JDResumeAnalyzer()
+    await warm_extraction_pool()
+    job_queue.start(partial(run_analysis_job, analyzer=app.state.analyzer))
+    drain_jobs_on_exit_signal()
     yield
+    await job_queue.stop()
+    logging.info(f"Analysis jobs at shutdown: {job_queue.stats()}")
+    await app.state.analyzer.aclose()
+    shutdown_extraction_pool()
     logging.info("Server closed successfully")
+
+
+def get_analyzer(request: Request) -> JDResumeAnalyzer:
+    return request.app.state.analyzer
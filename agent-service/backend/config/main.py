@@ -1,4 +1,4 @@
-from decouple import Config, RepositoryEnv
+from decouple import Config, Csv, RepositoryEnv
 
 import os
 
@@ -12,4 +12,95 @@ __access_public_key_path = os.path.join(
 JWT_ACCESS_KEY_PUBLIC = open(__access_public_key_path, "rb").read()
 
 MONGO_URI = config.get("MONGO_URI")
-PORT = config.get("PORT", cast=int)
\ No newline at end of file
+PORT = config.get("PORT", cast=int)
+
+# Production server (poetry run server-prod); 0 workers starts one per CPU core.
+# Keep-alive should outlast the load balancer's idle timeout so it never reuses a closed connection.
+SERVER_HOST = config.get("SERVER_HOST", default="0.0.0.0")
+SERVER_WORKERS = config.get("SERVER_WORKERS", default=0, cast=int)
+SERVER_KEEP_ALIVE = config.get("SERVER_KEEP_ALIVE", default=65, cast=int)
+SERVER_BACKLOG = config.get("SERVER_BACKLOG", default=2048, cast=int)
+# After SIGTERM, in-flight requests and accepted analysis jobs get this many seconds to finish
+SERVER_SHUTDOWN_TIMEOUT = config.get("SERVER_SHUTDOWN_TIMEOUT", default=30, cast=int)
+
+# Client networks allowed to read /metrics, /cache-stats and /job-stats (deployment-wide traffic, cost and queue counters)
+OPS_ALLOWED_NETWORKS = config.get("OPS_ALLOWED_NETWORKS", default="127.0.0.1/32,::1/128", cast=Csv())
+
+# Verified access tokens are cached per process for up to JWT_CACHE_TTL seconds (never past exp)
+JWT_CACHE_SIZE = config.get("JWT_CACHE_SIZE", default=4096, cast=int)
+JWT_CACHE_TTL = config.get("JWT_CACHE_TTL", default=60.0, cast=float)
+
+PARSE_CACHE_SIZE = config.get("PARSE_CACHE_SIZE", default=1024, cast=int)
+PARSE_CACHE_PERSISTENT = config.get("PARSE_CACHE_PERSISTENT", default=True, cast=bool)
+
+# "local" scores matches without an LLM call; "explain" also asks Gemini to word the breakdown
+MATCH_SCORING_MODE = config.get("MATCH_SCORING_MODE", default="local")
+
+# "graph" runs the four agent nodes; "fused" asks for the whole analysis in one Gemini call.
+# Requests can override it with the pipeline_mode form field.
+PIPELINE_MODE = config.get("PIPELINE_MODE", default="graph")
+
+# Cosine similarity of hashed character n-grams above which two skill names are the same skill
+SKILL_SIMILARITY_CUTOFF = config.get("SKILL_SIMILARITY_CUTOFF", default=0.8, cast=float)
+
+# Resume/JD text is cleaned up and deduplicated before the graph; the least important
+# sections are shortened when it is still over these estimated token budgets (0 disables)
+TEXT_NORMALIZATION = config.get("TEXT_NORMALIZATION", default=True, cast=bool)
+RESUME_MAX_TOKENS = config.get("RESUME_MAX_TOKENS", default=4000, cast=int)
+JD_MAX_TOKENS = config.get("JD_MAX_TOKENS", default=1500, cast=int)
+
+# Estimated tokens of parsed resume/JD data embedded in the matcher and recommender prompts (0 disables trimming)
+PROMPT_TOKEN_BUDGET = config.get("PROMPT_TOKEN_BUDGET", default=1500, cast=int)
+PROMPT_MAX_STRING_CHARS = config.get("PROMPT_MAX_STRING_CHARS", default=200, cast=int)
+
+# Store parsed_resume/job_analysis/match_analysis zstd-compressed; read them back via GET /report/{id}
+ANALYSIS_COMPRESSION = config.get("ANALYSIS_COMPRESSION", default=False, cast=bool)
+ANALYSIS_COMPRESSION_LEVEL = config.get("ANALYSIS_COMPRESSION_LEVEL", default=3, cast=int)
+# Keep the normalized resume/JD text with each analysis (personal data, kept until the report is deleted),
+# so a re-analysis can rescore an omitted input. When off, the client resends it whenever the match is rescored
+REANALYSIS_STORE_INPUTS = config.get("REANALYSIS_STORE_INPUTS", default=False, cast=bool)
+
+# In-process inverted index of each user's stored analyses behind /search/resumes and /search/jobs
+SEARCH_INDEX_MAX_USERS = config.get("SEARCH_INDEX_MAX_USERS", default=1000, cast=int)
+SEARCH_INDEX_SYNC_SECONDS = config.get("SEARCH_INDEX_SYNC_SECONDS", default=1.0, cast=float)
+SEARCH_INDEX_REFRESH_SECONDS = config.get("SEARCH_INDEX_REFRESH_SECONDS", default=300.0, cast=float)
+
+BATCH_MAX_RESUMES = config.get("BATCH_MAX_RESUMES", default=500, cast=int)
+BATCH_CONCURRENCY = config.get("BATCH_CONCURRENCY", default=8, cast=int)
+BATCH_INSERT_SIZE = config.get("BATCH_INSERT_SIZE", default=50, cast=int)
+
+JOB_WORKERS = config.get("JOB_WORKERS", default=4, cast=int)
+JOB_QUEUE_MAX_SIZE = config.get("JOB_QUEUE_MAX_SIZE", default=100, cast=int)
+JOB_RETENTION_SECONDS = config.get("JOB_RETENTION_SECONDS", default=3600, cast=int)
+# How often a worker polls the AnalysisJob collection to stream events of a job another worker runs
+JOB_STATUS_POLL_SECONDS = config.get("JOB_STATUS_POLL_SECONDS", default=0.5, cast=float)
+
+GEMINI_MAX_CONNECTIONS = config.get("GEMINI_MAX_CONNECTIONS", default=100, cast=int)
+GEMINI_MAX_KEEPALIVE_CONNECTIONS = config.get("GEMINI_MAX_KEEPALIVE_CONNECTIONS", default=20, cast=int)
+GEMINI_KEEPALIVE_EXPIRY = config.get("GEMINI_KEEPALIVE_EXPIRY", default=60.0, cast=float)
+
+# Retries of retryable Gemini failures (503, quota, network); per-node budgets as "node:attempts,..."
+GEMINI_MAX_ATTEMPTS = config.get("GEMINI_MAX_ATTEMPTS", default=3, cast=int)
+GEMINI_NODE_ATTEMPTS = config.get("GEMINI_NODE_ATTEMPTS", default="resume_parser:3,jd_analyzer:3,matcher:1,recommender:2,fused:3")
+GEMINI_RETRY_BASE_DELAY = config.get("GEMINI_RETRY_BASE_DELAY", default=0.5, cast=float)
+GEMINI_RETRY_MAX_DELAY = config.get("GEMINI_RETRY_MAX_DELAY", default=8.0, cast=float)
+GEMINI_HEDGE_ENABLED = config.get("GEMINI_HEDGE_ENABLED", default=False, cast=bool)
+GEMINI_HEDGE_MIN_SAMPLES = config.get("GEMINI_HEDGE_MIN_SAMPLES", default=20, cast=int)
+GEMINI_CIRCUIT_FAILURE_THRESHOLD = config.get("GEMINI_CIRCUIT_FAILURE_THRESHOLD", default=5, cast=int)
+GEMINI_CIRCUIT_RESET_SECONDS = config.get("GEMINI_CIRCUIT_RESET_SECONDS", default=30.0, cast=float)
+
+# USD per million tokens, used for the per-analysis cost estimate (defaults: gemini-2.5-flash list price)
+GEMINI_INPUT_COST_PER_MTOK = config.get("GEMINI_INPUT_COST_PER_MTOK", default=0.30, cast=float)
+GEMINI_OUTPUT_COST_PER_MTOK = config.get("GEMINI_OUTPUT_COST_PER_MTOK", default=2.50, cast=float)
+
+# Client-side quota shared by all workers on the host (0 disables a limit)
+GEMINI_REQUESTS_PER_MINUTE = config.get("GEMINI_REQUESTS_PER_MINUTE", default=0, cast=int)
+GEMINI_TOKENS_PER_MINUTE = config.get("GEMINI_TOKENS_PER_MINUTE", default=0, cast=int)
+GEMINI_OUTPUT_TOKEN_RESERVE = config.get("GEMINI_OUTPUT_TOKEN_RESERVE", default=1024, cast=int)
+GEMINI_RATE_LIMIT_MAX_WAIT = config.get("GEMINI_RATE_LIMIT_MAX_WAIT", default=30.0, cast=float)
+GEMINI_RATE_LIMIT_STATE_PATH = config.get("GEMINI_RATE_LIMIT_STATE_PATH", default="")
+
+RESUME_MAX_BYTES = config.get("RESUME_MAX_BYTES", default=5 * 1024 * 1024, cast=int)
+RESUME_MAX_PAGES = config.get("RESUME_MAX_PAGES", default=20, cast=int)
+EXTRACTION_WORKERS = config.get("EXTRACTION_WORKERS", default=os.cpu_count() or 1, cast=int)
+PDF_PARALLEL_PAGE_THRESHOLD = config.get("PDF_PARALLEL_PAGE_THRESHOLD", default=8, cast=int)
@@ -1,117 +1,493 @@
 from fastapi import UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.encoders import jsonable_encoder
-from typing import Optional
+from typing import List, Optional
 from backend.agents.graph import JDResumeAnalyzer
-from backend.utils.reuseable_functions import extract_text_from_docx, extract_text_from_pdf, safe_process_data
-from backend.models.Analysis import Analysis
+from backend.agents.state import MissingInputError, create_initial_state, create_reanalysis_state
+from backend.config.main import ANALYSIS_COMPRESSION, ANALYSIS_COMPRESSION_LEVEL, BATCH_CONCURRENCY, BATCH_INSERT_SIZE, BATCH_MAX_RESUMES, REANALYSIS_STORE_INPUTS
+from backend.utils.job_queue import AnalysisJob, job_queue
+from backend.utils.metrics import timed_phase
+from backend.utils.reuseable_functions import ResumeTooLargeError, extract_resume_text_async, format_sse, safe_process_data
+from backend.utils.search_index import parse_jd_text, parse_resume_text, search_index
+from backend.utils.telemetry import start_telemetry
+from backend.models.Analysis import SUMMARY_PROJECTION, Analysis
 from beanie import PydanticObjectId
+from bson import ObjectId
+from bson.errors import InvalidId
+from datetime import datetime, timedelta, timezone
+import asyncio
+import json
 import math
 
-async def analyze_resume(current_user, resume: UploadFile = File(...), jd: str = Form(...), job_title: str = Form(...), company: Optional[str] = Form(None)):
+WORKFLOW_ERRORS = [
+    ("GEMINI_503_UNAVAILABLE", "AI service is temporarily unavailable. Please try again in a few minutes.", 503),
+    ("GEMINI_QUOTA_EXCEEDED", "AI service quota exceeded. Please try again later.", 429),
+    ("GEMINI_NETWORK_ERROR", "Network connectivity issue. Please check your connection and try again.", 502),
+]
+
+def workflow_error_details(workflow_error):
+    error_str = str(workflow_error)
+    for code, message, status_code in WORKFLOW_ERRORS:
+        if code in error_str:
+            return message, status_code
+    return f"Analysis failed: {error_str}", 500
+
+def build_analysis(current_user, result, job_title, company, telemetry=None, previous_analysis_id=None):
+    processed_resume = safe_process_data(result.get("parsed_resume", {}), "resume")
+    processed_job_analysis = safe_process_data(result.get("parsed_jd", {}), "job")
+    
+    formatted_data = {
+        "match_percentage": int(result.get("match_score", 0)),
+        "match_analysis": result.get("match_analysis", {}),
+        "parsed_resume": processed_resume,
+        "job_analysis": processed_job_analysis,
+        "recommendations": result.get("recommendations", []),
+    }
+    
+    analysis = Analysis(
+        user_id=PydanticObjectId(current_user.get('_id')),
+        company=company,
+        job_title=job_title,
+        match_percentage=int(result.get("match_score", 0)),
+        match_analysis=result.get("match_analysis", {}),
+        parsed_resume=processed_resume,
+        job_analysis=processed_job_analysis,
+        recommendations=result.get("recommendations", []),
+        telemetry=telemetry.summary() if telemetry else None,
+        input_hashes=result.get("input_hashes"),
+        input_texts={"resume": result.get("resume_text", ""), "jd": result.get("job_description", "")} if REANALYSIS_STORE_INPUTS else {},
+        previous_analysis_id=previous_analysis_id,
+    )
+    if ANALYSIS_COMPRESSION:
+        analysis.compress(ANALYSIS_COMPRESSION_LEVEL)
+    return formatted_data, analysis
+
+async def analyze_resume(current_user, analyzer: JDResumeAnalyzer, resume: UploadFile = File(...), jd: str = Form(...), job_title: str = Form(...), company: Optional[str] = Form(None), pipeline_mode: Optional[str] = None):
     print("===========", current_user)
+    telemetry = start_telemetry()
     try:
-        file_content = await resume.read()
+        with timed_phase("upload_read"):
+            file_content = await resume.read()
+        resume_text = await extract_resume_text_async(resume.filename, file_content)
         
-        if resume.filename.endswith('.pdf'):
-            resume_text = extract_text_from_pdf(file_content=file_content)
-        elif resume.filename.endswith('.docx'):
-            resume_text = extract_text_from_docx(file_content=file_content)
-        else:
+        if resume_text is None:
             return JSONResponse({"success": False, "message": "Invalid file format. Accepts PDF/DOCX"}, status_code=400)
         
-        initial_state = {
-            "resume_text": resume_text,
-            "job_description": jd,
-            "parsed_resume": {},
-            "parsed_jd": {},
-            "match_analysis": {},
-            "match_score": 0,
-            "recommendations": [],
-            "messages": []
-        }
-        
         try:
-            analyzer = JDResumeAnalyzer()
-            result = analyzer.workflow.invoke(initial_state)
+            result = await analyzer.workflow_for(pipeline_mode).ainvoke(create_initial_state(resume_text, jd))
             
             print(f"Workflow completed. Match score: {result.get('match_score', 'Unknown')}")
             
         except Exception as workflow_error:
-            error_str = str(workflow_error)
-            print(f"Workflow error: {error_str}")
+            print(f"Workflow error: {workflow_error}")
             import traceback
             traceback.print_exc()
-                    
-            if "GEMINI_503_UNAVAILABLE" in error_str:
-                return JSONResponse({"success": False, "message": "AI service is temporarily unavailable. Please try again in a few minutes."}, status_code=503)
             
-            elif "GEMINI_QUOTA_EXCEEDED" in error_str:
-                return JSONResponse({"success": False, "message": "AI service quota exceeded. Please try again later."}, status_code=429)
-            
-            elif "GEMINI_NETWORK_ERROR" in error_str:
-                return JSONResponse({"success": False, "message": "Network connectivity issue. Please check your connection and try again."}, status_code=502)   
-            else:
-                return JSONResponse({"success": False, "message": f"Analysis failed: {str(workflow_error)}"}, status_code=500)
-        
-        processed_resume = safe_process_data(result.get("parsed_resume", {}), "resume")
-        processed_job_analysis = safe_process_data(result.get("parsed_jd", {}), "job")
-        
-        formatted_data = {
-            "match_percentage": int(result.get("match_score", 0)),
-            "match_analysis": result.get("match_analysis", {}),
-            "parsed_resume": processed_resume,
-            "job_analysis": processed_job_analysis,
-            "recommendations": result.get("recommendations", []),
-        }
+            message, status_code = workflow_error_details(workflow_error)
+            return JSONResponse({"success": False, "message": message}, status_code=status_code)
         
-        analysis = Analysis(
-            user_id=PydanticObjectId(current_user.get('_id')),
-            company=company,
-            job_title=job_title,
-            match_percentage=int(result.get("match_score", 0)),
-            match_analysis=result.get("match_analysis", {}),
-            parsed_resume=processed_resume,
-            job_analysis=processed_job_analysis,
-            recommendations=result.get("recommendations", []),
-        )
+        formatted_data, analysis = build_analysis(current_user, result, job_title, company, telemetry)
         
-        await analysis.save()
+        with timed_phase("db_save"):
+            await analysis.save()
+        search_index.add(analysis)
         return JSONResponse({"success": True, "data": jsonable_encoder(formatted_data)}, status_code=200)
         
+    except ResumeTooLargeError as e:
+        return JSONResponse({"success": False, "message": str(e)}, status_code=413)
     except Exception as e:
         print(f"Main error: {e}")
         import traceback
         traceback.print_exc()
         return JSONResponse({"success": False, "message": "Something went wrong"}, status_code=500)
+
+# State keys that get safe_process_data normalization before they are streamed
+STREAMED_DATA_TYPES = {"parsed_resume": "resume", "parsed_jd": "job"}
+
+def format_partial_state(update: dict) -> dict:
+    return {
+        key: safe_process_data(value, STREAMED_DATA_TYPES[key]) if key in STREAMED_DATA_TYPES else value
+        for key, value in update.items()
+        if key != "messages"
+    }
+
+async def analyze_resume_stream(current_user, analyzer: JDResumeAnalyzer, resume: UploadFile, jd: str, job_title: str, company: Optional[str] = None, pipeline_mode: Optional[str] = None):
+    telemetry = start_telemetry()
+    try:
+        with timed_phase("upload_read"):
+            file_content = await resume.read()
+        resume_text = await extract_resume_text_async(resume.filename, file_content)
+    except ResumeTooLargeError as e:
+        return JSONResponse({"success": False, "message": str(e)}, status_code=413)
+    except Exception as e:
+        print(f"Stream setup error: {e}")
+        return JSONResponse({"success": False, "message": "Something went wrong"}, status_code=500)
+    
+    if resume_text is None:
+        return JSONResponse({"success": False, "message": "Invalid file format. Accepts PDF/DOCX"}, status_code=400)
+    
+    async def events():
+        # The body is iterated by the response, possibly in another context
+        start_telemetry(telemetry)
+        result = None
+        try:
+            async for mode, chunk in analyzer.workflow_for(pipeline_mode).astream(create_initial_state(resume_text, jd), stream_mode=["updates", "values"]):
+                if mode == "values":
+                    result = chunk
+                    continue
+                for node, update in chunk.items():
+                    partial = format_partial_state(update or {})
+                    for key, value in partial.items():
+                        yield format_sse(key, jsonable_encoder({"node": node, "value": value}))
+        
+        except Exception as workflow_error:
+            print(f"Workflow error: {workflow_error}")
+            message, status_code = workflow_error_details(workflow_error)
+            yield format_sse("error", {"message": message, "status_code": status_code})
+            return
+        
+        try:
+            formatted_data, analysis = build_analysis(current_user, result, job_title, company, telemetry)
+            with timed_phase("db_save"):
+                await analysis.save()
+            search_index.add(analysis)
+            yield format_sse("completed", jsonable_encoder({**formatted_data, "analysis_id": str(analysis.id)}))
+        except Exception as e:
+            print(f"Stream save error: {e}")
+            yield format_sse("error", {"message": "Something went wrong", "status_code": 500})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+async def analyze_resume_batch(current_user, analyzer: JDResumeAnalyzer, resumes: List[UploadFile], jd: str, job_title: str, company: Optional[str] = None, include_recommendations: bool = False):
+    if not resumes:
+        return JSONResponse({"success": False, "message": "At least one resume is required"}, status_code=400)
+    
+    if len(resumes) > BATCH_MAX_RESUMES:
+        return JSONResponse({"success": False, "message": f"A batch accepts at most {BATCH_MAX_RESUMES} resumes"}, status_code=413)
+    
+    try:
+        # Read every upload before streaming starts; the request files are closed once the handler returns
+        with timed_phase("upload_read"):
+            uploads = [(resume.filename, await resume.read()) for resume in resumes]
+        
+        parsed_jd = await analyzer.parse_job_description(jd)
+        
+    except Exception as e:
+        print(f"Batch setup error: {e}")
+        message, status_code = workflow_error_details(e)
+        return JSONResponse({"success": False, "message": message}, status_code=status_code)
+    
+    workflow = analyzer.candidate_workflow if include_recommendations else analyzer.screening_workflow
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def analyze_candidate(index, filename, file_content):
+        async with semaphore:
+            # Each candidate runs in its own task, so it gets its own telemetry
+            telemetry = start_telemetry()
+            try:
+                resume_text = await extract_resume_text_async(filename, file_content)
+                if resume_text is None:
+                    return index, filename, None, "Invalid file format. Accepts PDF/DOCX", telemetry
+                
+                result = await workflow.ainvoke(create_initial_state(resume_text, jd, parsed_jd=parsed_jd))
+                return index, filename, result, None, telemetry
+            
+            except ResumeTooLargeError as e:
+                return index, filename, None, str(e), telemetry
+            except Exception as workflow_error:
+                print(f"Batch workflow error for {filename}: {workflow_error}")
+                return index, filename, None, workflow_error_details(workflow_error)[0], telemetry
+    
+    async def save(analyses):
+        with timed_phase("db_save"):
+            await Analysis.insert_many(analyses)
+        search_index.add_many(analyses)
+    
+    async def stream_results():
+        pending_inserts, ranking = [], []
+        tasks = [asyncio.create_task(analyze_candidate(index, *upload)) for index, upload in enumerate(uploads)]
+        
+        try:
+            for completed in asyncio.as_completed(tasks):
+                index, filename, result, error, telemetry = await completed
+                
+                if error:
+                    yield json.dumps({"type": "candidate", "success": False, "index": index, "filename": filename, "message": error}) + "\n"
+                    continue
+                
+                formatted_data, analysis = build_analysis(current_user, result, job_title, company, telemetry)
+                pending_inserts.append(analysis)
+                ranking.append({
+                    "index": index,
+                    "filename": filename,
+                    "name": (formatted_data["parsed_resume"].get("personal_details") or {}).get("name", ""),
+                    "match_percentage": formatted_data["match_percentage"],
+                })
+                
+                # Shielded: a client disconnecting mid-insert must not lose the batch
+                if len(pending_inserts) >= BATCH_INSERT_SIZE:
+                    batch, pending_inserts = pending_inserts, []
+                    await asyncio.shield(save(batch))
+                
+                yield json.dumps(jsonable_encoder({"type": "candidate", "success": True, "index": index, "filename": filename, "data": formatted_data})) + "\n"
+            
+            if pending_inserts:
+                batch, pending_inserts = pending_inserts, []
+                await asyncio.shield(save(batch))
+            
+            ranking.sort(key=lambda candidate: candidate["match_percentage"], reverse=True)
+            for rank, candidate in enumerate(ranking, start=1):
+                candidate["rank"] = rank
+            
+            yield json.dumps(jsonable_encoder({
+                "type": "summary",
+                "success": True,
+                "job_analysis": safe_process_data(parsed_jd, "job"),
+                "total": len(uploads),
+                "analyzed": len(ranking),
+                "failed": len(uploads) - len(ranking),
+                "ranking": ranking,
+            })) + "\n"
+        
+        finally:
+            # Analyses already streamed are saved even when the client disconnects
+            try:
+                if pending_inserts:
+                    await asyncio.shield(save(pending_inserts))
+            except Exception as e:
+                print(f"Batch save error: {e}")
+            finally:
+                for task in tasks:
+                    task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+    
+async def submit_analysis_job(current_user, resume: UploadFile, jd: str, job_title: str, company: Optional[str] = None, pipeline_mode: Optional[str] = None):
+    try:
+        if job_queue.is_full():
+            return JSONResponse({"success": False, "message": "Too many analyses in progress. Please retry shortly."}, status_code=429, headers={"Retry-After": "30"})
+        
+        with timed_phase("upload_read"):
+            file_content = await resume.read()
+        resume_text = await extract_resume_text_async(resume.filename, file_content)
+        
+        if resume_text is None:
+            return JSONResponse({"success": False, "message": "Invalid file format. Accepts PDF/DOCX"}, status_code=400)
+        
+        job = AnalysisJob(user_id=str(current_user.get("_id")), payload={
+            "current_user": current_user,
+            "state": create_initial_state(resume_text, jd),
+            "job_title": job_title,
+            "company": company,
+            "pipeline_mode": pipeline_mode,
+        })
+        job_queue.submit(job)
+        
+        return JSONResponse({"success": True, "data": {"job_id": job.id, "status": job.status}}, status_code=202)
+    
+    except ResumeTooLargeError as e:
+        return JSONResponse({"success": False, "message": str(e)}, status_code=413)
+    except asyncio.QueueFull:
+        return JSONResponse({"success": False, "message": "Too many analyses in progress. Please retry shortly."}, status_code=429, headers={"Retry-After": "30"})
+    except Exception as e:
+        print(f"Job submission error: {e}")
+        return JSONResponse({"success": False, "message": "Something went wrong"}, status_code=500)
+
+async def run_analysis_job(job: AnalysisJob, analyzer: JDResumeAnalyzer):
+    payload = job.payload
+    telemetry = start_telemetry()
+    result = None
     
-async def past_reports(current_user, page: int=1, limit: int=10):
+    try:
+        async for mode, chunk in analyzer.workflow_for(payload.get("pipeline_mode")).astream(payload["state"], stream_mode=["updates", "values"]):
+            if mode == "updates":
+                for node in chunk:
+                    job.publish("node", {"node": node, "status": "done"})
+            else:
+                result = chunk
+    except Exception as workflow_error:
+        print(f"Workflow error in job {job.id}: {workflow_error}")
+        raise Exception(workflow_error_details(workflow_error)[0])
+    
+    formatted_data, analysis = build_analysis(payload["current_user"], result, payload["job_title"], payload["company"], telemetry)
+    with timed_phase("db_save"):
+        await analysis.save()
+    search_index.add(analysis)
+    
+    return jsonable_encoder({**formatted_data, "analysis_id": str(analysis.id)})
+
+def find_user_job(current_user, job_id: str):
+    job = job_queue.get(job_id)
+    if job is None or job.user_id != str(current_user.get("_id")):
+        return None
+    return job
+
+# Jobs run in the server worker that accepted them; other workers read their record
+async def find_user_job_snapshot(current_user, job_id: str):
+    snapshot = await job_queue.snapshot(job_id)
+    if snapshot is None or snapshot.pop("user_id", None) != str(current_user.get("_id")):
+        return None
+    return snapshot
+
+async def get_analysis_job(current_user, job_id: str):
+    snapshot = await find_user_job_snapshot(current_user, job_id)
+    if snapshot is None:
+        return JSONResponse({"success": False, "message": "Job not found"}, status_code=404)
+    
+    return JSONResponse({"success": True, "data": jsonable_encoder(snapshot)}, status_code=200)
+
+async def stream_analysis_job(current_user, job_id: str):
+    job = find_user_job(current_user, job_id)
+    if job is None and await find_user_job_snapshot(current_user, job_id) is None:
+        return JSONResponse({"success": False, "message": "Job not found"}, status_code=404)
+    
+    async def events():
+        entries = job.subscribe() if job is not None else job_queue.follow(job_id)
+        async for entry in entries:
+            yield format_sse(entry["event"], entry["data"])
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+def past_reports_pipeline(user_id, page: int, limit: int, cursor=None, view: str = "full") -> list:
+    # The count and the id page come from the (user_id, _id) index alone; only
+    # the documents on the requested page are fetched, via $lookup
+    page_stages = [{"$match": {"_id": {"$lt": cursor}}}] if cursor else [{"$skip": (page - 1) * limit}]
+    page_stages += [
+        {"$limit": limit + 1},
+        {"$lookup": {"from": Analysis.Settings.name, "localField": "_id", "foreignField": "_id", "as": "document"}},
+        {"$unwind": "$document"},
+        {"$replaceRoot": {"newRoot": "$document"}},
+    ]
+    # Compressed heavy fields are only expanded by the detail endpoint
+    page_stages.append({"$project": SUMMARY_PROJECTION if view == "summary" else {"compressed_fields": 0, "input_texts": 0}})
+
+    return [
+        {"$match": {"user_id": user_id}},
+        {"$sort": {"_id": -1}},
+        {"$project": {"_id": 1}},
+        {"$facet": {"total": [{"$count": "count"}], "items": page_stages}},
+    ]
+
+async def past_reports(current_user, page: int=1, limit: int=10, cursor: Optional[str]=None, view: str="full"):
     try:
         user_id = PydanticObjectId(current_user.get("_id"))
-        query_filter = {"user_id": user_id}
-        skip = (page - 1) * limit
+        cursor_id = PydanticObjectId(cursor) if cursor else None
         
-        total_count = await Analysis.find(query_filter).count()
+        # Motor collection: Beanie's own aggregate() expects the PyMongo async driver
+        facet = await Analysis.get_pymongo_collection().aggregate(
+            past_reports_pipeline(user_id, page, limit, cursor_id, view)
+        ).to_list(length=1)
+        total_count = facet[0]["total"][0]["count"] if facet and facet[0]["total"] else 0
+        find_data = facet[0]["items"] if facet else []
         
-        total_pages = math.ceil(total_count / limit) if total_count > 0 else 1
+        # One extra item is fetched to know whether another page follows
+        has_more = len(find_data) > limit
+        find_data = find_data[:limit]
         
-        find_data = await Analysis.find(query_filter).sort([("_id", -1)]).skip(skip).limit(limit).to_list()
+        total_pages = math.ceil(total_count / limit) if total_count > 0 else 1
         
         pagination = {
-            "current_page": page,
+            "current_page": None if cursor else page,
             "per_page": limit,
             "total_items": total_count,
             "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1,
-            "next_page": page + 1 if page < total_pages else None,
-            "prev_page": page - 1 if page > 1 else None
+            "has_next": has_more,
+            "has_prev": bool(cursor) or page > 1,
+            "next_page": page + 1 if has_more and not cursor else None,
+            "prev_page": page - 1 if page > 1 and not cursor else None,
+            "next_cursor": str(find_data[-1]["_id"]) if has_more else None
         }
         
         if len(find_data) == 0:
             return JSONResponse({ "success": True, "data": [] }, status_code=200)
         
-        return JSONResponse({ "success": True, "data": jsonable_encoder(find_data), "paginate": jsonable_encoder(pagination) }, status_code=200)
+        data = jsonable_encoder(find_data, custom_encoder={PydanticObjectId: str, ObjectId: str})
+        return JSONResponse({ "success": True, "data": data, "paginate": jsonable_encoder(pagination) }, status_code=200)
+    except InvalidId:
+        return JSONResponse({ "success": False, "message": "Invalid cursor" }, status_code=400)
+    except Exception as e:
+        print(e)
+        return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
+    
+NODE_COUNTERS = ("calls", "input_tokens", "output_tokens", "llm_ms", "cost_usd", "retries", "cache_hits", "cache_misses")
+
+def telemetry_stats_pipeline(user_id, since: datetime) -> list:
+    node_sums = {key: {"$sum": f"$nodes.v.{key}"} for key in NODE_COUNTERS}
+    return [
+        {"$match": {"user_id": user_id, "_id": {"$gte": ObjectId.from_datetime(since)}, "telemetry": {"$ne": None}}},
+        {"$facet": {
+            "totals": [{"$group": {
+                "_id": None,
+                "analyses": {"$sum": 1},
+                **{key: {"$sum": f"$telemetry.totals.{key}"} for key in NODE_COUNTERS},
+            }}],
+            "nodes": [
+                {"$project": {"nodes": {"$objectToArray": "$telemetry.nodes"}}},
+                {"$unwind": "$nodes"},
+                {"$group": {"_id": "$nodes.k", "analyses": {"$sum": 1}, **node_sums}},
+            ],
+            "phases": [
+                {"$project": {"phases": {"$objectToArray": "$telemetry.phases_ms"}}},
+                {"$unwind": "$phases"},
+                {"$group": {"_id": "$phases.k", "avg_ms": {"$avg": "$phases.v"}, "max_ms": {"$max": "$phases.v"}}},
+            ],
+        }},
+    ]
+
+def summarize_node_stats(node: dict, total_cost: float) -> dict:
+    lookups = node["cache_hits"] + node["cache_misses"]
+    return {
+        **{key: round(node[key], 6) if key == "cost_usd" else node[key] for key in ("analyses", *NODE_COUNTERS)},
+        "avg_llm_ms_per_call": round(node["llm_ms"] / node["calls"], 1) if node["calls"] else None,
+        "avg_tokens_per_analysis": round((node["input_tokens"] + node["output_tokens"]) / node["analyses"]),
+        "cache_hit_rate": round(node["cache_hits"] / lookups, 3) if lookups else None,
+        "cost_share": round(node["cost_usd"] / total_cost, 3) if total_cost else None,
+    }
+
+async def analysis_stats(current_user, days: int = 30):
+    try:
+        user_id = PydanticObjectId(current_user.get("_id"))
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        
+        facet = await Analysis.get_pymongo_collection().aggregate(
+            telemetry_stats_pipeline(user_id, since)
+        ).to_list(length=1)
+        totals = facet[0]["totals"][0] if facet and facet[0]["totals"] else None
+        
+        if totals is None:
+            return JSONResponse({ "success": True, "data": { "days": days, "analyses": 0, "nodes": {}, "phases": {} } }, status_code=200)
+        
+        analyses = totals["analyses"]
+        nodes = sorted(facet[0]["nodes"], key=lambda node: node["cost_usd"], reverse=True)
+        data = {
+            "days": days,
+            "analyses": analyses,
+            "totals": {key: round(totals[key], 6) if key == "cost_usd" else totals[key] for key in NODE_COUNTERS},
+            "per_analysis": {
+                "tokens": round((totals["input_tokens"] + totals["output_tokens"]) / analyses),
+                "cost_usd": round(totals["cost_usd"] / analyses, 6),
+                "llm_ms": round(totals["llm_ms"] / analyses, 1),
+                "calls": round(totals["calls"] / analyses, 2),
+            },
+            # Most expensive node first
+            "nodes": {node["_id"]: summarize_node_stats(node, totals["cost_usd"]) for node in nodes},
+            "phases": {phase["_id"]: {"avg_ms": round(phase["avg_ms"], 1), "max_ms": phase["max_ms"]} for phase in facet[0]["phases"]},
+        }
+        return JSONResponse({ "success": True, "data": data }, status_code=200)
+    except Exception as e:
+        print(e)
+        return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
+    
+async def get_report(current_user, id):
+    try:
+        analysis = await Analysis.find_one({ "_id": PydanticObjectId(id), "user_id": PydanticObjectId(current_user.get("_id")) })
+        
+        if analysis is None:
+            return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+        
+        return JSONResponse({ "success": True, "data": jsonable_encoder(analysis.decompress(), exclude={"compressed_fields", "input_texts"}) }, status_code=200)
+    except InvalidId:
+        return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
     except Exception as e:
         print(e)
         return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
@@ -124,9 +500,124 @@ async def delete_reports(current_user, id):
             print(delete_data)
             return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
         
+        search_index.invalidate(current_user.get("_id"))
         return JSONResponse({ "success": True, "message": "Report deleted successfully" })
     except Exception as e:
         print(e)
         return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
-    
-        
\ No newline at end of file
+
+async def find_user_analysis(current_user, analysis_id: str):
+    analysis = await Analysis.find_one({ "_id": PydanticObjectId(analysis_id), "user_id": PydanticObjectId(current_user.get("_id")) })
+    return analysis.decompress() if analysis else None
+
+async def search_resumes(current_user, jd: Optional[str] = None, analysis_id: Optional[str] = None, limit: int = 10, eligible_only: bool = False):
+    try:
+        # The JD of a stored analysis, or one read from the text with the skill taxonomy; never an LLM call
+        if analysis_id:
+            analysis = await find_user_analysis(current_user, analysis_id)
+            if analysis is None:
+                return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+            parsed_jd, jd = analysis.job_analysis, ""
+        elif jd and jd.strip():
+            parsed_jd = parse_jd_text(jd)
+        else:
+            return JSONResponse({ "success": False, "message": "Provide a job description or an analysis_id" }, status_code=400)
+        
+        with timed_phase("search"):
+            data = await search_index.rank_resumes(PydanticObjectId(current_user.get("_id")), parsed_jd, jd, limit, eligible_only)
+        return JSONResponse({ "success": True, "data": jsonable_encoder(data) }, status_code=200)
+    except InvalidId:
+        return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+    except Exception as e:
+        print(f"Resume search error: {e}")
+        return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
+
+async def search_jobs(current_user, resume: Optional[UploadFile] = None, analysis_id: Optional[str] = None, limit: int = 10, eligible_only: bool = False):
+    try:
+        if analysis_id:
+            analysis = await find_user_analysis(current_user, analysis_id)
+            if analysis is None:
+                return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+            parsed_resume = analysis.parsed_resume
+        elif resume is not None:
+            with timed_phase("upload_read"):
+                file_content = await resume.read()
+            resume_text = await extract_resume_text_async(resume.filename, file_content)
+            if resume_text is None:
+                return JSONResponse({ "success": False, "message": "Invalid file format. Accepts PDF/DOCX" }, status_code=400)
+            parsed_resume = parse_resume_text(resume_text)
+        else:
+            return JSONResponse({ "success": False, "message": "Provide a resume or an analysis_id" }, status_code=400)
+        
+        with timed_phase("search"):
+            data = await search_index.rank_jobs(PydanticObjectId(current_user.get("_id")), parsed_resume, limit, eligible_only)
+        return JSONResponse({ "success": True, "data": jsonable_encoder(data) }, status_code=200)
+    except InvalidId:
+        return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+    except ResumeTooLargeError as e:
+        return JSONResponse({ "success": False, "message": str(e) }, status_code=413)
+    except Exception as e:
+        print(f"Job search error: {e}")
+        return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
+
+# Outputs of the previous analysis that the re-analysis state starts from
+REANALYSIS_KEYS = ("parsed_resume", "parsed_jd", "match_analysis", "recommendations")
+
+async def reanalyze_resume(current_user, analyzer: JDResumeAnalyzer, id: str, resume: Optional[UploadFile] = None, jd: Optional[str] = None, job_title: Optional[str] = None, company: Optional[str] = None, refresh_recommendations: bool = False):
+    telemetry = start_telemetry()
+    try:
+        previous = await find_user_analysis(current_user, id)
+        if previous is None:
+            return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+        
+        resume_text = None
+        if resume is not None:
+            with timed_phase("upload_read"):
+                file_content = await resume.read()
+            resume_text = await extract_resume_text_async(resume.filename, file_content)
+            if resume_text is None:
+                return JSONResponse({ "success": False, "message": "Invalid file format. Accepts PDF/DOCX" }, status_code=400)
+        
+        state = create_reanalysis_state({
+            "parsed_resume": previous.parsed_resume,
+            "parsed_jd": previous.job_analysis,
+            "match_analysis": previous.match_analysis,
+            "recommendations": previous.recommendations,
+            "input_hashes": previous.input_hashes,
+            "input_texts": previous.input_texts,
+        }, resume_text, jd if jd and jd.strip() else None, refresh_recommendations)
+        reused = [key for key in REANALYSIS_KEYS if state[key]]
+        
+        try:
+            # Always the node graph: the fused call would redo every step
+            result = await analyzer.workflow.ainvoke(state)
+        except Exception as workflow_error:
+            print(f"Re-analysis workflow error: {workflow_error}")
+            message, status_code = workflow_error_details(workflow_error)
+            return JSONResponse({ "success": False, "message": message }, status_code=status_code)
+        
+        formatted_data, analysis = build_analysis(
+            current_user, result,
+            job_title or previous.job_title,
+            company if company is not None else previous.company,
+            telemetry, previous_analysis_id=previous.id,
+        )
+        with timed_phase("db_save"):
+            await analysis.save()
+        search_index.add(analysis)
+        
+        return JSONResponse({ "success": True, "data": jsonable_encoder({
+            **formatted_data,
+            "analysis_id": str(analysis.id),
+            "previous_analysis_id": str(previous.id),
+            "reused": reused,
+        }) }, status_code=200)
+    except InvalidId:
+        return JSONResponse({ "success": False, "message": "Report not found" }, status_code=404)
+    except MissingInputError as e:
+        return JSONResponse({ "success": False, "message": str(e) }, status_code=400)
+    except ResumeTooLargeError as e:
+        return JSONResponse({ "success": False, "message": str(e) }, status_code=413)
+    except Exception as e:
+        print(f"Re-analysis error: {e}")
+        return JSONResponse({ "success": False, "message": "Something went wrong" }, status_code=500)
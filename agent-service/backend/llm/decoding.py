@@ -0,0 +1,70 @@
+import logging
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+REPAIR_PROMPT = """
+        JSON REPAIR ASSISTANT
+
+        The response below was supposed to be a single JSON value matching the
+        requested response schema, but it could not be used: {error}
+
+        Return ONLY the corrected JSON. Keep every value that is already present,
+        do not add information, and do not wrap it in markdown.
+
+        Response to repair:
+        {response}
+"""
+
+
+class ResponseDecodeError(Exception):
+    def __init__(self, message: str, raw_response: str):
+        super().__init__(message)
+        self.raw_response = raw_response
+
+
+def strip_code_fences(text: str) -> str:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def decode_response(text: str, schema: type[BaseModel]):
+    data = orjson.loads(strip_code_fences(text or ""))
+    return schema.model_validate(data)
+
+
+async def generate_structured(gemini_client, prompt: str, text: str, schema: type[BaseModel], node: str = None) -> BaseModel:
+    """Asks for JSON matching ``schema`` and returns the validated model.
+
+    A response that is not valid JSON or does not fit the schema gets one
+    repair call; if that fails too, ResponseDecodeError carries the last raw
+    response. Gemini API errors propagate unchanged.
+    """
+    response = await gemini_client.analyze_text_async(prompt, text, response_schema=schema, node=node)
+    try:
+        return decode_response(response, schema)
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        error = _describe(e)
+        logger.warning(f"{schema.__name__} response could not be decoded ({error}), asking for a repair")
+
+    repair_prompt = REPAIR_PROMPT.format(error=error, response=response)
+    repaired = await gemini_client.analyze_text_async(repair_prompt, "", response_schema=schema, node=node)
+    try:
+        return decode_response(repaired, schema)
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        raise ResponseDecodeError(f"{schema.__name__} response invalid after repair: {_describe(e)}", repaired)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'value'}: {item['msg']}"
+            for item in error.errors()[:5]
+        )
+    return str(error)
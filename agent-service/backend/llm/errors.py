@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+from google.genai import errors as genai_errors
+
+
+# Typed Gemini failures. The code prefixes the message because callers (the
+# controller's WORKFLOW_ERRORS table, job error payloads) match on str(error).
+class GeminiError(Exception):
+    code = "GEMINI_API_ERROR"
+    retryable = False
+
+    def __init__(self, message: str):
+        super().__init__(f"{self.code}: {message}")
+
+
+class GeminiUnavailableError(GeminiError):
+    code = "GEMINI_503_UNAVAILABLE"
+    retryable = True
+
+
+class GeminiQuotaError(GeminiError):
+    code = "GEMINI_QUOTA_EXCEEDED"
+    retryable = True
+
+
+class GeminiNetworkError(GeminiError):
+    code = "GEMINI_NETWORK_ERROR"
+    retryable = True
+
+
+# The local rate limiter could not admit the call before its deadline. Not
+# retried: waiting longer is exactly what the deadline ruled out.
+class GeminiRateLimitTimeout(GeminiQuotaError):
+    retryable = False
+
+
+# Raised without calling the API while the circuit breaker is open
+class GeminiCircuitOpenError(GeminiUnavailableError):
+    retryable = False
+
+
+def classify_error(error: Exception) -> GeminiError:
+    if isinstance(error, GeminiError):
+        return error
+    if isinstance(error, genai_errors.APIError):
+        if error.code == 429:
+            return GeminiQuotaError(str(error))
+        if error.code in (500, 502, 503, 504) or isinstance(error, genai_errors.ServerError):
+            return GeminiUnavailableError(str(error))
+        return GeminiError(str(error))
+    if isinstance(error, (httpx.TransportError, asyncio.TimeoutError, ConnectionError)):
+        return GeminiNetworkError(str(error) or type(error).__name__)
+    return GeminiError(str(error))
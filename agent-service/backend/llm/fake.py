@@ -0,0 +1,166 @@
+import asyncio
+import json
+import random
+import time
+
+from backend.llm.errors import GeminiError, GeminiNetworkError, GeminiQuotaError, GeminiUnavailableError
+from backend.utils.prompt_compactor import estimate_tokens
+from backend.utils.telemetry import record_llm_call
+
+# Canned responses keyed by the heading each agent prompt starts with
+DEFAULT_RESPONSES = {
+    "RESUME PARSING ASSISTANT": {
+        "personal_details": {
+            "name": "Jane Doe",
+            "contact_info": {"email": "jane@example.com", "phone": "", "linkedin": ""}
+        },
+        "skills": {
+            "languages": ["Python", "JavaScript"],
+            "frontend": ["React"],
+            "backend": ["FastAPI", "Node.js"],
+            "ai_ml": [],
+            "databases": ["MongoDB", "PostgreSQL"],
+            "tools_devops": ["Docker", "Git"],
+            "concepts": ["REST APIs"]
+        },
+        "education": [{"degree": "Bachelor of Technology", "major": "Computer Science", "institution": "State University", "years": "2016-2020", "cgpa": ""}],
+        "work_experience": [{"role": "Software Engineer", "company": "Acme", "duration": "2020 - 2024", "achievements": ["Built APIs"]}],
+        "certifications_and_projects": {"projects": [], "certifications": []}
+    },
+    "JOB DESCRIPTION ANALYSIS ASSISTANT": {
+        "job_title": "Backend Engineer",
+        "required_skills": {"must_have": ["Python", "FastAPI", "MongoDB"], "nice_to_have": ["Docker", "Kubernetes"]},
+        "experience_level_required": "Mid-level (3+ years)",
+        "educational_requirements": "Bachelor's degree in Computer Science",
+        "key_responsibilities": ["Build backend services"],
+        "industry_specific_keywords": ["microservices"],
+        "soft_skills_mentioned": ["communication", "teamwork"],
+        "employment_type": "Full-time",
+        "company_size_indicators": "Not specified"
+    },
+    "RESUME MATCH EXPLANATION ASSISTANT": {
+        "skills": "Python, FastAPI and MongoDB are all present; Kubernetes is missing",
+        "experience": "About four years of backend work meets the 3+ year requirement",
+        "education": "Computer Science bachelor's degree matches the requirement",
+        "soft_skills": "Teamwork is evidenced; communication is not"
+    },
+    "RESUME IMPROVEMENT RECOMMENDATIONS ASSISTANT": [
+        "Add Kubernetes deployment experience to tools section",
+        "Quantify API performance improvements with metrics",
+        "Highlight communication skills with concrete examples"
+    ]
+}
+
+# The fused pipeline's single call answers with all of the above at once
+DEFAULT_RESPONSES["COMBINED SCREENING ASSISTANT"] = {
+    "parsed_resume": DEFAULT_RESPONSES["RESUME PARSING ASSISTANT"],
+    "parsed_jd": DEFAULT_RESPONSES["JOB DESCRIPTION ANALYSIS ASSISTANT"],
+    "match_explanation": DEFAULT_RESPONSES["RESUME MATCH EXPLANATION ASSISTANT"],
+    "recommendations": DEFAULT_RESPONSES["RESUME IMPROVEMENT RECOMMENDATIONS ASSISTANT"]
+}
+
+
+# Offline stand-in for GeminiClient: answers each prompt with a canned response
+# after a delay of latency seconds, varied by up to +/- jitter (a fraction of
+# latency) from a seeded generator so runs are repeatable. Used by the
+# benchmarks and load tests.
+class FakeGeminiClient:
+    def __init__(self, latency: float = 0.5, responses: dict = None, jitter: float = 0.0, seed: int = 0):
+        self.model = "fake-gemini"
+        self.latency = latency
+        self.responses = responses or DEFAULT_RESPONSES
+        self.jitter = jitter
+        self.calls = 0
+        self._latency_random = random.Random(seed)
+
+    @classmethod
+    def from_recording(cls, path: str, **kwargs) -> "FakeGeminiClient":
+        # Responses saved by RecordingGeminiClient; headings missing from the file keep the defaults
+        with open(path) as recording:
+            return cls(responses={**DEFAULT_RESPONSES, **json.load(recording)}, **kwargs)
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency * (1 + self._latency_random.uniform(-self.jitter, self.jitter)))
+
+    def _respond(self, prompt: str, text: str = "", node: str = None, seconds: float = 0.0) -> str:
+        self.calls += 1
+        for heading, response in self.responses.items():
+            if heading in prompt:
+                response = response if isinstance(response, str) else json.dumps(response)
+                # No usage metadata here, so telemetry gets the local estimate
+                record_llm_call(node, estimate_tokens(prompt + text), estimate_tokens(response), seconds, estimated=True)
+                return response
+        raise GeminiError("no fake response for prompt")
+
+    def analyze_text(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        delay = self._delay()
+        time.sleep(delay)
+        return self._respond(prompt, text, node, delay)
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        delay = self._delay()
+        await asyncio.sleep(delay)
+        return self._respond(prompt, text, node, delay)
+
+    async def aclose(self):
+        pass
+
+
+# Wraps a real client and keeps the last raw response per prompt heading, so a
+# live run can be saved and replayed offline with FakeGeminiClient.from_recording
+class RecordingGeminiClient:
+    def __init__(self, client):
+        self.client = client
+        self.model = client.model
+        self.recorded = {}
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        response = await self.client.analyze_text_async(prompt, text, response_schema=response_schema, node=node)
+        heading = next((heading for heading in DEFAULT_RESPONSES if heading in prompt), None)
+        if heading:
+            self.recorded[heading] = response
+        return response
+
+    def save(self, path: str):
+        with open(path, "w") as recording:
+            json.dump(self.recorded, recording, indent=2)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+FAULTS = {
+    "unavailable": GeminiUnavailableError,
+    "quota": GeminiQuotaError,
+    "network": GeminiNetworkError,
+}
+
+
+# Fault-injecting fake for exercising retries, hedging and the circuit breaker.
+# Each call independently fails with probability failure_rate (one of the
+# given fault kinds) or, if it succeeds, takes slow_latency instead of latency
+# with probability slow_rate. Setting down=True fails every call.
+class FaultyGeminiClient(FakeGeminiClient):
+    def __init__(self, latency: float = 0.05, failure_rate: float = 0.2, faults: tuple = ("unavailable", "quota", "network"),
+                 slow_rate: float = 0.0, slow_latency: float = 2.0, seed: int = None, responses: dict = None):
+        super().__init__(latency=latency, responses=responses)
+        self.failure_rate = failure_rate
+        self.faults = faults
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.down = False
+        self.failures = 0
+        self._random = random.Random(seed)
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        if self.down or self._random.random() < self.failure_rate:
+            await asyncio.sleep(self.latency)
+            self.calls += 1
+            self.failures += 1
+            raise FAULTS[self._random.choice(self.faults)]("injected fault")
+        slow = self._random.random() < self.slow_rate
+        delay = self.slow_latency if slow else self.latency
+        await asyncio.sleep(delay)
+        return self._respond(prompt, text, node, delay)
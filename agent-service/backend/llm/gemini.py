@@ -1,41 +1,121 @@
 from google import genai
 from google.genai import types
+import httpx
 import os
+import time
 from dotenv import load_dotenv
 import logging
 
+from backend.config.main import GEMINI_KEEPALIVE_EXPIRY, GEMINI_MAX_CONNECTIONS, GEMINI_MAX_KEEPALIVE_CONNECTIONS, GEMINI_OUTPUT_TOKEN_RESERVE
+from backend.llm.errors import GeminiError, classify_error
+from backend.llm.rate_limiter import TokenBucketLimiter
+from backend.utils.prompt_compactor import estimate_tokens
+from backend.utils.telemetry import record_llm_call
+
 load_dotenv("local.env")
 logger = logging.getLogger(__name__)
 
 class GeminiClient:
-    def __init__(self):
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-    
-    def analyze_text(self, prompt: str, text: str) -> str:
+    def __init__(self, max_connections: int = GEMINI_MAX_CONNECTIONS, max_keepalive_connections: int = GEMINI_MAX_KEEPALIVE_CONNECTIONS, keepalive_expiry: float = GEMINI_KEEPALIVE_EXPIRY, rate_limiter: TokenBucketLimiter = None):
+        # One keep-alive connection pool per client; the client is meant to live for the whole process
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.client = genai.Client(
+            api_key=os.getenv("GEMINI_API_KEY"),
+            http_options=types.HttpOptions(client_args={"limits": limits}, async_client_args={"limits": limits})
+        )
+        self.model = "gemini-2.5-flash"
+        self.generation_config = types.GenerateContentConfig(
+            thinking_config=types.ThinkingConfig(thinking_budget=0),
+            temperature=0.1,
+            max_output_tokens=4096
+        )
+        self.rate_limiter = rate_limiter or TokenBucketLimiter()
+
+    def _build_prompt(self, prompt: str, text: str) -> str:
+        full_prompt = f"{prompt}\n\nText to analyze:\n{text}" if text else prompt
+        print(f"Sending to Gemini - Prompt length: {len(full_prompt)}")
+        return full_prompt
+
+    def _token_estimate(self, full_prompt: str) -> int:
+        return estimate_tokens(full_prompt) + GEMINI_OUTPUT_TOKEN_RESERVE
+
+    @staticmethod
+    def _used_tokens(response) -> int:
+        usage = getattr(response, "usage_metadata", None)
+        return (usage.total_token_count or 0) if usage is not None else 0
+
+    def _read_response(self, response, full_prompt: str = "", node: str = None, started: float = None) -> str:
+        usage = getattr(response, "usage_metadata", None)
+
+        # Billed token counts when Gemini reports them, otherwise the local estimate
+        text = getattr(response, "text", None) or ""
+        input_tokens = getattr(usage, "prompt_token_count", None)
+        output_tokens = getattr(usage, "candidates_token_count", None)
+        record_llm_call(
+            node,
+            input_tokens if input_tokens is not None else estimate_tokens(full_prompt),
+            output_tokens if output_tokens is not None else estimate_tokens(text),
+            time.perf_counter() - started if started else 0.0,
+            estimated=input_tokens is None or output_tokens is None
+        )
+
+        if not response or not response.text:
+            raise GeminiError("Empty response from Gemini API")
+
+        logger.info(f"Gemini response length: {len(response.text)}")
+        result = response.text
+        print(f"Gemini response length: {len(result)}")
+
+        return result
+
+    def _config(self, response_schema=None):
+        if response_schema is None:
+            return self.generation_config
+        # JSON mode: Gemini constrains decoding to the schema, so no fences or prose
+        return self.generation_config.model_copy(update={
+            "response_mime_type": "application/json",
+            "response_schema": response_schema
+        })
+
+    def analyze_text(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        full_prompt = self._build_prompt(prompt, text)
+        reserved = self.rate_limiter.acquire_sync(self._token_estimate(full_prompt))
         try:
-            full_prompt = f"{prompt}\n\nText to analyze:\n{text}" if text else prompt
-            
-            print(f"Sending to Gemini - Prompt length: {len(full_prompt)}")
-            
+            started = time.perf_counter()
             response = self.client.models.generate_content(
-                model="gemini-2.5-flash",
+                model=self.model,
+                contents=full_prompt,
+                config=self._config(response_schema)
+            )
+            self.rate_limiter.record_usage(reserved, self._used_tokens(response))
+            return self._read_response(response, full_prompt, node, started)
+
+        except Exception as e:
+            print(f"Gemini API error: {e}")
+            raise classify_error(e) from e
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        full_prompt = self._build_prompt(prompt, text)
+        # Queues (up to the limiter's deadline) instead of bursting past the shared quota
+        reserved = await self.rate_limiter.acquire(self._token_estimate(full_prompt))
+        try:
+            started = time.perf_counter()
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
                 contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    thinking_config=types.ThinkingConfig(thinking_budget=0),
-                    temperature=0.1, 
-                    max_output_tokens=4096
-                )
+                config=self._config(response_schema)
             )
-            
-            if not response or not response.text:
-                raise Exception("Empty response from Gemini API")
-            
-            logger.info(f"Gemini response length: {len(response.text)}")
-            result = response.text
-            print(f"Gemini response length: {len(result)}")
-            
-            return result
-            
+            await self.rate_limiter.record_usage_async(reserved, self._used_tokens(response))
+            return self._read_response(response, full_prompt, node, started)
+
         except Exception as e:
             print(f"Gemini API error: {e}")
-            raise Exception(f"GEMINI_API_ERROR: {e}")
+            raise classify_error(e) from e
+
+    async def aclose(self):
+        await self.client.aio.aclose()
+        self.client.close()
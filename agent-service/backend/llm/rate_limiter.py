@@ -0,0 +1,148 @@
+import asyncio
+import os
+import random
+import struct
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # No flock on Windows: the buckets are then only shared between threads of one process
+    fcntl = None
+
+from backend.config.main import (
+    GEMINI_RATE_LIMIT_MAX_WAIT,
+    GEMINI_RATE_LIMIT_STATE_PATH,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_TOKENS_PER_MINUTE,
+)
+from backend.llm.errors import GeminiRateLimitTimeout
+from backend.utils.metrics import gemini_rate_limit_wait_seconds
+
+# requests level, tokens level, last refill (wall clock, shared by all processes)
+STATE = struct.Struct("ddd")
+
+
+# Two token buckets (requests/min and tokens/min) kept in a small state file.
+# Every uvicorn worker on the host opens the same file and takes an exclusive
+# flock around each read-refill-write, so together they stay under the quota.
+# Each bucket holds one minute of budget, matching the provider's window.
+# The async methods run that locked update in a thread, so a worker waiting on
+# another's lock never stalls its event loop.
+class TokenBucketLimiter:
+    def __init__(
+        self,
+        requests_per_minute: int = GEMINI_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = GEMINI_TOKENS_PER_MINUTE,
+        state_path: str = GEMINI_RATE_LIMIT_STATE_PATH,
+        max_wait: float = GEMINI_RATE_LIMIT_MAX_WAIT,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.state_path = state_path or os.path.join(tempfile.gettempdir(), "jd-analyzer-gemini-limiter.bin")
+        self.max_wait = max_wait
+        self._fd = None
+        self._pid = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    def _file(self) -> int:
+        # Reopen after fork so processes do not share one file offset/lock
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def _update(self, requests: float, tokens: float, commit_partial: bool = False) -> float:
+        """Refills both buckets and takes ``requests``/``tokens`` if both can pay.
+
+        Returns 0 when taken, otherwise the seconds until they could be. With
+        commit_partial the amounts are taken unconditionally (usage correction).
+        """
+        with self._thread_lock:
+            fd = self._file()
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = os.pread(fd, STATE.size, 0)
+                if len(raw) == STATE.size:
+                    request_level, token_level, updated = STATE.unpack(raw)
+                else:
+                    request_level, token_level, updated = self.requests_per_minute, self.tokens_per_minute, now
+
+                elapsed = max(0.0, now - updated)
+                request_level = min(self.requests_per_minute, request_level + elapsed * self.requests_per_minute / 60)
+                token_level = min(self.tokens_per_minute, token_level + elapsed * self.tokens_per_minute / 60)
+
+                wait = 0.0
+                if not commit_partial:
+                    if self.requests_per_minute > 0 and request_level < requests:
+                        wait = max(wait, (requests - request_level) * 60 / self.requests_per_minute)
+                    if self.tokens_per_minute > 0 and token_level < tokens:
+                        wait = max(wait, (tokens - token_level) * 60 / self.tokens_per_minute)
+                if wait == 0.0:
+                    request_level -= requests
+                    token_level -= tokens
+
+                os.pwrite(fd, STATE.pack(request_level, token_level, now), 0)
+                return wait
+            finally:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _request_cost(self, tokens: int) -> tuple:
+        # A request larger than the whole minute budget could never be admitted
+        if self.tokens_per_minute > 0:
+            tokens = min(tokens, self.tokens_per_minute)
+        return (1 if self.requests_per_minute > 0 else 0), (tokens if self.tokens_per_minute > 0 else 0)
+
+    async def acquire(self, tokens: int, max_wait: float = None) -> int:
+        if not self.enabled:
+            return 0
+        requests, tokens = self._request_cost(tokens)
+        max_wait = self.max_wait if max_wait is None else max_wait
+        started = time.monotonic()
+        deadline = started + max_wait
+        while True:
+            wait = await asyncio.to_thread(self._update, requests, tokens)
+            if wait == 0.0:
+                gemini_rate_limit_wait_seconds.observe(time.monotonic() - started)
+                return tokens
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                gemini_rate_limit_wait_seconds.observe(time.monotonic() - started)
+                raise GeminiRateLimitTimeout(f"local rate limit would need {wait:.1f}s, more than the {max_wait:.0f}s deadline")
+            # Jitter so waiters in all workers do not retry in lockstep
+            await asyncio.sleep(wait + random.uniform(0, min(0.05, wait)))
+
+    def acquire_sync(self, tokens: int, max_wait: float = None) -> int:
+        if not self.enabled:
+            return 0
+        requests, tokens = self._request_cost(tokens)
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self._update(requests, tokens)
+            if wait == 0.0:
+                return tokens
+            if wait > deadline - time.monotonic():
+                raise GeminiRateLimitTimeout(f"local rate limit would need {wait:.1f}s, more than the {max_wait:.0f}s deadline")
+            time.sleep(wait + random.uniform(0, min(0.05, wait)))
+
+    def _needs_settling(self, reserved_tokens: int, used_tokens: int) -> bool:
+        return self.tokens_per_minute > 0 and bool(reserved_tokens) and bool(used_tokens) and used_tokens != reserved_tokens
+
+    def record_usage(self, reserved_tokens: int, used_tokens: int):
+        # Settle the estimate against the token count Gemini reports
+        if self._needs_settling(reserved_tokens, used_tokens):
+            self._update(0, used_tokens - reserved_tokens, commit_partial=True)
+
+    async def record_usage_async(self, reserved_tokens: int, used_tokens: int):
+        if self._needs_settling(reserved_tokens, used_tokens):
+            await asyncio.to_thread(self._update, 0, used_tokens - reserved_tokens, True)
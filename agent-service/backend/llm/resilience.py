@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+
+from backend.config.main import (
+    GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+    GEMINI_CIRCUIT_RESET_SECONDS,
+    GEMINI_HEDGE_ENABLED,
+    GEMINI_HEDGE_MIN_SAMPLES,
+    GEMINI_MAX_ATTEMPTS,
+    GEMINI_NODE_ATTEMPTS,
+    GEMINI_RETRY_BASE_DELAY,
+    GEMINI_RETRY_MAX_DELAY,
+)
+from backend.llm.errors import GeminiCircuitOpenError, GeminiError
+from backend.utils.metrics import gemini_circuit_transitions_total, gemini_hedged_requests_total, gemini_retries_total
+from backend.utils.telemetry import record_retry
+
+logger = logging.getLogger(__name__)
+
+
+def parse_node_attempts(value: str) -> dict:
+    attempts = {}
+    for item in (value or "").split(","):
+        if ":" in item:
+            node, count = item.split(":", 1)
+            attempts[node.strip()] = max(1, int(count))
+    return attempts
+
+
+# Consecutive provider failures open the circuit; while open, calls fail fast
+# with GeminiCircuitOpenError. After reset_timeout one trial call is let
+# through (half-open): success closes the circuit, failure opens it again.
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = GEMINI_CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = GEMINI_CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def _transition(self, state: str):
+        if state != self.state:
+            logger.warning(f"Gemini circuit {self.state} -> {state}")
+            gemini_circuit_transitions_total.inc(state=state)
+            self.state = state
+
+    # Returns True when this call is the half-open trial; the caller must then
+    # release_trial() however the call ends, cancellation included
+    def before_call(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise GeminiCircuitOpenError("circuit open after repeated provider failures")
+            self._transition("half_open")
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                raise GeminiCircuitOpenError("circuit half-open, trial request in flight")
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self):
+        self._trial_in_flight = False
+
+    def record_success(self):
+        self._trial_in_flight = False
+        self.failures = 0
+        self._transition("closed")
+
+    def record_failure(self, error: GeminiError):
+        self._trial_in_flight = False
+        # Only provider-side failures count; a bad request says nothing about availability
+        if not error.retryable:
+            if self.state == "half_open":
+                self._transition("closed")
+            return
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition("open")
+
+
+# Wraps a Gemini client (real or fake) with jittered exponential retry,
+# per-node attempt budgets, optional hedging and a circuit breaker. The
+# wrapped client must raise GeminiError subclasses for failures to be retried.
+class ResilientGeminiClient:
+    def __init__(
+        self,
+        client,
+        max_attempts: int = GEMINI_MAX_ATTEMPTS,
+        node_attempts: dict = None,
+        base_delay: float = GEMINI_RETRY_BASE_DELAY,
+        max_delay: float = GEMINI_RETRY_MAX_DELAY,
+        hedge: bool = GEMINI_HEDGE_ENABLED,
+        hedge_min_samples: int = GEMINI_HEDGE_MIN_SAMPLES,
+        breaker: CircuitBreaker = None,
+    ):
+        self.client = client
+        self.model = client.model
+        self.max_attempts = max_attempts
+        self.node_attempts = parse_node_attempts(GEMINI_NODE_ATTEMPTS) if node_attempts is None else node_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.breaker = breaker or CircuitBreaker()
+        self._latencies = deque(maxlen=500)
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    def attempts_for(self, node: str = None) -> int:
+        return self.node_attempts.get(node, self.max_attempts)
+
+    def backoff_delay(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, min(cap, base * 2^(attempt - 1))]
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def hedge_delay(self):
+        if not self.hedge or len(self._latencies) < self.hedge_min_samples:
+            return None
+        samples = sorted(self._latencies)
+        return samples[int(len(samples) * 0.95) - 1]
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        attempts = self.attempts_for(node)
+        for attempt in range(1, attempts + 1):
+            trial = self.breaker.before_call()
+            started = time.perf_counter()
+            try:
+                result = await self._call(prompt, text, response_schema, node)
+            except GeminiError as e:
+                self.breaker.record_failure(e)
+                if not e.retryable or attempt == attempts or self.breaker.state == "open":
+                    raise
+                delay = self.backoff_delay(attempt)
+                gemini_retries_total.inc(node=node or "unknown", code=e.code)
+                record_retry(node)
+                logger.warning(f"Gemini call for {node or 'unknown'} failed ({e.code}), retry {attempt}/{attempts - 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                self._latencies.append(time.perf_counter() - started)
+                return result
+            finally:
+                if trial:
+                    self.breaker.release_trial()
+
+    async def _call(self, prompt: str, text: str, response_schema, node: str) -> str:
+        hedge_after = self.hedge_delay()
+        if hedge_after is None:
+            return await self.client.analyze_text_async(prompt, text, response_schema=response_schema, node=node)
+
+        primary = asyncio.ensure_future(self.client.analyze_text_async(prompt, text, response_schema=response_schema, node=node))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if done:
+                return primary.result()
+
+            # The primary is slower than p95: race a second request against it
+            hedge = asyncio.ensure_future(self.client.analyze_text_async(prompt, text, response_schema=response_schema, node=node))
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        gemini_hedged_requests_total.inc(winner="hedge" if task is hedge else "primary")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,123 @@
+import typing
+
+from pydantic import BaseModel, ConfigDict, Field, RootModel, model_validator
+
+
+# Response models for the agent prompts. They are sent to Gemini as the
+# response schema and validate what comes back. Validation is lenient about
+# shape: a missing or null field takes its default, and a bare string where a
+# list is expected becomes a one-item list.
+class LenientModel(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_defaults(cls, data):
+        if not isinstance(data, dict):
+            return data
+        cleaned = {}
+        for name, value in data.items():
+            if value is None:
+                continue
+            field = cls.model_fields.get(name)
+            if field is not None and typing.get_origin(field.annotation) is list and isinstance(value, str):
+                value = [value] if value.strip() else []
+            cleaned[name] = value
+        return cleaned
+
+
+class ContactInfo(LenientModel):
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+
+
+class PersonalDetails(LenientModel):
+    name: str = ""
+    contact_info: ContactInfo = Field(default_factory=ContactInfo)
+
+
+class ResumeSkills(LenientModel):
+    languages: list[str] = []
+    frontend: list[str] = []
+    backend: list[str] = []
+    ai_ml: list[str] = []
+    databases: list[str] = []
+    tools_devops: list[str] = []
+    concepts: list[str] = []
+
+
+class Education(LenientModel):
+    degree: str = ""
+    major: str = ""
+    institution: str = ""
+    years: str = ""
+    cgpa: str = ""
+
+
+class WorkExperience(LenientModel):
+    role: str = ""
+    company: str = ""
+    duration: str = ""
+    achievements: list[str] = []
+
+
+class Project(LenientModel):
+    name: str = ""
+    duration: str = ""
+    technologies: list[str] = []
+    description: str = ""
+    achievements: list[str] = []
+
+
+class Certification(LenientModel):
+    issuer: str = ""
+    courses: list[str] = []
+
+
+class CertificationsAndProjects(LenientModel):
+    projects: list[Project] = []
+    certifications: list[Certification] = []
+
+
+class ParsedResume(LenientModel):
+    personal_details: PersonalDetails = Field(default_factory=PersonalDetails)
+    skills: ResumeSkills = Field(default_factory=ResumeSkills)
+    education: list[Education] = []
+    work_experience: list[WorkExperience] = []
+    certifications_and_projects: CertificationsAndProjects = Field(default_factory=CertificationsAndProjects)
+
+
+class RequiredSkills(LenientModel):
+    must_have: list[str] = []
+    nice_to_have: list[str] = []
+
+
+class ParsedJobDescription(LenientModel):
+    job_title: str = "Not specified"
+    required_skills: RequiredSkills = Field(default_factory=RequiredSkills)
+    experience_level_required: str = "Not specified"
+    educational_requirements: str = "Not specified"
+    key_responsibilities: list[str] = []
+    industry_specific_keywords: list[str] = []
+    soft_skills_mentioned: list[str] = []
+    employment_type: str = "Not specified"
+    company_size_indicators: str = "Not specified"
+
+
+class MatchExplanation(LenientModel):
+    skills: str = ""
+    experience: str = ""
+    education: str = ""
+    soft_skills: str = ""
+
+
+class Recommendations(RootModel[list[str]]):
+    pass
+
+
+class FusedAnalysis(LenientModel):
+    parsed_resume: ParsedResume = Field(default_factory=ParsedResume)
+    parsed_jd: ParsedJobDescription = Field(default_factory=ParsedJobDescription)
+    match_explanation: MatchExplanation = Field(default_factory=MatchExplanation)
+    recommendations: list[str] = []
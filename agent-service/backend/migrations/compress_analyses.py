@@ -0,0 +1,84 @@
+"""Converts stored Analysis documents to (or back from) compressed heavy fields.
+
+Walks the collection in _id order, ``--batch-size`` documents at a time, and
+rewrites each batch with one bulk write. Documents already in the target
+format are skipped, so an interrupted run can simply be started again.
+Compressed documents keep ``list_view`` (candidate name, match summary) in
+plain fields; documents compressed before that was kept get it back from a
+``--decompress`` run followed by a normal one.
+
+    python -m backend.migrations.compress_analyses --batch-size 500
+    python -m backend.migrations.compress_analyses --decompress
+    python -m backend.migrations.compress_analyses --dry-run
+"""
+import argparse
+import asyncio
+import time
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from backend.config.main import ANALYSIS_COMPRESSION_LEVEL, MONGO_URI
+from backend.models.Analysis import HEAVY_FIELDS, Analysis, list_view
+from backend.utils.compression import compress_json, decompress_json
+
+
+def compress_update(document: dict, level: int) -> UpdateOne:
+    fields = {field: document.get(field) or {} for field in HEAVY_FIELDS}
+    return UpdateOne(
+        {"_id": document["_id"], "compressed_fields": None},
+        {"$set": {"compressed_fields": Binary(compress_json(fields, level)), **list_view(fields)}},
+    )
+
+
+def decompress_update(document: dict) -> UpdateOne:
+    return UpdateOne(
+        {"_id": document["_id"], "compressed_fields": {"$ne": None}},
+        {"$set": {**decompress_json(document["compressed_fields"]), "compressed_fields": None}},
+    )
+
+
+async def migrate(collection, batch_size: int, decompress: bool = False, dry_run: bool = False, level: int = ANALYSIS_COMPRESSION_LEVEL) -> dict:
+    pending = {"compressed_fields": {"$ne": None}} if decompress else {"compressed_fields": None}
+    projection = {"compressed_fields": 1} if decompress else {field: 1 for field in HEAVY_FIELDS}
+    stats = {"documents": 0, "modified": 0, "batches": 0}
+    last_id = None
+    started = time.perf_counter()
+
+    while True:
+        query = {**pending, "_id": {"$gt": last_id}} if last_id is not None else pending
+        batch = await collection.find(query, projection).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not batch:
+            break
+        last_id = batch[-1]["_id"]
+
+        updates = [decompress_update(document) if decompress else compress_update(document, level) for document in batch]
+        if not dry_run:
+            result = await collection.bulk_write(updates, ordered=False)
+            stats["modified"] += result.modified_count
+        stats["documents"] += len(batch)
+        stats["batches"] += 1
+        print(f"batch {stats['batches']}: {stats['documents']} documents processed")
+
+    stats["elapsed_s"] = round(time.perf_counter() - started, 2)
+    return stats
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--decompress", action="store_true", help="expand compressed documents back to plain fields")
+    parser.add_argument("--dry-run", action="store_true", help="read and convert without writing")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(MONGO_URI)
+    collection = client["jd-analyzer"][Analysis.Settings.name]
+    try:
+        print(await migrate(collection, args.batch_size, decompress=args.decompress, dry_run=args.dry_run))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
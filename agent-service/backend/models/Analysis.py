@@ -1,8 +1,28 @@
 from beanie import Document, PydanticObjectId
 from datetime import datetime
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from typing import Dict, List, Any, Optional, Union
 
+from backend.utils.compression import compress_json, decompress_json
+
+# Large nested fields that ANALYSIS_COMPRESSION stores as one zstd blob
+HEAVY_FIELDS = ("parsed_resume", "job_analysis", "match_analysis", "input_texts")
+# Match analysis keys that list views (the past reports cards) render
+LIST_MATCH_KEYS = ("overall_match_percentage", "skill_match", "experience_level", "education_alignment")
+
+
+def list_view(fields: dict) -> dict:
+    """What compression leaves of HEAVY_FIELDS outside the blob: the parts list views render."""
+    personal_details = (fields.get("parsed_resume") or {}).get("personal_details") or {}
+    match_analysis = fields.get("match_analysis") or {}
+    return {
+        "parsed_resume": {"personal_details": {"name": personal_details.get("name") or ""}},
+        "job_analysis": {},
+        "match_analysis": {key: match_analysis[key] for key in LIST_MATCH_KEYS if key in match_analysis},
+        "input_texts": {},
+    }
+
 
 class Analysis(Document):
     user_id: PydanticObjectId
@@ -13,9 +33,52 @@ class Analysis(Document):
     parsed_resume: Dict[str, Any] = Field(default_factory=dict) 
     job_analysis: Dict[str, Any] = Field(default_factory=dict)
     recommendations: List[str] = Field(default_factory=list)
+    # When set, HEAVY_FIELDS are stored here compressed and reduced to their list_view above
+    compressed_fields: Optional[bytes] = None
+    # Per-node Gemini tokens, cost, latency, retries and cache hits (AnalysisTelemetry.summary())
+    telemetry: Optional[Dict[str, Any]] = None
+    # Digests of the normalized resume/JD text; a re-analysis reuses the parse of an unchanged input
+    input_hashes: Optional[Dict[str, Optional[str]]] = None
+    # The normalized resume/JD text itself, only with REANALYSIS_STORE_INPUTS, so a
+    # re-analysis scores an omitted input on the same text
+    input_texts: Dict[str, str] = Field(default_factory=dict)
+    # Set on re-analyses to the analysis they were derived from
+    previous_analysis_id: Optional[PydanticObjectId] = None
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    def compress(self, level: int = 3) -> "Analysis":
+        if self.compressed_fields is None:
+            fields = {field: getattr(self, field) for field in HEAVY_FIELDS}
+            self.compressed_fields = compress_json(fields, level)
+            for field, value in list_view(fields).items():
+                setattr(self, field, value)
+        return self
+
+    def decompress(self) -> "Analysis":
+        if self.compressed_fields is not None:
+            for field, value in decompress_json(self.compressed_fields).items():
+                setattr(self, field, value)
+            self.compressed_fields = None
+        return self
+
     class Settings:
-        name = "Analysis"
\ No newline at end of file
+        name = "Analysis"
+        # Serves the per-user listing newest first, and covers its count
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("_id", DESCENDING)], name="user_id_id_desc")
+        ]
+
+
+# Fields returned by list views (view=summary)
+SUMMARY_PROJECTION = {
+    "_id": 1,
+    "user_id": 1,
+    "company": 1,
+    "job_title": 1,
+    "match_percentage": 1,
+    "parsed_resume.personal_details.name": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
\ No newline at end of file
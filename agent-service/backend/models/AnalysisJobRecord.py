@@ -0,0 +1,27 @@
+from beanie import Document, Indexed
+from datetime import datetime
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+from typing import Dict, List, Any, Optional
+
+
+# Status of a background analysis job, written by the worker process running it
+# so that GET /jobs/{id} and its events can be served by any worker
+class AnalysisJobRecord(Document):
+    job_id: Indexed(str, unique=True)
+    user_id: str
+    status: str = "queued"
+    progress: List[str] = Field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[float] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # Pushed forward on every write; a job whose worker died expires like a finished one
+    expires_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "AnalysisJob"
+        indexes = [
+            IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0)
+        ]
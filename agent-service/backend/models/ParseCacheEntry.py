@@ -0,0 +1,17 @@
+from beanie import Document, Indexed
+from datetime import datetime
+from pydantic import Field
+from typing import Dict, Any
+
+
+class ParseCacheEntry(Document):
+    key: Indexed(str, unique=True)
+    kind: str
+    prompt_version: str
+    model: str
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "ParseCache"
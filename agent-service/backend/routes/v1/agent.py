@@ -1,22 +1,92 @@
 from fastapi import APIRouter, Request , Depends, Form, Query, params
 from fastapi import UploadFile, File
+from backend.agents.graph import JDResumeAnalyzer
+from backend.config.lifespan import get_analyzer
 from backend.controllers.v1 import agents
 from backend.utils.jwt import get_current_user
-from typing import Optional
+from typing import List, Literal, Optional
 
 router = APIRouter()
 
+PipelineMode = Optional[Literal["graph", "fused"]]
+
 @router.post('/analyse-resume')
-async def user_data_wrapper(jd: str = Form(...), job_title: str = Form(...), company: Optional[str]= Form(None), resume: UploadFile = File(None), current_user: dict = Depends(get_current_user)):
-    return await agents.analyze_resume(current_user, resume, jd, job_title, company)
+async def user_data_wrapper(jd: str = Form(...), job_title: str = Form(...), company: Optional[str]= Form(None), resume: UploadFile = File(None), pipeline_mode: PipelineMode = Form(None), current_user: dict = Depends(get_current_user), analyzer: JDResumeAnalyzer = Depends(get_analyzer)):
+    return await agents.analyze_resume(current_user, analyzer, resume, jd, job_title, company, pipeline_mode)
+
+@router.post('/analyse-resume/stream')
+async def stream_analysis_wrapper(jd: str = Form(...), job_title: str = Form(...), company: Optional[str] = Form(None), resume: UploadFile = File(...), pipeline_mode: PipelineMode = Form(None), current_user: dict = Depends(get_current_user), analyzer: JDResumeAnalyzer = Depends(get_analyzer)):
+    return await agents.analyze_resume_stream(current_user, analyzer, resume, jd, job_title, company, pipeline_mode)
+
+@router.post('/analyse-resumes/batch')
+async def batch_analysis_wrapper(jd: str = Form(...), job_title: str = Form(...), company: Optional[str] = Form(None), resumes: List[UploadFile] = File(...), include_recommendations: bool = Form(False), current_user: dict = Depends(get_current_user), analyzer: JDResumeAnalyzer = Depends(get_analyzer)):
+    return await agents.analyze_resume_batch(current_user, analyzer, resumes, jd, job_title, company, include_recommendations)
+
+@router.post('/analyse-resume/jobs')
+async def submit_job_wrapper(jd: str = Form(...), job_title: str = Form(...), company: Optional[str] = Form(None), resume: UploadFile = File(...), pipeline_mode: PipelineMode = Form(None), current_user: dict = Depends(get_current_user)):
+    return await agents.submit_analysis_job(current_user, resume, jd, job_title, company, pipeline_mode)
+
+@router.get('/jobs/{job_id}')
+async def job_status_wrapper(job_id: str, current_user: dict = Depends(get_current_user)):
+    return await agents.get_analysis_job(current_user, job_id)
+
+@router.get('/jobs/{job_id}/events')
+async def job_events_wrapper(job_id: str, current_user: dict = Depends(get_current_user)):
+    return await agents.stream_analysis_job(current_user, job_id)
 
 @router.get('/past-reports')
 async def past_report_wrapper(
     current_user: dict = Depends(get_current_user), 
     page: int = Query(1, ge=1, description="Page number (starting from 1)"),
     limit: int = Query(10, ge=1, le=100, description="Number of items per page (max 100)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
+    view: Literal["full", "summary"] = Query("full", description="summary returns list fields only"),
+):
+    return await agents.past_reports(current_user=current_user, page=page, limit=limit, cursor=cursor, view=view)
+
+@router.get('/stats')
+async def stats_wrapper(
+    current_user: dict = Depends(get_current_user),
+    days: int = Query(30, ge=1, le=365, description="Only analyses from the last N days"),
+):
+    return await agents.analysis_stats(current_user=current_user, days=days)
+
+@router.post('/search/resumes')
+async def search_resumes_wrapper(
+    jd: Optional[str] = Form(None),
+    analysis_id: Optional[str] = Form(None, description="rank against the JD of this stored analysis instead"),
+    limit: int = Form(10, ge=1, le=100),
+    eligible_only: bool = Form(False, description="drop candidates below the experience or education requirement"),
+    current_user: dict = Depends(get_current_user),
+):
+    return await agents.search_resumes(current_user, jd, analysis_id, limit, eligible_only)
+
+@router.post('/search/jobs')
+async def search_jobs_wrapper(
+    resume: UploadFile = File(None),
+    analysis_id: Optional[str] = Form(None, description="rank for the resume of this stored analysis instead"),
+    limit: int = Form(10, ge=1, le=100),
+    eligible_only: bool = Form(False, description="drop jobs whose experience or education requirement is not met"),
+    current_user: dict = Depends(get_current_user),
+):
+    return await agents.search_jobs(current_user, resume, analysis_id, limit, eligible_only)
+
+@router.get('/report/{id}')
+async def get_record_wrapper(id: str, current_user: dict = Depends(get_current_user)):
+    return await agents.get_report(current_user=current_user, id=id)
+
+@router.post('/report/{id}/reanalyse')
+async def reanalyse_wrapper(
+    id: str,
+    resume: UploadFile = File(None, description="omit to keep the resume of the previous analysis"),
+    jd: Optional[str] = Form(None, description="omit to keep the job description of the previous analysis"),
+    job_title: Optional[str] = Form(None),
+    company: Optional[str] = Form(None),
+    refresh_recommendations: bool = Form(False, description="regenerate recommendations even when nothing changed"),
+    current_user: dict = Depends(get_current_user),
+    analyzer: JDResumeAnalyzer = Depends(get_analyzer),
 ):
-    return await agents.past_reports(current_user=current_user, page=page, limit=limit)
+    return await agents.reanalyze_resume(current_user, analyzer, id, resume, jd, job_title, company, refresh_recommendations)
 
 @router.delete('/report/{id}')
 async def delete_record_wrapper(id: str, current_user: dict = Depends(get_current_user)):
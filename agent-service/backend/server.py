@@ -1,9 +1,12 @@
+import importlib.util
 import logging
+import os
 import uvicorn
 
-# from backend.config.main import PORT
+from backend.config.main import PORT, SERVER_BACKLOG, SERVER_HOST, SERVER_KEEP_ALIVE, SERVER_SHUTDOWN_TIMEOUT, SERVER_WORKERS, config
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 def start_server():
@@ -15,5 +18,36 @@ def start_server():
     )
 
 
+def run_production_server(app: str = "backend.app:app", workers: int = None, host: str = None, port: int = None):
+    workers = workers or SERVER_WORKERS or os.cpu_count() or 1
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    # Workers are spawned processes that import the app and run its lifespan on
+    # their own, so nothing opened here is shared. Each one also starts an
+    # extraction pool; split the cores between them unless EXTRACTION_WORKERS is set.
+    if not config.get("EXTRACTION_WORKERS", default=""):
+        os.environ["EXTRACTION_WORKERS"] = str(max(1, (os.cpu_count() or 1) // workers))
+
+    logger.info(f"Starting {workers} worker(s) with {loop} and {http}, extraction workers {os.environ.get('EXTRACTION_WORKERS', 'from config')}")
+    uvicorn.run(
+        app,
+        host=host or SERVER_HOST,
+        port=port or PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=SERVER_BACKLOG,
+        timeout_keep_alive=SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=SERVER_SHUTDOWN_TIMEOUT,
+        # Per-request metrics are on /metrics; an access log line per request costs more
+        access_log=False,
+    )
+
+
+def start_production_server():
+    run_production_server()
+
+
 if __name__ == "__main__":
     start_server()
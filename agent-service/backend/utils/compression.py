@@ -0,0 +1,12 @@
+import orjson
+import zstandard
+
+
+# Analysis blobs are small JSON documents; level 3 is zstd's default and
+# compresses them within a few hundred microseconds
+def compress_json(data, level: int = 3) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(orjson.dumps(data))
+
+
+def decompress_json(blob: bytes):
+    return orjson.loads(zstandard.ZstdDecompressor().decompress(blob))
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from backend.config.main import JOB_QUEUE_MAX_SIZE, JOB_RETENTION_SECONDS, JOB_STATUS_POLL_SECONDS, JOB_WORKERS
+from backend.models.AnalysisJobRecord import AnalysisJobRecord
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class AnalysisJob:
+    def __init__(self, user_id: str, payload: dict):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.payload = payload
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.events = []
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.on_publish = None
+        self.save_lock = asyncio.Lock()
+        self._subscribers = set()
+
+    def publish(self, event: str, data: dict = None):
+        entry = {"event": event, "data": data or {}, "at": time.time()}
+        self.events.append(entry)
+        for subscriber in self._subscribers:
+            subscriber.put_nowait(entry)
+        if self.on_publish:
+            self.on_publish(self)
+
+    async def subscribe(self):
+        # Replay what already happened, then follow live events until the job finishes
+        subscriber = asyncio.Queue()
+        for entry in self.events:
+            subscriber.put_nowait(entry)
+        self._subscribers.add(subscriber)
+        try:
+            while True:
+                entry = await subscriber.get()
+                yield entry
+                if entry["event"] in TERMINAL_STATUSES:
+                    return
+        finally:
+            self._subscribers.discard(subscriber)
+
+    def snapshot(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "progress": [entry["data"]["node"] for entry in self.events if entry["event"] == "node"],
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+# In-process job queue drained by a fixed pool of worker tasks. The queue is
+# bounded so callers can be told to back off (429) instead of piling up work.
+# With persistent on (set by the lifespan once Beanie is initialized) every
+# status change is also written to the AnalysisJob collection, so the other
+# server workers can answer status and event requests for the job.
+class AnalysisJobQueue:
+    def __init__(self, workers: int = JOB_WORKERS, max_size: int = JOB_QUEUE_MAX_SIZE, retention: int = JOB_RETENTION_SECONDS, persistent: bool = False):
+        self.workers = workers
+        self.max_size = max_size
+        self.retention = retention
+        self.persistent = persistent
+        self.jobs = {}
+        self.drain_deadline = None
+        self._queue = None
+        self._tasks = []
+        self._saves = set()
+
+    def start(self, runner):
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [asyncio.create_task(self._worker(runner)) for _ in range(self.workers)]
+        logger.info(f"Analysis job queue started with {self.workers} workers")
+
+    # Called from the exit signal handler: no new jobs are accepted, and stop()
+    # lets queued and running ones finish until the deadline
+    def begin_drain(self, timeout: float):
+        if self.drain_deadline is None:
+            self.drain_deadline = time.monotonic() + timeout
+
+    async def stop(self):
+        if self.drain_deadline is not None and self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), max(0, self.drain_deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                stats = self.stats()
+                logger.warning(f"Shutdown deadline reached, cancelling {stats['running']} running and {stats['queued']} queued analysis jobs")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        # Jobs that never started are failed too, so pollers are not left waiting
+        while self._queue is not None and not self._queue.empty():
+            job = self._queue.get_nowait()
+            self._fail(job, "Server shutting down")
+            job.payload = None
+            self._queue.task_done()
+        await asyncio.gather(*self._saves, return_exceptions=True)
+
+    def is_full(self) -> bool:
+        return self._queue is None or self.drain_deadline is not None or self._queue.full()
+
+    def submit(self, job: AnalysisJob):
+        self._prune()
+        self._queue.put_nowait(job)
+        self.jobs[job.id] = job
+        if self.persistent:
+            job.on_publish = self._schedule_save
+        job.publish("queued", {"position": self._queue.qsize()})
+
+    def get(self, job_id: str):
+        return self.jobs.get(job_id)
+
+    async def snapshot(self, job_id: str):
+        """The job's snapshot with its user_id, from this process or from the job collection."""
+        job = self.jobs.get(job_id)
+        if job is not None:
+            return {**job.snapshot(), "user_id": job.user_id}
+        if not self.persistent:
+            return None
+        try:
+            return await AnalysisJobRecord.get_pymongo_collection().find_one({"job_id": job_id}, {"_id": 0, "expires_at": 0})
+        except Exception as e:
+            logger.warning(f"Analysis job lookup failed: {e}")
+            return None
+
+    async def follow(self, job_id: str):
+        """Events of a job running in another worker, rebuilt by polling its record."""
+        yield {"event": "queued", "data": {}}
+        started, nodes = False, 0
+        while True:
+            record = await self.snapshot(job_id)
+            if record is None:
+                yield {"event": "failed", "data": {"message": "Job not found"}}
+                return
+            if record.get("started_at") and not started:
+                started = True
+                yield {"event": "started", "data": {}}
+            for node in record.get("progress", [])[nodes:]:
+                nodes += 1
+                yield {"event": "node", "data": {"node": node, "status": "done"}}
+            if record["status"] == "completed":
+                yield {"event": "completed", "data": record.get("result") or {}}
+                return
+            if record["status"] == "failed":
+                yield {"event": "failed", "data": {"message": record.get("error")}}
+                return
+            await asyncio.sleep(JOB_STATUS_POLL_SECONDS)
+
+    def _schedule_save(self, job: AnalysisJob):
+        task = asyncio.create_task(self._save(job))
+        self._saves.add(task)
+        task.add_done_callback(self._saves.discard)
+
+    async def _save(self, job: AnalysisJob):
+        # Each save writes the job as it is once the lock is acquired, so the last write is the latest state
+        async with job.save_lock:
+            record = {**job.snapshot(), "user_id": job.user_id, "expires_at": datetime.utcnow() + timedelta(seconds=self.retention)}
+            try:
+                await AnalysisJobRecord.get_pymongo_collection().update_one({"job_id": job.id}, {"$set": record}, upsert=True)
+            except Exception as e:
+                logger.warning(f"Saving analysis job {job.id} failed: {e}")
+
+    def _fail(self, job: AnalysisJob, error: str):
+        job.status = "failed"
+        job.error = error
+        job.finished_at = time.time()
+        job.publish("failed", {"message": job.error})
+
+    def stats(self) -> dict:
+        statuses = [job.status for job in self.jobs.values()]
+        return {
+            "workers": self.workers,
+            "max_size": self.max_size,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": statuses.count("running"),
+            "completed": statuses.count("completed"),
+            "failed": statuses.count("failed"),
+        }
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self.jobs.items() if job.finished_at and job.finished_at < cutoff]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    async def _worker(self, runner):
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            job.publish("started")
+            try:
+                job.result = await runner(job)
+                job.status = "completed"
+                job.finished_at = time.time()
+                job.publish("completed", job.result)
+            except asyncio.CancelledError:
+                self._fail(job, "Server shutting down")
+                raise
+            except Exception as e:
+                logger.error(f"Analysis job {job.id} failed: {e}")
+                self._fail(job, str(e))
+            finally:
+                job.payload = None
+                self._queue.task_done()
+
+
+job_queue = AnalysisJobQueue()
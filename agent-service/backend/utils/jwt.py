@@ -1,38 +1,94 @@
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from backend.config import main
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
+from collections import OrderedDict
+import threading
+import time
 
 security = HTTPBearer()
 load_dotenv("local.env")
 
-async def verify_jwt_token(token: str) -> dict:
-    print("token", token)
-    try:
-        public_key = serialization.load_pem_public_key(
-            main.JWT_ACCESS_KEY_PUBLIC, backend=default_backend()
-        )
+_public_key = None
+
+
+def load_public_key(pem: bytes = None):
+    # Parsed once and reused: jwt.decode accepts a prepared jose key as-is
+    global _public_key
+    public_key = serialization.load_pem_public_key(
+        pem or main.JWT_ACCESS_KEY_PUBLIC, backend=default_backend()
+    )
+
+    public_key_pem_decrypted = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+    _public_key = jwk.construct(public_key_pem_decrypted, algorithm="RS256")
+    return _public_key
+
+
+# LRU of verified token -> payload. An entry lives for at most ttl seconds and
+# never past the token's own exp, so expired tokens are re-verified (and fail).
+class VerifiedTokenCache:
+    def __init__(self, max_size: int = main.JWT_CACHE_SIZE, ttl: float = main.JWT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str):
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.time() >= expires_at:
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return dict(payload)
 
-        public_key_pem_decrypted = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
+    def set(self, token: str, payload: dict):
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, payload["exp"])
+        with self._lock:
+            self._entries[token] = (expires_at, dict(payload))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
 
-        payload = jwt.decode(
-            token, public_key_pem_decrypted.decode("utf-8"), algorithms=["RS256"]
-        )
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
+
+token_cache = VerifiedTokenCache()
+
+
+async def verify_jwt_token(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is not None:
         return payload
+
+    try:
+        payload = jwt.decode(token, _public_key or load_public_key(), algorithms=["RS256"])
     except JWTError as e:
         print(e)
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
+    token_cache.set(token, payload)
+    return payload
+
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     if credentials is None:
         raise HTTPException(status_code=403, detail="Authorization token missing")
-    
+
     return await verify_jwt_token(credentials.credentials)
@@ -0,0 +1,295 @@
+import re
+from datetime import date
+
+from rapidfuzz import fuzz
+
+from backend.utils.skill_taxonomy import SKILL_ALIASES, clean_skill, skill_index
+
+# Weights of the four scoring categories (must add up to 1)
+WEIGHTS = {"skills": 0.4, "experience": 0.3, "education": 0.2, "soft_skills": 0.1}
+
+EXPERIENCE_SCORES = {"match": 100, "partial": 70, "mismatch": 30}
+EDUCATION_SCORES = {"match": 100, "partial": 70, "mismatch": 40}
+
+FUZZY_SOFT_SKILL_CUTOFF = 85
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+SENIORITY_YEARS = [
+    (r"\b(?:intern|internship|entry|fresher|graduate|trainee)\b", 0),
+    (r"\bjunior\b", 1),
+    (r"\bmid(?:-|\s)?(?:level|senior)?\b|\bintermediate\b", 3),
+    (r"\bsenior\b|\bsr\.?\b", 5),
+    (r"\blead\b|\bstaff\b", 7),
+    (r"\bprincipal\b|\barchitect\b", 8),
+    (r"\bdirector\b|\bexecutive\b|\bhead of\b|\bvp\b", 10),
+]
+
+# Highest level first; the first pattern that matches wins. A bare "degree"
+# with no level named is read as a bachelor's. "MS" alone is too often "MS Office"
+# to count as a master's without "in"/"of"/"degree" after it.
+EDUCATION_LEVELS = [
+    (5, "doctorate", r"\bph\.?\s?d\b|\bdoctor(?:ate|al)?\b"),
+    (4, "master's", r"\bmaster|\bm\.?\s?(?:sc|tech|eng|phil)\b|\bm\.s\b|\bms\s+(?:in|of|degree)\b|\bmba\b|\bm\.?\s?b\.?\s?a\b|\bmca\b|\bpost\s?graduate\b"),
+    (3, "bachelor's", r"\bbachelor|\bb\.?\s?(?:sc|tech|eng|com|ca)\b|\bb\.\s?(?:s|e|a)\b|\bbs\b|\bbca\b|\bundergraduate\b"),
+    (2, "associate/diploma", r"\bassociate\b|\bdiploma\b"),
+    (1, "high school", r"\bhigh school\b|\bsecondary\b|\bhsc\b|\b12th\b|\bged\b"),
+]
+
+DATE_TOKEN = re.compile(
+    r"(?:(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s*|(?P<num_month>\d{1,2})\s*[/.-]\s*)?(?P<year>(?:19|20)\d{2})"
+    r"|(?P<present>present|current|now|till date|to date|ongoing)"
+)
+YEARS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*\+?\s*(?:(?:-|–|to)\s*\d+(?:\.\d+)?\s*)?(?:years?|yrs?)")
+MONTHS_PATTERN = re.compile(r"(\d+)\s*(?:months?|mos?)\b")
+
+
+def normalize_skill(skill) -> str:
+    name = clean_skill(skill)
+    return SKILL_ALIASES.get(name, name)
+
+
+def flatten_resume_skills(parsed_resume: dict) -> list:
+    skills = []
+    skill_buckets = parsed_resume.get("skills") or {}
+    if isinstance(skill_buckets, dict):
+        for values in skill_buckets.values():
+            if isinstance(values, list):
+                skills.extend(values)
+    elif isinstance(skill_buckets, list):
+        skills.extend(skill_buckets)
+
+    projects = (parsed_resume.get("certifications_and_projects") or {}).get("projects") or []
+    for project in projects:
+        if isinstance(project, dict) and isinstance(project.get("technologies"), list):
+            skills.extend(project["technologies"])
+
+    return [skill for skill in skills if isinstance(skill, str) and skill.strip()]
+
+
+def _month_index(match, today: date) -> int:
+    if match.group("present"):
+        return today.year * 12 + today.month - 1
+    if match.group("month"):
+        month = MONTHS[match.group("month")]
+    elif match.group("num_month") and 1 <= int(match.group("num_month")) <= 12:
+        month = int(match.group("num_month"))
+    else:
+        month = 1
+    return int(match.group("year")) * 12 + month - 1
+
+
+def _duration_interval(duration: str, today: date):
+    tokens = list(DATE_TOKEN.finditer(duration.lower()))
+    if len(tokens) >= 2:
+        start, end = _month_index(tokens[0], today), _month_index(tokens[1], today)
+        return (start, end) if end >= start else None
+    return None
+
+
+def extract_experience_years(parsed_resume: dict, today: date = None) -> float:
+    today = today or date.today()
+    intervals, loose_months = [], 0
+
+    for job in parsed_resume.get("work_experience") or []:
+        if not isinstance(job, dict):
+            continue
+        duration = str(job.get("duration") or "")
+        interval = _duration_interval(duration, today)
+        if interval:
+            intervals.append(interval)
+            continue
+        years = YEARS_PATTERN.search(duration.lower())
+        months = MONTHS_PATTERN.search(duration.lower())
+        loose_months += int(float(years.group(1)) * 12) if years else 0
+        loose_months += int(months.group(1)) if months else 0
+
+    # Merge overlapping roles so concurrent jobs are not double counted
+    total_months, current = 0, None
+    for start, end in sorted(intervals):
+        if current and start <= current[1] + 1:
+            current = (current[0], max(current[1], end))
+        else:
+            if current:
+                total_months += current[1] - current[0] + 1
+            current = (start, end)
+    if current:
+        total_months += current[1] - current[0] + 1
+
+    return round((total_months + loose_months) / 12, 1)
+
+
+def extract_required_years(parsed_jd: dict, job_description: str = ""):
+    for text in (parsed_jd.get("experience_level_required"), job_description):
+        if not text or not isinstance(text, str):
+            continue
+        found = YEARS_PATTERN.search(text.lower())
+        if found:
+            return float(found.group(1))
+
+    level_text = str(parsed_jd.get("experience_level_required") or "").lower()
+    for pattern, years in SENIORITY_YEARS:
+        if re.search(pattern, level_text):
+            return float(years)
+    return None
+
+
+def education_level(text: str) -> tuple:
+    text = str(text or "").lower()
+    for level, label, pattern in EDUCATION_LEVELS:
+        if re.search(pattern, text):
+            return level, label
+    return (3, "bachelor's") if re.search(r"\bdegree\b", text) else (0, "not specified")
+
+
+def required_education(text: str) -> tuple:
+    text = str(text or "").lower()
+    mentioned = [(level, label) for level, label, pattern in EDUCATION_LEVELS if re.search(pattern, text)]
+    return min(mentioned) if mentioned else education_level(text)
+
+
+def _required_field(text: str) -> str:
+    found = re.search(r"\b(?:in|of)\s+([a-z][a-z &/]+?)(?:\s+or\b|\s+and\b|[,.;(]|$)", str(text or "").lower())
+    if not found:
+        return ""
+    field = found.group(1).strip()
+    return "" if field in ("a related field", "related field", "equivalent") else field
+
+
+def skill_score(must_matched: int, must_total: int, nice_matched: int, nice_total: int) -> float:
+    must_ratio = must_matched / must_total if must_total else None
+    nice_ratio = nice_matched / nice_total if nice_total else None
+
+    if must_ratio is not None and nice_ratio is not None:
+        return 100 * (0.8 * must_ratio + 0.2 * nice_ratio)
+    if must_ratio is not None:
+        return 100 * must_ratio
+    if nice_ratio is not None:
+        return 100 * (0.5 + 0.5 * nice_ratio)
+    return 50
+
+
+def _score_skills(parsed_resume: dict, parsed_jd: dict) -> tuple:
+    candidate_skills = flatten_resume_skills(parsed_resume)
+    required = parsed_jd.get("required_skills") or {}
+    must_have = [s for s in required.get("must_have") or [] if isinstance(s, str)]
+    nice_to_have = [s for s in required.get("nice_to_have") or [] if isinstance(s, str)]
+
+    must_matched, must_missing = skill_index.match(must_have, candidate_skills)
+    nice_matched, nice_missing = skill_index.match(nice_to_have, candidate_skills)
+
+    score = skill_score(len(must_matched), len(must_have), len(nice_matched), len(nice_to_have))
+
+    explanation = (
+        f"Matched {len(must_matched)}/{len(must_have)} must-have skills"
+        + (f" ({', '.join(must_matched)})" if must_matched else "")
+        + f" and {len(nice_matched)}/{len(nice_to_have)} nice-to-have skills"
+        + (f" ({', '.join(nice_matched)})" if nice_matched else "")
+        + "."
+        + (f" Missing must-have: {', '.join(must_missing)}." if must_missing else "")
+    )
+    if not must_have and not nice_to_have:
+        explanation = "Job description lists no specific skills; neutral skill score applied."
+
+    return score, must_matched + nice_matched, must_missing + nice_missing, explanation
+
+
+def experience_level(candidate_years: float, required_years: float) -> str:
+    if not required_years or candidate_years >= required_years:
+        return "match"
+    return "partial" if candidate_years >= 0.7 * required_years else "mismatch"
+
+
+def _score_experience(parsed_resume: dict, parsed_jd: dict, job_description: str) -> tuple:
+    candidate_years = extract_experience_years(parsed_resume)
+    required_years = extract_required_years(parsed_jd, job_description)
+
+    if not required_years:
+        return "match", f"No minimum experience specified; candidate has about {candidate_years} years."
+    return experience_level(candidate_years, required_years), f"Candidate has about {candidate_years} years of experience against {required_years:g}+ years required."
+
+
+def candidate_education(parsed_resume: dict) -> tuple:
+    """(level, label, major) of the highest degree on the resume."""
+    best = (0, "not specified", "")
+    for entry in parsed_resume.get("education") or []:
+        if not isinstance(entry, dict):
+            continue
+        level, label = education_level(f"{entry.get('degree', '')} {entry.get('major', '')}")
+        if level > best[0]:
+            best = (level, label, str(entry.get("major") or entry.get("degree") or ""))
+    return best
+
+
+def _score_education(parsed_resume: dict, parsed_jd: dict) -> tuple:
+    requirement = str(parsed_jd.get("educational_requirements") or "")
+    required_level, required_label = required_education(requirement)
+
+    candidate_level, candidate_label, candidate_major = candidate_education(parsed_resume)
+
+    if required_level == 0:
+        return "match", f"No degree requirement specified; candidate holds {candidate_label} education."
+    if candidate_level < required_level:
+        return "mismatch", f"Requires {required_label} degree; candidate's highest is {candidate_label}."
+
+    field = _required_field(requirement)
+    if field and candidate_major and fuzz.token_set_ratio(field, candidate_major.lower()) < 70:
+        return "partial", f"Candidate meets the {required_label} level but studied {candidate_major}, not {field}."
+    return "match", f"Candidate's {candidate_label} degree{f' in {candidate_major}' if candidate_major else ''} meets the {required_label} requirement."
+
+
+def _score_soft_skills(parsed_resume: dict, parsed_jd: dict, resume_text: str) -> tuple:
+    soft_skills = [s for s in parsed_jd.get("soft_skills_mentioned") or [] if isinstance(s, str) and s.strip()]
+    if not soft_skills:
+        return 100, "No specific soft skills required."
+
+    evidence = [resume_text or ""]
+    for job in parsed_resume.get("work_experience") or []:
+        if isinstance(job, dict):
+            evidence.append(str(job.get("role") or ""))
+            evidence.extend(str(item) for item in job.get("achievements") or [])
+    corpus = " ".join(evidence).lower()
+
+    demonstrated = [
+        skill for skill in soft_skills
+        if corpus and fuzz.partial_ratio(skill.lower(), corpus) >= FUZZY_SOFT_SKILL_CUTOFF
+    ]
+    score = 100 * len(demonstrated) / len(soft_skills)
+    explanation = f"Evidence found for {len(demonstrated)}/{len(soft_skills)} soft skills"
+    return score, explanation + (f" ({', '.join(demonstrated)})." if demonstrated else ".")
+
+
+def score_match(parsed_resume: dict, parsed_jd: dict, resume_text: str = "", job_description: str = "") -> dict:
+    parsed_resume = parsed_resume if isinstance(parsed_resume, dict) else {}
+    parsed_jd = parsed_jd if isinstance(parsed_jd, dict) else {}
+
+    skill_score, matched, missing, skill_text = _score_skills(parsed_resume, parsed_jd)
+    experience_level, experience_text = _score_experience(parsed_resume, parsed_jd, job_description)
+    education_alignment, education_text = _score_education(parsed_resume, parsed_jd)
+    soft_score, soft_text = _score_soft_skills(parsed_resume, parsed_jd, resume_text)
+
+    overall = (
+        WEIGHTS["skills"] * skill_score
+        + WEIGHTS["experience"] * EXPERIENCE_SCORES[experience_level]
+        + WEIGHTS["education"] * EDUCATION_SCORES[education_alignment]
+        + WEIGHTS["soft_skills"] * soft_score
+    )
+
+    return {
+        "overall_match_percentage": max(0, min(100, int(round(overall)))),
+        "skill_match": {
+            "matched": matched,
+            "missing": missing
+        },
+        "experience_level": experience_level,
+        "education_alignment": education_alignment,
+        "detailed_breakdown": {
+            "skills": skill_text,
+            "experience": experience_text,
+            "education": education_text,
+            "soft_skills": soft_text
+        }
+    }
@@ -0,0 +1,131 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+SIZE_BUCKETS = (256, 1024, 16 * 1024, 128 * 1024, 512 * 1024, 1024 * 1024, 5 * 1024 * 1024, 20 * 1024 * 1024)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, description: str, buckets: tuple = DURATION_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.setdefault(key, {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series["counts"]):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_format_labels(key + (('le', f'{bound:g}'),))} {cumulative}")
+                lines.append(f"{self.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {series['count']}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {series['sum']:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {series['count']}")
+        return lines
+
+
+http_requests_total = Counter("http_requests_total", "HTTP requests by method, route and status")
+http_request_duration_seconds = Histogram("http_request_duration_seconds", "Time until response headers are sent")
+http_request_body_bytes = Histogram("http_request_body_bytes", "Request body size from Content-Length", SIZE_BUCKETS)
+analysis_phase_duration_seconds = Histogram("analysis_phase_duration_seconds", "Duration of analysis phases (upload read, extraction, graph nodes, DB save)")
+analysis_phase_errors_total = Counter("analysis_phase_errors_total", "Analysis phases that raised")
+gemini_retries_total = Counter("gemini_retries_total", "Gemini calls retried, by node and error code")
+gemini_hedged_requests_total = Counter("gemini_hedged_requests_total", "Hedged Gemini requests, by which request finished first")
+gemini_circuit_transitions_total = Counter("gemini_circuit_transitions_total", "Gemini circuit breaker state changes")
+gemini_tokens_total = Counter("gemini_tokens_total", "Gemini tokens by node and direction (usage metadata, or an estimate for fakes)")
+gemini_rate_limit_wait_seconds = Histogram("gemini_rate_limit_wait_seconds", "Time Gemini calls queued for the client-side rate limiter")
+input_text_tokens = Histogram("input_text_tokens", "Estimated tokens of resume and job description text, before and after normalization", TOKEN_BUCKETS)
+prompt_input_tokens = Histogram("prompt_input_tokens", "Estimated tokens of structured data embedded in prompts, before and after compaction", TOKEN_BUCKETS)
+
+REGISTRY = [
+    http_requests_total,
+    http_request_duration_seconds,
+    http_request_body_bytes,
+    analysis_phase_duration_seconds,
+    analysis_phase_errors_total,
+    gemini_retries_total,
+    gemini_hedged_requests_total,
+    gemini_circuit_transitions_total,
+    gemini_tokens_total,
+    gemini_rate_limit_wait_seconds,
+    input_text_tokens,
+    prompt_input_tokens,
+]
+
+
+# Called as observer(phase, seconds) after every timed phase; the per-analysis telemetry registers here
+PHASE_OBSERVERS = []
+
+
+@contextmanager
+def timed_phase(phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        analysis_phase_errors_total.inc(phase=phase)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        analysis_phase_duration_seconds.observe(elapsed, phase=phase)
+        for observer in PHASE_OBSERVERS:
+            observer(phase, elapsed)
+
+
+def render_metrics(extra_metrics: dict = None) -> str:
+    # extra_metrics: name -> (type, description, [(labels, value), ...]) sampled at scrape time
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    for name, (metric_type, description, samples) in (extra_metrics or {}).items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            lines.append(f"{name}{_format_labels(tuple(sorted(labels.items())))} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,109 @@
+import copy
+import hashlib
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+
+from backend.config.main import PARSE_CACHE_SIZE
+from backend.models.ParseCacheEntry import ParseCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def make_cache_key(kind: str, text: str, prompt_version: str, model: str) -> str:
+    return f"{kind}:{prompt_version}:{model}:{text_digest(text)}"
+
+
+def is_cacheable(data) -> bool:
+    return bool(data) and isinstance(data, dict) and not any(
+        key in data for key in ("raw_analysis", "parsing_error", "error")
+    )
+
+
+# Two-tier cache of parsed resumes/JDs: an in-process LRU in front of the
+# ParseCache collection. The persistent tier is switched on by the lifespan
+# once Beanie is initialized.
+class ParseCache:
+    def __init__(self, max_size: int = PARSE_CACHE_SIZE, persistent: bool = False):
+        self.max_size = max_size
+        self.persistent = persistent
+        self._entries = OrderedDict()
+        self._stats = {}
+
+    def _count(self, kind: str, outcome: str):
+        counters = self._stats.setdefault(kind, {"memory_hits": 0, "persistent_hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+    def _remember(self, key: str, data: dict):
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, kind: str, text: str, prompt_version: str, model: str):
+        key = make_cache_key(kind, text, prompt_version, model)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._count(kind, "memory_hits")
+            return copy.deepcopy(self._entries[key])
+
+        if self.persistent:
+            try:
+                entry = await ParseCacheEntry.find_one(ParseCacheEntry.key == key)
+            except Exception as e:
+                logger.warning(f"Parse cache lookup failed: {e}")
+                entry = None
+
+            if entry is not None:
+                self._remember(key, entry.data)
+                self._count(kind, "persistent_hits")
+                return copy.deepcopy(entry.data)
+
+        self._count(kind, "misses")
+        return None
+
+    async def set(self, kind: str, text: str, prompt_version: str, model: str, data: dict):
+        if not is_cacheable(data):
+            return
+
+        key = make_cache_key(kind, text, prompt_version, model)
+        self._remember(key, copy.deepcopy(data))
+
+        if self.persistent:
+            try:
+                await ParseCacheEntry.find_one(ParseCacheEntry.key == key).upsert(
+                    {"$set": {"data": data}},
+                    on_insert=ParseCacheEntry(key=key, kind=kind, prompt_version=prompt_version, model=model, data=data)
+                )
+            except Exception as e:
+                logger.warning(f"Parse cache write failed: {e}")
+
+    def stats(self) -> dict:
+        totals = {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
+        for counters in self._stats.values():
+            for outcome, value in counters.items():
+                totals[outcome] += value
+
+        lookups = sum(totals.values())
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "persistent": self.persistent,
+            "by_kind": copy.deepcopy(self._stats),
+            **totals,
+            "hit_rate": round((lookups - totals["misses"]) / lookups, 4) if lookups else 0.0
+        }
+
+
+parse_cache = ParseCache()
@@ -0,0 +1,194 @@
+import copy
+import json
+import logging
+
+from backend.config.main import PROMPT_MAX_STRING_CHARS, PROMPT_TOKEN_BUDGET
+from backend.utils.match_scoring import normalize_skill
+from backend.utils.metrics import prompt_input_tokens
+
+logger = logging.getLogger(__name__)
+
+# Fields each node's prompt actually reads. None keeps the whole value; a list
+# keeps only those keys of every item in a list of objects.
+PROJECTIONS = {
+    "matcher": {
+        "resume": {
+            "skills": None,
+            "work_experience": ["role", "company", "duration", "achievements"],
+            "education": ["degree", "major", "institution"],
+        },
+        "jd": {
+            "required_skills": None,
+            "experience_level_required": None,
+            "educational_requirements": None,
+            "soft_skills_mentioned": None,
+        },
+    },
+    "recommender": {
+        "resume": {
+            "skills": None,
+            "work_experience": ["role", "duration", "achievements"],
+            "education": ["degree", "major"],
+            "certifications_and_projects": None,
+        },
+        "jd": {
+            "job_title": None,
+            "required_skills": None,
+            "experience_level_required": None,
+            "educational_requirements": None,
+            "key_responsibilities": None,
+            "industry_specific_keywords": None,
+            "soft_skills_mentioned": None,
+        },
+        "match": {
+            "skill_match": None,
+            "experience_level": None,
+            "education_alignment": None,
+            "detailed_breakdown": None,
+        },
+    },
+}
+
+# What to give up first when a prompt is over budget, lowest priority first.
+# Lists are halved (keeping the leading, most relevant items) before the field
+# is dropped; a path through a list of objects trims every item.
+TRIM_ORDER = {
+    "matcher": [
+        ("resume", "work_experience", "achievements"),
+        ("resume", "education"),
+        ("resume", "work_experience"),
+    ],
+    "recommender": [
+        ("resume", "certifications_and_projects"),
+        ("resume", "work_experience", "achievements"),
+        ("jd", "key_responsibilities"),
+        ("jd", "industry_specific_keywords"),
+        ("match", "detailed_breakdown"),
+        ("resume", "work_experience"),
+        ("resume", "education"),
+    ],
+}
+
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text and JSON
+    return (len(text) + 3) // 4
+
+
+def minify(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _prune(value, max_chars: int):
+    if isinstance(value, dict):
+        pruned = {key: _prune(item, max_chars) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in ("", None, [], {})}
+    if isinstance(value, list):
+        pruned = [_prune(item, max_chars) for item in value]
+        return [item for item in pruned if item not in ("", None, [], {})]
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        return value[:max_chars - 1].rstrip() + "…" if len(value) > max_chars else value
+    return value
+
+
+def _project(document, fields: dict) -> dict:
+    if not isinstance(document, dict):
+        return {}
+    projected = {}
+    for field, keys in fields.items():
+        value = document.get(field)
+        if keys is not None and isinstance(value, list):
+            value = [{key: item.get(key) for key in keys} for item in value if isinstance(item, dict)]
+        projected[field] = copy.deepcopy(value)
+    return projected
+
+
+def _dedupe(items: list, seen: set) -> list:
+    unique = []
+    for item in items:
+        key = normalize_skill(item) if isinstance(item, str) else minify(item)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def dedupe_skills(documents: dict):
+    # A skill keeps its first bucket: resume skill categories in order, JD
+    # must-haves before nice-to-haves, matched before missing
+    skills = (documents.get("resume") or {}).get("skills")
+    if isinstance(skills, dict):
+        seen = set()
+        for bucket, values in skills.items():
+            if isinstance(values, list):
+                skills[bucket] = _dedupe(values, seen)
+    elif isinstance(skills, list):
+        documents["resume"]["skills"] = _dedupe(skills, set())
+
+    for document, field, buckets in (
+        ("jd", "required_skills", ("must_have", "nice_to_have")),
+        ("match", "skill_match", ("matched", "missing")),
+    ):
+        container = (documents.get(document) or {}).get(field)
+        if isinstance(container, dict):
+            seen = set()
+            for bucket in buckets:
+                if isinstance(container.get(bucket), list):
+                    container[bucket] = _dedupe(container[bucket], seen)
+
+
+def _trim(container, path: tuple) -> bool:
+    if isinstance(container, list):
+        changed = False
+        for item in container:
+            changed = _trim(item, path) or changed
+        return changed
+    if not isinstance(container, dict) or path[0] not in container:
+        return False
+    if len(path) > 1:
+        return _trim(container[path[0]], path[1:])
+
+    value = container[path[0]]
+    if isinstance(value, list) and len(value) > 1:
+        container[path[0]] = value[:len(value) // 2]
+    else:
+        del container[path[0]]
+    return True
+
+
+def _total_tokens(documents: dict) -> int:
+    return sum(estimate_tokens(minify(document)) for document in documents.values())
+
+
+def compact_prompt_inputs(node: str, budget: int = None, max_string_chars: int = None, **documents) -> dict:
+    """Projects, prunes and minifies the documents a node's prompt embeds.
+
+    ``documents`` are keyed like PROJECTIONS[node] ("resume", "jd", "match").
+    Returns the minified JSON string for each, together using at most
+    ``budget`` estimated tokens unless nothing is left to trim.
+    """
+    budget = PROMPT_TOKEN_BUDGET if budget is None else budget
+    max_string_chars = PROMPT_MAX_STRING_CHARS if max_string_chars is None else max_string_chars
+    before = sum(estimate_tokens(str(document)) for document in documents.values())
+
+    projections = PROJECTIONS[node]
+    compacted = {
+        name: _prune(_project(document, projections[name]) if name in projections else document, max_string_chars)
+        for name, document in documents.items()
+    }
+    dedupe_skills(compacted)
+
+    for document, *path in TRIM_ORDER.get(node, []):
+        if budget <= 0 or document not in compacted:
+            continue
+        while _total_tokens(compacted) > budget and _trim(compacted[document], tuple(path)):
+            pass
+
+    rendered = {name: minify(document) for name, document in compacted.items()}
+    after = sum(estimate_tokens(text) for text in rendered.values())
+
+    prompt_input_tokens.observe(before, node=node, stage="raw")
+    prompt_input_tokens.observe(after, node=node, stage="compacted")
+    logger.info(f"{node} prompt inputs: ~{before} -> ~{after} tokens (budget {budget})")
+    return rendered
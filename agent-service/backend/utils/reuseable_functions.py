@@ -1,22 +1,114 @@
 import PyPDF2
 from docx import Document
+from docx.table import Table
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import io
 import json
-import re
+import multiprocessing
+import orjson
+import time
 
-def extract_text_from_pdf(file_content: bytes) -> str:
+from backend.llm.decoding import strip_code_fences
+from backend.utils.metrics import timed_phase
+from backend.config.main import EXTRACTION_WORKERS, PDF_PARALLEL_PAGE_THRESHOLD, RESUME_MAX_BYTES, RESUME_MAX_PAGES
+
+class ResumeTooLargeError(ValueError):
+    pass
+
+def extract_pdf_pages(file_content: bytes, start: int = 0, stop: int = RESUME_MAX_PAGES) -> list:
     reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
-    return text
+    return [(page.extract_text() or "") for page in reader.pages[start:stop]]
+
+def count_pdf_pages(file_content: bytes) -> int:
+    return len(PyPDF2.PdfReader(io.BytesIO(file_content)).pages)
+
+# Pages end with a form feed so the text normalizer can tell running headers/footers from content
+def join_pdf_pages(pages: list) -> str:
+    return "".join(f"{page_text}\n\f" for page_text in pages)
+
+def extract_text_from_pdf(file_content: bytes, max_pages: int = RESUME_MAX_PAGES) -> str:
+    return join_pdf_pages(extract_pdf_pages(file_content, 0, max_pages))
+
+def docx_table_lines(table: Table) -> list:
+    lines = []
+    for row in table.rows:
+        cells = []
+        for cell in row.cells:
+            # Merged cells repeat across the row; keep each text once
+            text = cell.text.strip()
+            if text and (not cells or cells[-1] != text):
+                cells.append(text)
+        if cells:
+            lines.append(" | ".join(cells))
+    return lines
 
 def extract_text_from_docx(file_content: bytes) -> str:
     doc = Document(io.BytesIO(file_content))
-    text = ""
-    for paragraph in doc.paragraphs:
-        text += paragraph.text + "\n"
-    return text
+    lines = []
+    for block in doc.iter_inner_content():
+        if isinstance(block, Table):
+            lines.extend(docx_table_lines(block))
+        else:
+            lines.append(block.text)
+    return "".join(f"{line}\n" for line in lines)
+
+def extract_resume_text(filename: str, file_content: bytes):
+    if filename.endswith('.pdf'):
+        return extract_text_from_pdf(file_content=file_content)
+    elif filename.endswith('.docx'):
+        return extract_text_from_docx(file_content=file_content)
+    return None
+
+_extraction_pool = None
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    global _extraction_pool
+    if _extraction_pool is None:
+        # spawn keeps the workers free of the server's threads and open sockets
+        _extraction_pool = ProcessPoolExecutor(max_workers=EXTRACTION_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _extraction_pool
+
+async def warm_extraction_pool():
+    # Start every worker up front so the first uploads don't pay for process spawn
+    loop = asyncio.get_running_loop()
+    pool = get_extraction_pool()
+    await asyncio.gather(*(loop.run_in_executor(pool, time.sleep, 0.1) for _ in range(EXTRACTION_WORKERS)))
+
+def shutdown_extraction_pool():
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        _extraction_pool = None
+
+async def extract_resume_text_async(filename: str, file_content: bytes):
+    with timed_phase("extraction"):
+        return await _extract_resume_text_async(filename, file_content)
+
+async def _extract_resume_text_async(filename: str, file_content: bytes):
+    if len(file_content) > RESUME_MAX_BYTES:
+        raise ResumeTooLargeError(f"Resume exceeds the {RESUME_MAX_BYTES // (1024 * 1024)} MB upload limit")
+    
+    loop = asyncio.get_running_loop()
+    pool = get_extraction_pool()
+    
+    if not filename.endswith('.pdf'):
+        return await loop.run_in_executor(pool, extract_resume_text, filename, file_content)
+    
+    page_count = min(await loop.run_in_executor(pool, count_pdf_pages, file_content), RESUME_MAX_PAGES)
+    if page_count < PDF_PARALLEL_PAGE_THRESHOLD:
+        return await loop.run_in_executor(pool, extract_text_from_pdf, file_content)
+    
+    # Large PDFs: split the page range across the pool and join in page order
+    chunk_size = -(-page_count // EXTRACTION_WORKERS)
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(pool, extract_pdf_pages, file_content, start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ))
+    return join_pdf_pages([page_text for chunk in chunks for page_text in chunk])
+
+def format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
 def clean_and_parse(raw_data):
     if isinstance(raw_data, dict):
@@ -25,10 +117,10 @@ def clean_and_parse(raw_data):
     if not isinstance(raw_data, str):
         return {"raw": str(raw_data)}
 
-    cleaned = re.sub(r'^```json\s*|\s*```$', '', raw_data.strip(), flags=re.DOTALL)
+    cleaned = strip_code_fences(raw_data)
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         return {"raw": cleaned}
     
 
@@ -0,0 +1,348 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from backend.config.main import SEARCH_INDEX_MAX_USERS, SEARCH_INDEX_REFRESH_SECONDS, SEARCH_INDEX_SYNC_SECONDS
+from backend.models.Analysis import Analysis
+from backend.utils.compression import decompress_json
+from backend.utils.match_scoring import (
+    DATE_TOKEN, EDUCATION_SCORES, EXPERIENCE_SCORES, WEIGHTS, candidate_education, education_level,
+    experience_level, extract_experience_years, extract_required_years, flatten_resume_skills,
+    required_education,
+)
+from backend.utils.skill_taxonomy import skill_index
+
+logger = logging.getLogger(__name__)
+
+# Skills after the first of these in a job description are optional
+NICE_TO_HAVE = re.compile(r"\b(?:nice[ -]to[ -]have|preferred|bonus|good to have|a plus)\b", re.IGNORECASE)
+# Posting of entries without any skills, so skill queries still reach them
+NO_SKILLS = "skills:none"
+INDEXED_FIELDS = {"_id": 1, "job_title": 1, "company": 1, "parsed_resume": 1, "job_analysis": 1, "compressed_fields": 1}
+
+
+def resume_profile(parsed_resume: dict) -> dict:
+    level, label, _ = candidate_education(parsed_resume)
+    details = parsed_resume.get("personal_details") or {}
+    contact = details.get("contact_info") or {}
+    return {
+        "name": str(details.get("name") or ""),
+        "email": str(contact.get("email") or "").strip().lower(),
+        "phone": re.sub(r"\D", "", str(contact.get("phone") or "")),
+        "skills": {skill for skill in skill_index.canonical(flatten_resume_skills(parsed_resume)) if skill},
+        "years": extract_experience_years(parsed_resume),
+        "education_level": level,
+        "education": label,
+    }
+
+
+def jd_profile(parsed_jd: dict, job_description: str = "") -> dict:
+    required = parsed_jd.get("required_skills") or {}
+    must_have = [s for s in required.get("must_have") or [] if isinstance(s, str)]
+    nice_to_have = [s for s in required.get("nice_to_have") or [] if isinstance(s, str)]
+    level, label = required_education(parsed_jd.get("educational_requirements"))
+    must = {skill for skill in skill_index.canonical(must_have) if skill}
+    return {
+        "must_have": must,
+        "nice_to_have": {skill for skill in skill_index.canonical(nice_to_have) if skill} - must,
+        "years": extract_required_years(parsed_jd, job_description) or 0.0,
+        "education_level": level,
+        "education": label,
+    }
+
+
+def parse_jd_text(text: str) -> dict:
+    """A parsed-JD shaped dict read from raw text with the skill taxonomy, no LLM."""
+    marker = NICE_TO_HAVE.search(text or "")
+    split = marker.start() if marker else len(text or "")
+    must_have = skill_index.extract((text or "")[:split])
+    nice_to_have = [skill for skill in skill_index.extract((text or "")[split:]) if skill not in must_have]
+    return {
+        "required_skills": {"must_have": must_have, "nice_to_have": nice_to_have},
+        "experience_level_required": "",
+        "educational_requirements": text or "",
+    }
+
+
+def parse_resume_text(text: str) -> dict:
+    """A parsed-resume shaped dict read from raw text with the skill taxonomy, no LLM."""
+    lines = (text or "").splitlines()
+    return {
+        "skills": {"extracted": skill_index.extract(text)},
+        "work_experience": [{"duration": line} for line in lines if len(DATE_TOKEN.findall(line.lower())) >= 2],
+        "education": [{"degree": line} for line in lines if education_level(line)[0]],
+    }
+
+
+def skill_scores(must_hits, must_total, nice_hits, nice_total) -> np.ndarray:
+    """match_scoring.skill_score over arrays of hit counts and totals."""
+    must_total = np.broadcast_to(must_total, must_hits.shape)
+    nice_total = np.broadcast_to(nice_total, nice_hits.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        must, nice = must_hits / must_total, nice_hits / nice_total
+    return np.select(
+        [(must_total > 0) & (nice_total > 0), must_total > 0, nice_total > 0],
+        [100 * (0.8 * must + 0.2 * nice), 100 * must, 100 * (0.5 + 0.5 * nice)],
+        50,
+    )
+
+
+def pair_scores(skills, candidate_years, required_years, candidate_education, required_education) -> tuple:
+    """Scores of many resume/JD pairs at once, plus which pairs clear both requirements."""
+    experience_match = (required_years <= 0) | (candidate_years >= required_years)
+    experience_partial = ~experience_match & (candidate_years >= 0.7 * required_years)
+    education_match = candidate_education >= required_education
+
+    experience = np.select([experience_match, experience_partial], [EXPERIENCE_SCORES["match"], EXPERIENCE_SCORES["partial"]], EXPERIENCE_SCORES["mismatch"])
+    education = np.where(education_match, EDUCATION_SCORES["match"], EDUCATION_SCORES["mismatch"])
+    # Soft skills are not indexed, so the other three weights are rescaled
+    weight = WEIGHTS["skills"] + WEIGHTS["experience"] + WEIGHTS["education"]
+    scores = (WEIGHTS["skills"] * skills + WEIGHTS["experience"] * experience + WEIGHTS["education"] * education) / weight
+    return np.clip(np.rint(scores), 0, 100).astype(int), (experience_match | experience_partial) & education_match
+
+
+def pair_details(resume: dict, jd: dict) -> dict:
+    required = jd["must_have"] | jd["nice_to_have"]
+    return {
+        "matched_skills": sorted(required & resume["skills"]),
+        "missing_skills": sorted(required - resume["skills"]),
+        "experience_level": experience_level(resume["years"], jd["years"]),
+        "education_alignment": "match" if resume["education_level"] >= jd["education_level"] else "mismatch",
+    }
+
+
+# A candidate is recognized by email, or by name and phone; different people share names
+def resume_key(analysis_id: str, profile: dict) -> str:
+    if profile["email"]:
+        return profile["email"]
+    if profile["name"] and profile["phone"]:
+        return f"{profile['name'].lower()}|{profile['phone']}"
+    return analysis_id
+
+
+def jd_key(analysis_id: str, job_title: str, company: str, profile: dict) -> str:
+    skills = ",".join(sorted(profile["must_have"] | profile["nice_to_have"]))
+    if not skills and not job_title:
+        return analysis_id
+    return hashlib.sha256(f"{job_title.lower()}|{company.lower()}|{skills}".encode("utf-8")).hexdigest()
+
+
+# One side of a user's index (resumes or JDs): a row per entry, skill -> rows
+# postings, and numeric columns (years, education level, skill counts) as
+# arrays rebuilt after changes. The same candidate or job saved by several
+# analyses is one row, holding the newest.
+class SideIndex:
+    def __init__(self, columns: tuple):
+        self.entries = []
+        self.rows = {}
+        self.postings = {}
+        self.column_names = columns
+        self._columns = None
+
+    def add(self, key: str, entry: dict, terms: set):
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = len(self.entries)
+            self.entries.append(entry)
+        else:
+            previous = self.entries[row]
+            if previous["analysis_id"] > entry["analysis_id"]:
+                return
+            for term in previous["terms"]:
+                self.postings[term].discard(row)
+            self.entries[row] = entry
+        entry["terms"] = terms
+        for term in terms:
+            self.postings.setdefault(term, set()).add(row)
+        self._columns = None
+
+    @property
+    def columns(self) -> dict:
+        if self._columns is None:
+            self._columns = {name: np.array([entry[name] for entry in self.entries], dtype=np.float64) for name in self.column_names}
+        return self._columns
+
+    def hits(self, terms: list) -> np.ndarray:
+        rows = [row for term in terms for row in self.postings.get(term, ())]
+        return np.bincount(np.array(rows, dtype=np.int64), minlength=len(self.entries))
+
+    def top(self, scores: np.ndarray, mask: np.ndarray, limit: int) -> list:
+        # Best scores first, newest analysis first among equal scores
+        rows = np.flatnonzero(mask)
+        if len(rows) > limit:
+            rows = rows[np.argpartition(-scores[rows], limit - 1)[:limit]]
+        return sorted((int(row) for row in rows), key=lambda row: (scores[row], self.entries[row]["analysis_id"]), reverse=True)
+
+
+class UserIndex:
+    def __init__(self):
+        self.resumes = SideIndex(("years", "education_level"))
+        self.jobs = SideIndex(("years", "education_level", "must_count", "nice_count"))
+        self.last_id = None
+        self.loaded_at = time.monotonic()
+        self.synced_at = None
+        self.lock = asyncio.Lock()
+
+    def add(self, document: dict):
+        analysis_id = document["_id"]
+        if document.get("compressed_fields") is not None:
+            document = {**document, **decompress_json(document["compressed_fields"])}
+
+        parsed_resume = document.get("parsed_resume") or {}
+        if parsed_resume:
+            profile = resume_profile(parsed_resume)
+            terms = {f"skill:{skill}" for skill in profile["skills"]} or {NO_SKILLS}
+            self.resumes.add(resume_key(str(analysis_id), profile), {"analysis_id": analysis_id, **profile}, terms)
+
+        parsed_jd = document.get("job_analysis") or {}
+        if parsed_jd:
+            profile = jd_profile(parsed_jd)
+            job_title, company = str(document.get("job_title") or ""), str(document.get("company") or "")
+            terms = {f"must:{skill}" for skill in profile["must_have"]} | {f"nice:{skill}" for skill in profile["nice_to_have"]}
+            entry = {
+                "analysis_id": analysis_id,
+                "job_title": job_title,
+                "company": company,
+                "must_count": len(profile["must_have"]),
+                "nice_count": len(profile["nice_to_have"]),
+                **profile,
+            }
+            self.jobs.add(jd_key(str(analysis_id), job_title, company, profile), entry, terms or {NO_SKILLS})
+
+
+# Per-user inverted indexes over stored analyses for "rank my resumes for this
+# JD" and "rank my JDs for this resume". A user's index is built from Mongo on
+# first use, then kept current by add() as analyses are saved and by reading
+# analyses newer than the last one seen (saved by other workers) at most every
+# SEARCH_INDEX_SYNC_SECONDS. It is rebuilt every SEARCH_INDEX_REFRESH_SECONDS
+# to drop deletions made elsewhere. A query counts skill hits from the
+# postings and scores every row in one vectorized pass; skill lists are only
+# built for the returned top results.
+class AnalysisSearchIndex:
+    def __init__(self, max_users: int = SEARCH_INDEX_MAX_USERS, refresh_seconds: float = SEARCH_INDEX_REFRESH_SECONDS, sync_seconds: float = SEARCH_INDEX_SYNC_SECONDS):
+        self.max_users = max_users
+        self.refresh_seconds = refresh_seconds
+        self.sync_seconds = sync_seconds
+        self._users = OrderedDict()
+
+    def add(self, analysis: Analysis):
+        """Indexes a just-saved analysis if its user's index is loaded; otherwise the next load picks it up."""
+        user = self._users.get(str(analysis.user_id))
+        if user is None or analysis.id is None:
+            return
+        try:
+            user.add({"_id": analysis.id, **analysis.model_dump(include=set(INDEXED_FIELDS))})
+        except Exception as e:
+            logger.warning("Search index update failed, dropping the user's index: %s", e)
+            self.invalidate(analysis.user_id)
+
+    def add_many(self, analyses: list):
+        for analysis in analyses:
+            self.add(analysis)
+
+    def invalidate(self, user_id):
+        self._users.pop(str(user_id), None)
+
+    async def user_index(self, user_id) -> UserIndex:
+        key = str(user_id)
+        user = self._users.get(key)
+        if user is None or time.monotonic() - user.loaded_at > self.refresh_seconds:
+            user = UserIndex()
+            self._users[key] = user
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        self._users.move_to_end(key)
+
+        # Only what was saved since the last read; add() may already have indexed some of it
+        async with user.lock:
+            if user.synced_at is not None and time.monotonic() - user.synced_at < self.sync_seconds:
+                return user
+            query = {"user_id": user_id}
+            if user.last_id is not None:
+                query["_id"] = {"$gt": user.last_id}
+            async for document in Analysis.get_pymongo_collection().find(query, INDEXED_FIELDS).sort("_id", 1):
+                user.add(document)
+                user.last_id = document["_id"]
+            user.synced_at = time.monotonic()
+        return user
+
+    async def rank_resumes(self, user_id, parsed_jd: dict, job_description: str = "", limit: int = 10, eligible_only: bool = False) -> dict:
+        user = await self.user_index(user_id)
+        side, jd = user.resumes, jd_profile(parsed_jd, job_description)
+        if not side.entries:
+            return {"indexed": 0, "considered": 0, "query": _public(jd), "results": []}
+
+        must_hits = side.hits([f"skill:{skill}" for skill in jd["must_have"]])
+        nice_hits = side.hits([f"skill:{skill}" for skill in jd["nice_to_have"]])
+        skills = skill_scores(must_hits, len(jd["must_have"]), nice_hits, len(jd["nice_to_have"]))
+        columns = side.columns
+        scores, eligible = pair_scores(skills, columns["years"], jd["years"], columns["education_level"], jd["education_level"])
+
+        # Resumes sharing no skill with a JD that lists some are not candidates
+        if jd["must_have"] or jd["nice_to_have"]:
+            mask = (must_hits + nice_hits > 0) | (side.hits([NO_SKILLS]) > 0)
+        else:
+            mask = np.ones(len(scores), dtype=bool)
+        if eligible_only:
+            mask &= eligible
+
+        results = []
+        for row in side.top(scores, mask, limit):
+            resume = side.entries[row]
+            results.append({
+                "analysis_id": str(resume["analysis_id"]),
+                "name": resume["name"],
+                "experience_years": resume["years"],
+                "education": resume["education"],
+                "score": int(scores[row]),
+                **pair_details(resume, jd),
+            })
+        return {"indexed": len(side.entries), "considered": int(mask.sum()), "query": _public(jd), "results": results}
+
+    async def rank_jobs(self, user_id, parsed_resume: dict, limit: int = 10, eligible_only: bool = False) -> dict:
+        user = await self.user_index(user_id)
+        side, resume = user.jobs, resume_profile(parsed_resume)
+        if not side.entries:
+            return {"indexed": 0, "considered": 0, "query": _public(resume), "results": []}
+
+        must_hits = side.hits([f"must:{skill}" for skill in resume["skills"]])
+        nice_hits = side.hits([f"nice:{skill}" for skill in resume["skills"]])
+        columns = side.columns
+        skills = skill_scores(must_hits, columns["must_count"], nice_hits, columns["nice_count"])
+        scores, eligible = pair_scores(skills, resume["years"], columns["years"], resume["education_level"], columns["education_level"])
+
+        # Every JD is a candidate: one no skill hits still ranks on experience and education
+        mask = eligible if eligible_only else np.ones(len(scores), dtype=bool)
+
+        results = []
+        for row in side.top(scores, mask, limit):
+            jd = side.entries[row]
+            results.append({
+                "analysis_id": str(jd["analysis_id"]),
+                "job_title": jd["job_title"],
+                "company": jd["company"],
+                "required_years": jd["years"],
+                "education": jd["education"],
+                "score": int(scores[row]),
+                **pair_details(resume, jd),
+            })
+        return {"indexed": len(side.entries), "considered": int(mask.sum()), "query": _public(resume), "results": results}
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._users),
+            "resumes": sum(len(user.resumes.entries) for user in self._users.values()),
+            "jobs": sum(len(user.jobs.entries) for user in self._users.values()),
+        }
+
+
+def _public(profile: dict) -> dict:
+    return {key: sorted(value) if isinstance(value, set) else value for key, value in profile.items() if key not in ("email", "phone")}
+
+
+search_index = AnalysisSearchIndex()
@@ -0,0 +1,326 @@
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from backend.config.main import SKILL_SIMILARITY_CUTOFF
+
+# Canonical skills by the resume parser's skill buckets, each with the
+# lower-cased aliases that should resolve to it
+TAXONOMY = {
+    "languages": {
+        "javascript": ["js", "ecmascript", "es6", "vanilla js"],
+        "typescript": ["ts"],
+        "python": ["py", "python3", "python 3"],
+        "java": ["java 8", "java 11", "java 17", "core java"],
+        "c": ["ansi c"],
+        "c++": ["cpp", "c plus plus"],
+        "c#": ["c sharp", "csharp"],
+        "go": ["golang"],
+        "rust": [],
+        "ruby": [],
+        "php": [],
+        "kotlin": [],
+        "swift": [],
+        "scala": [],
+        "r": ["r programming"],
+        "dart": [],
+        "sql": ["structured query language"],
+        "bash": ["shell scripting", "shell", "sh"],
+        "matlab": [],
+        "perl": [],
+        "elixir": [],
+        "haskell": [],
+        "lua": [],
+        "objective-c": ["objective c", "objc"],
+    },
+    "frontend": {
+        "react": ["react.js", "reactjs", "react js"],
+        "next.js": ["next", "nextjs", "next js"],
+        "vue": ["vue.js", "vuejs", "vue js"],
+        "nuxt.js": ["nuxt", "nuxtjs"],
+        "angular": ["angularjs", "angular.js", "angular js"],
+        "svelte": ["sveltekit"],
+        "html": ["html5"],
+        "css": ["css3"],
+        "sass": ["scss"],
+        "tailwind css": ["tailwind", "tailwindcss"],
+        "bootstrap": [],
+        "material ui": ["mui", "material-ui"],
+        "redux": ["redux toolkit", "rtk"],
+        "jquery": [],
+        "webpack": [],
+        "vite": [],
+        "react native": ["react-native"],
+        "flutter": [],
+        "three.js": ["threejs"],
+    },
+    "backend": {
+        "node.js": ["node", "nodejs", "node js"],
+        "express.js": ["express", "expressjs"],
+        "nest.js": ["nest", "nestjs"],
+        "django": ["django rest framework", "drf"],
+        "flask": [],
+        "fastapi": ["fast api"],
+        "spring": ["spring boot", "springboot", "spring framework"],
+        "ruby on rails": ["rails", "ror"],
+        "laravel": [],
+        "asp.net": ["asp.net core", ".net core", "dotnet", ".net"],
+        "graphql": ["graph ql"],
+        "grpc": [],
+        "celery": [],
+        "hibernate": [],
+        "gin": [],
+    },
+    "ai_ml": {
+        "machine learning": ["ml"],
+        "deep learning": ["dl"],
+        "artificial intelligence": ["ai"],
+        "natural language processing": ["nlp"],
+        "computer vision": ["cv"],
+        "large language models": ["llm", "llms"],
+        "generative ai": ["gen ai", "genai"],
+        "tensorflow": ["tf"],
+        "pytorch": ["torch"],
+        "keras": [],
+        "scikit-learn": ["sklearn", "scikit learn"],
+        "pandas": [],
+        "numpy": [],
+        "hugging face": ["huggingface", "hugging face transformers", "transformers"],
+        "langchain": [],
+        "langgraph": [],
+        "xgboost": [],
+        "spacy": [],
+        "mlops": ["ml ops"],
+        "data analysis": ["data analytics"],
+        "retrieval augmented generation": ["rag"],
+        "prompt engineering": [],
+    },
+    "databases": {
+        "postgresql": ["postgres", "psql", "postgre sql"],
+        "mysql": ["my sql"],
+        "mongodb": ["mongo", "mongo db"],
+        "redis": [],
+        "sqlite": [],
+        "sql server": ["ms sql", "mssql", "microsoft sql server"],
+        "oracle": ["oracle db", "oracle database"],
+        "dynamodb": ["dynamo db"],
+        "cassandra": [],
+        "elasticsearch": ["elastic search", "elastic"],
+        "firebase": ["firestore"],
+        "neo4j": [],
+        "mariadb": [],
+        "snowflake": [],
+        "bigquery": ["big query"],
+        "pinecone": [],
+    },
+    "tools_devops": {
+        "git": [],
+        "github": [],
+        "gitlab": [],
+        "github actions": [],
+        "docker": [],
+        "kubernetes": ["k8s"],
+        "aws": ["amazon web services"],
+        "gcp": ["google cloud", "google cloud platform"],
+        "azure": ["microsoft azure"],
+        "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery"],
+        "jenkins": [],
+        "terraform": [],
+        "ansible": [],
+        "linux": ["unix"],
+        "nginx": [],
+        "kafka": ["apache kafka"],
+        "rabbitmq": ["rabbit mq"],
+        "jira": [],
+        "postman": [],
+        "figma": [],
+        "vercel": [],
+        "heroku": [],
+        "prometheus": [],
+        "grafana": [],
+        "airflow": ["apache airflow"],
+        "spark": ["apache spark", "pyspark"],
+    },
+    "concepts": {
+        "rest apis": ["rest", "rest api", "restful apis", "restful api", "restful"],
+        "microservices": ["micro services", "micro-services", "microservice architecture"],
+        "object-oriented programming": ["oop", "oops", "object oriented programming"],
+        "data structures and algorithms": ["dsa", "data structures", "algorithms"],
+        "system design": [],
+        "agile": ["scrum", "agile methodologies"],
+        "test-driven development": ["tdd", "test driven development"],
+        "unit testing": [],
+        "design patterns": [],
+        "distributed systems": [],
+        "web sockets": ["websockets", "websocket"],
+        "authentication": [],
+        "serverless": [],
+        "cloud computing": [],
+        "devops": [],
+    },
+}
+
+# Lower-cased alias -> canonical skill name, and canonical skill -> bucket
+SKILL_ALIASES = {alias: skill for skills in TAXONOMY.values() for skill, aliases in skills.items() for alias in aliases}
+SKILL_CATEGORIES = {skill: category for category, skills in TAXONOMY.items() for skill in skills}
+
+# Hashed character n-grams: wide enough that collisions between the few
+# hundred taxonomy names stay rare, small enough to keep the matrix in cache
+FEATURE_DIM = 2 ** 12
+NGRAM_SIZES = (2, 3)
+# Words that are only skills when capitalized in free text ("Go", "REST", "Spring")
+AMBIGUOUS_IN_TEXT = {
+    "go", "r", "c", "rest", "next", "express", "spring", "swift", "gin", "shell", "sh", "elastic",
+    "cv", "ts", "tf", "dart", "rails", "nest", "node", "ai", "ml", "dl", "torch", "transformers",
+    "algorithms", "oracle", "vite", "figma", "snowflake", "spark", "rag",
+}
+TEXT_TOKEN = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#./-]*")
+MAX_SKILL_WORDS = 4
+# Trailing versions and parentheticals ("Vue 3", "Python 3.11", "Kubernetes (K8s)")
+QUALIFIER = re.compile(r"\s*\([^)]*\)$|\s+v?\d+(?:\.[\dx]+)*\+?$")
+
+
+def clean_skill(skill) -> str:
+    name = re.sub(r"\s+", " ", str(skill or "").strip().lower())
+    return name.strip(" .,;:-")
+
+
+@lru_cache(maxsize=16384)
+def _features(name: str) -> tuple:
+    padded = f" {name} "
+    grams = [padded[i:i + n] for n in NGRAM_SIZES for i in range(len(padded) - n + 1)]
+    return tuple(zlib.crc32(gram.encode("utf-8")) % FEATURE_DIM for gram in grams)
+
+
+def vectorize(names: list) -> np.ndarray:
+    """L2-normalized hashed n-gram counts, one float32 row per name."""
+    rows, columns = [], []
+    for row, name in enumerate(names):
+        features = _features(name)
+        rows.extend([row] * len(features))
+        columns.extend(features)
+    vectors = np.zeros((len(names), FEATURE_DIM), dtype=np.float32)
+    np.add.at(vectors, (rows, columns), 1.0)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+# The taxonomy precompiled into one matrix of canonical names and aliases.
+# Whole skill lists are resolved at once: exact alias lookups first, then a
+# single matrix product for everything spelled differently ("Postgre SQL",
+# "ReactJS 18"). Names below the cutoff are kept as written, uncategorized.
+# Resolutions are memoized, so stored analyses mostly cost dict lookups.
+class SkillIndex:
+    def __init__(self, taxonomy: dict = TAXONOMY, cutoff: float = SKILL_SIMILARITY_CUTOFF, cache_size: int = 65536):
+        self.cutoff = cutoff
+        self.cache_size = cache_size
+        self.lookup = {}
+        for category, skills in taxonomy.items():
+            for skill, aliases in skills.items():
+                for name in (skill, *aliases):
+                    self.lookup[name] = (skill, category)
+        self.names = list(self.lookup)
+        self.matrix = vectorize(self.names)
+        self.rows = {name: row for row, name in enumerate(self.names)}
+        self._resolved = {}
+
+    def _resolve(self, skills: list) -> dict:
+        names = [clean_skill(skill) for skill in skills]
+        names = [name if name in self.lookup else QUALIFIER.sub("", name) or name for name in names]
+        resolved, unknown = {}, []
+        for skill, name in zip(skills, names):
+            if name in self.lookup:
+                resolved[skill] = (*self.lookup[name], 1.0)
+            elif name:
+                unknown.append((skill, name))
+            else:
+                resolved[skill] = ("", None, 0.0)
+
+        if unknown:
+            vectors = vectorize([name for _, name in unknown])
+            similarity = vectors @ self.matrix.T
+            best = similarity.argmax(axis=1)
+            for (skill, name), row, score in zip(unknown, best, similarity[np.arange(len(unknown)), best]):
+                if score >= self.cutoff:
+                    resolved[skill] = (*self.lookup[self.names[row]], float(score))
+                else:
+                    resolved[skill] = (name, None, float(score))
+
+        if len(self._resolved) + len(resolved) > self.cache_size:
+            self._resolved.clear()
+        self._resolved.update(resolved)
+        return resolved
+
+    def normalize(self, skills: list) -> list:
+        """(canonical, category, similarity) for each skill, in order."""
+        # Read from a local copy: resolving the pending skills may clear the cache
+        resolved = {skill: self._resolved[skill] for skill in skills if skill in self._resolved}
+        pending = list({skill for skill in skills if skill not in resolved})
+        if pending:
+            resolved.update(self._resolve(pending))
+        return [resolved[skill] for skill in skills]
+
+    def vectors(self, names: list) -> np.ndarray:
+        # Dense rows are 16 KB each, so only the sparse n-grams (_features) are
+        # memoized and rows outside the taxonomy are rebuilt for every call
+        unknown = [name for name in names if name not in self.rows]
+        built = dict(zip(unknown, vectorize(unknown))) if unknown else {}
+        return np.stack([self.matrix[self.rows[name]] if name in self.rows else built[name] for name in names])
+
+    def canonical(self, skills: list) -> list:
+        return [skill for skill, _, _ in self.normalize(skills)]
+
+    def categorize(self, skills: list) -> dict:
+        buckets = {category: [] for category in TAXONOMY}
+        buckets["other"] = []
+        for skill, category, _ in self.normalize(skills):
+            bucket = buckets[category or "other"]
+            if skill and skill not in bucket:
+                bucket.append(skill)
+        return buckets
+
+    def extract(self, text: str) -> list:
+        """Canonical taxonomy skills mentioned in free text, longest phrase first, in order of appearance."""
+        tokens = TEXT_TOKEN.findall(text or "")
+        found, i = [], 0
+        while i < len(tokens):
+            for size in range(min(MAX_SKILL_WORDS, len(tokens) - i), 0, -1):
+                name = clean_skill(" ".join(tokens[i:i + size]))
+                if name in self.lookup and not (name in AMBIGUOUS_IN_TEXT and tokens[i].islower()):
+                    skill = self.lookup[name][0]
+                    if skill not in found:
+                        found.append(skill)
+                    i += size
+                    break
+            else:
+                i += 1
+        return found
+
+    def match(self, required: list, candidate: list) -> tuple:
+        """Splits required skills into (matched, missing) against the candidate's skills."""
+        required = [skill for skill in required if clean_skill(skill)]
+        wanted = self.normalize(required)
+        have = {skill: category for skill, category, _ in self.normalize(candidate) if skill}
+        found = [skill in have for skill, _, _ in wanted]
+
+        # Two different taxonomy skills never match; only names the taxonomy
+        # does not know are compared by spelling
+        pending = [i for i, hit in enumerate(found) if not hit]
+        if any(wanted[i][1] is None for i in pending):
+            targets = list(have)
+        else:
+            targets = [skill for skill, category in have.items() if category is None]
+        if pending and targets:
+            similarity = self.vectors([wanted[i][0] for i in pending]) @ self.vectors(targets).T
+            comparable = np.array([[wanted[i][1] is None or have[skill] is None for skill in targets] for i in pending])
+            for row, i in enumerate(pending):
+                found[i] = bool((similarity[row][comparable[row]] >= self.cutoff).any())
+
+        matched = [skill for skill, hit in zip(required, found) if hit]
+        missing = [skill for skill, hit in zip(required, found) if not hit]
+        return matched, missing
+
+
+skill_index = SkillIndex()
@@ -0,0 +1,98 @@
+import contextvars
+
+from backend.config.main import GEMINI_INPUT_COST_PER_MTOK, GEMINI_OUTPUT_COST_PER_MTOK
+from backend.utils.metrics import PHASE_OBSERVERS, gemini_tokens_total
+
+# The telemetry of the analysis running in the current task. Graph nodes run in
+# tasks copied from the request's context, so they all see the same record.
+_current = contextvars.ContextVar("analysis_telemetry", default=None)
+
+
+def llm_cost(input_tokens: int, output_tokens: int) -> float:
+    return (input_tokens * GEMINI_INPUT_COST_PER_MTOK + output_tokens * GEMINI_OUTPUT_COST_PER_MTOK) / 1_000_000
+
+
+# Per-analysis accounting of Gemini calls by graph node, plus the duration of
+# every timed phase (upload read, extraction, nodes). summary() is what gets
+# stored on Analysis.telemetry.
+class AnalysisTelemetry:
+    def __init__(self):
+        self.nodes = {}
+        self.phases = {}
+
+    def node(self, name: str = None) -> dict:
+        return self.nodes.setdefault(name or "unknown", {
+            "calls": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "estimated_tokens": False,
+            "llm_seconds": 0.0,
+            "retries": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+        })
+
+    def summary(self) -> dict:
+        nodes = {}
+        for name, stats in self.nodes.items():
+            nodes[name] = {
+                **{key: value for key, value in stats.items() if key != "llm_seconds"},
+                "llm_ms": round(stats["llm_seconds"] * 1000, 1),
+                "cost_usd": round(llm_cost(stats["input_tokens"], stats["output_tokens"]), 6),
+            }
+        totals = {
+            key: sum(stats[key] for stats in nodes.values())
+            for key in ("calls", "input_tokens", "output_tokens", "retries", "cache_hits", "cache_misses")
+        }
+        totals["llm_ms"] = round(sum(stats["llm_ms"] for stats in nodes.values()), 1)
+        totals["cost_usd"] = round(sum(stats["cost_usd"] for stats in nodes.values()), 6)
+        return {
+            "nodes": nodes,
+            "phases_ms": {phase: round(seconds * 1000, 1) for phase, seconds in self.phases.items()},
+            "totals": totals,
+        }
+
+
+def start_telemetry(telemetry: AnalysisTelemetry = None) -> AnalysisTelemetry:
+    telemetry = telemetry or AnalysisTelemetry()
+    _current.set(telemetry)
+    return telemetry
+
+
+def current_telemetry():
+    return _current.get()
+
+
+def record_llm_call(node: str, input_tokens: int, output_tokens: int, seconds: float, estimated: bool = False):
+    gemini_tokens_total.inc(input_tokens, node=node or "unknown", direction="input")
+    gemini_tokens_total.inc(output_tokens, node=node or "unknown", direction="output")
+    telemetry = _current.get()
+    if telemetry is None:
+        return
+    stats = telemetry.node(node)
+    stats["calls"] += 1
+    stats["input_tokens"] += input_tokens
+    stats["output_tokens"] += output_tokens
+    stats["llm_seconds"] += seconds
+    stats["estimated_tokens"] = stats["estimated_tokens"] or estimated
+
+
+def record_retry(node: str):
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.node(node)["retries"] += 1
+
+
+def record_cache(node: str, hit: bool):
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.node(node)["cache_hits" if hit else "cache_misses"] += 1
+
+
+def record_phase(phase: str, seconds: float):
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.phases[phase] = telemetry.phases.get(phase, 0.0) + seconds
+
+
+PHASE_OBSERVERS.append(record_phase)
@@ -0,0 +1,205 @@
+import logging
+import re
+import unicodedata
+from collections import Counter
+
+from backend.config.main import JD_MAX_TOKENS, RESUME_MAX_TOKENS, TEXT_NORMALIZATION
+from backend.utils.metrics import input_text_tokens
+from backend.utils.prompt_compactor import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+PAGE_NUMBER = re.compile(r"^(?:page\s*)?[-–—(]?\s*\d{1,3}\s*(?:(?:of|/)\s*\d{1,3})?\s*[-–—)]?$", re.IGNORECASE)
+HYPHEN_BREAK = re.compile(r"(\w)-\n(?=[a-z])")
+SPACES = re.compile(r"[ \t]+")
+BULLET = re.compile(r"^[•●▪◦■►‣∙·*]\s*")
+
+# Whole lines that are boilerplate on their own
+BOILERPLATE = {
+    "resume": [
+        re.compile(r"^(?:curriculum vitae|resume|résumé|cv)$", re.IGNORECASE),
+        re.compile(r"^references? (?:are )?(?:available )?(?:up)?on request\.?$", re.IGNORECASE),
+    ],
+    "jd": [
+        re.compile(r"^(?:apply now|click (?:here )?to apply|share this job|save job)\.?$", re.IGNORECASE),
+    ],
+}
+# Boilerplate sentences; only the sentence is dropped, since pasted JDs are often one paragraph
+BOILERPLATE_SENTENCES = {
+    "resume": [
+        re.compile(r"^i hereby declare\b", re.IGNORECASE),
+    ],
+    "jd": [
+        re.compile(r"\bequal (?:employment )?opportunity employer\b", re.IGNORECASE),
+        re.compile(r"\bwithout regard to (?:race|age|color|religion)\b", re.IGNORECASE),
+    ],
+}
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+# Section headings and how much each section is worth keeping when the text
+# is over budget; sections with the lowest priority are shortened first.
+SECTIONS = {
+    "resume": {
+        "summary": (("summary", "profile", "objective", "about me"), 1),
+        "skills": (("skills", "technical skills", "core competencies", "technologies"), 5),
+        "experience": (("experience", "work experience", "professional experience", "employment history"), 4),
+        "education": (("education", "academic background"), 4),
+        "projects": (("projects", "personal projects", "academic projects"), 2),
+        "certifications": (("certifications", "certificates", "awards", "achievements"), 2),
+        "other": (("interests", "hobbies", "languages known", "references", "declaration", "activities"), 0),
+    },
+    "jd": {
+        "about": (("about us", "about the company", "who we are", "our mission", "company overview"), 0),
+        "responsibilities": (("responsibilities", "what you will do", "what you'll do", "the role", "duties"), 3),
+        "requirements": (("requirements", "qualifications", "must have", "what you bring", "who you are", "skills"), 5),
+        "preferred": (("nice to have", "preferred qualifications", "bonus points", "preferred"), 4),
+        "benefits": (("benefits", "perks", "what we offer", "compensation"), 0),
+    },
+}
+PREAMBLE_PRIORITY = 5
+MIN_SECTION_LINES = 2
+# A short line repeated within PAGE_EDGE_LINES of the top or bottom of at least
+# HEADER_PAGES pages is a running header/footer (name, title, "Confidential").
+# Pages end at form feeds (PDF extraction) and at page-number lines.
+PAGE_BREAK = "\f"
+PAGE_EDGE_LINES = 2
+HEADER_PAGES = 2
+SHORT_LINE_CHARS = 25
+
+
+def _page_edges(lines: list) -> list:
+    """Flags the first and last PAGE_EDGE_LINES non-blank lines of each page."""
+    edges = [False] * len(lines)
+    page = []
+    for index, line in enumerate(lines + [None]):
+        if line is not None and not PAGE_NUMBER.match(line):
+            page.append(index)
+            continue
+        content = [i for i in page if lines[i]]
+        for i in content[:PAGE_EDGE_LINES] + content[-PAGE_EDGE_LINES:]:
+            edges[i] = True
+        page = []
+    return edges
+
+
+def _drop_boilerplate_sentences(line: str, kind: str, stats: dict) -> str:
+    sentences = SENTENCE_BREAK.split(line)
+    kept = [sentence for sentence in sentences if not any(pattern.search(sentence) for pattern in BOILERPLATE_SENTENCES[kind])]
+    if len(kept) == len(sentences):
+        return line
+    stats["boilerplate_lines"] += 1
+    return " ".join(kept)
+
+
+def _clean_lines(text: str, kind: str, stats: dict) -> list:
+    text = unicodedata.normalize("NFKC", text).replace("\r\n", "\n").replace("\r", "\n")
+    text = "".join(char for char in text if char in "\n\t\f" or unicodedata.category(char)[0] != "C")
+    text = HYPHEN_BREAK.sub(r"\1", text)
+
+    lines, edges = [], []
+    for page in text.split(PAGE_BREAK):
+        page_lines = [BULLET.sub("- ", SPACES.sub(" ", line).strip()) for line in page.split("\n")]
+        lines += page_lines
+        edges += _page_edges(page_lines)
+    edge_counts = Counter(line.lower() for line, edge in zip(lines, edges) if line and edge)
+    seen = set()
+    cleaned = []
+    for line, edge in zip(lines, edges):
+        if not line:
+            # Runs of blank lines collapse to one
+            if cleaned and cleaned[-1]:
+                cleaned.append("")
+            continue
+        if PAGE_NUMBER.match(line) or any(pattern.match(line) for pattern in BOILERPLATE[kind]):
+            stats["boilerplate_lines"] += 1
+            continue
+        line = _drop_boilerplate_sentences(line, kind, stats)
+        if not line:
+            continue
+        key = line.lower()
+        if key in seen and (len(line) >= SHORT_LINE_CHARS or (edge and edge_counts[key] >= HEADER_PAGES)):
+            stats["duplicate_lines"] += 1
+            continue
+        seen.add(key)
+        cleaned.append(line)
+    return cleaned[:-1] if cleaned and not cleaned[-1] else cleaned
+
+
+def _heading(line: str, kind: str):
+    label = line.strip(" :-").lower()
+    if len(label) > 40:
+        return None
+    for section, (headings, priority) in SECTIONS[kind].items():
+        if label in headings:
+            return section, priority
+    return None
+
+
+def split_sections(lines: list, kind: str) -> list:
+    """Splits lines at known headings into [name, priority, lines] blocks, in order."""
+    sections = [["preamble", PREAMBLE_PRIORITY, []]]
+    for line in lines:
+        heading = _heading(line, kind)
+        if heading:
+            sections.append([heading[0], heading[1], [line]])
+        else:
+            sections[-1][2].append(line)
+    return [section for section in sections if section[2]]
+
+
+def _render(sections: list) -> str:
+    return "\n".join(line for _, _, lines in sections for line in lines).strip()
+
+
+def _truncate(sections: list, max_tokens: int) -> list:
+    # Lowest priority first, larger sections before smaller ones of the same
+    # priority; each section keeps its heading and first lines for as long as
+    # anything else can give way. Length is tracked as lines are dropped
+    # rather than re-rendering the text after every line.
+    length = len(_render(sections))
+    order = sorted(range(len(sections)), key=lambda index: (sections[index][1], -len(sections[index][2])))
+    for floor in (MIN_SECTION_LINES, 0):
+        for index in order:
+            lines = sections[index][2]
+            while len(lines) > floor and (length + 3) // 4 > max_tokens:
+                length -= len(lines.pop()) + 1
+    # A heading whose lines were all cut is not worth sending
+    return [section for section in sections if section[0] == "preamble" or len(section[2]) > 1]
+
+
+def normalize_text(text: str, kind: str, max_tokens: int = None) -> tuple:
+    """Normalizes resume ("resume") or job description ("jd") text for the prompts.
+
+    Fixes unicode and hyphenation, collapses whitespace, drops page numbers,
+    boilerplate and repeated lines, then shortens the least important sections
+    until the text fits ``max_tokens`` (0 disables the budget). Returns the
+    text and a stats dict with the before/after token estimates.
+    """
+    text = text or ""
+    max_tokens = (RESUME_MAX_TOKENS if kind == "resume" else JD_MAX_TOKENS) if max_tokens is None else max_tokens
+    stats = {"tokens_before": estimate_tokens(text), "duplicate_lines": 0, "boilerplate_lines": 0, "truncated": False}
+
+    sections = split_sections(_clean_lines(text, kind, stats), kind)
+    if max_tokens > 0 and estimate_tokens(_render(sections)) > max_tokens:
+        sections = _truncate(sections, max_tokens)
+        stats["truncated"] = True
+
+    normalized = _render(sections)
+    if max_tokens > 0 and estimate_tokens(normalized) > max_tokens:
+        normalized = normalized[:max_tokens * 4].rstrip()
+
+    stats["tokens_after"] = estimate_tokens(normalized)
+    stats["tokens_saved"] = stats["tokens_before"] - stats["tokens_after"]
+    input_text_tokens.observe(stats["tokens_before"], kind=kind, stage="raw")
+    input_text_tokens.observe(stats["tokens_after"], kind=kind, stage="normalized")
+    logger.info(f"{kind} text: ~{stats['tokens_before']} -> ~{stats['tokens_after']} tokens (budget {max_tokens})")
+    return normalized, stats
+
+
+def normalize_inputs(resume_text: str, job_description: str) -> tuple:
+    """Returns (resume_text, job_description, input_stats); a no-op when TEXT_NORMALIZATION is off."""
+    if not TEXT_NORMALIZATION:
+        return resume_text, job_description, {}
+    resume_text, resume_stats = normalize_text(resume_text, "resume")
+    job_description, jd_stats = normalize_text(job_description, "jd")
+    return resume_text, job_description, {"resume": resume_stats, "jd": jd_stats}
@@ -0,0 +1,181 @@
+"""Storage size and read throughput of plain vs compressed Analysis documents.
+
+Builds synthetic stored analyses shaped like real ones (parsed resume with
+experience bullets and projects, parsed JD, match analysis, input texts) and compares:
+
+* BSON document size, plain vs ANALYSIS_COMPRESSION
+* list reads  - BSON decode of the page as the list endpoint returns it
+  (compressed documents are never expanded here)
+* detail reads - BSON decode plus decompression of one report
+
+With ``--mongo-uri`` the same documents are also written to two scratch
+collections on a live server and collStats sizes and read rates are reported.
+
+    python -m benchmarks.analysis_storage --documents 2000
+    python -m benchmarks.analysis_storage --documents 2000 --mongo-uri mongodb://localhost:27017
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import bson
+from bson import Binary, ObjectId
+
+from backend.llm.fake import DEFAULT_RESPONSES
+from backend.models.Analysis import HEAVY_FIELDS, list_view
+from backend.utils.compression import compress_json, decompress_json
+from benchmarks.fixtures import COMPANIES, JOB_DESCRIPTION, ROLES, SKILLS, resume_lines
+
+VERBS = ["Built", "Designed", "Migrated", "Optimized", "Led", "Automated", "Scaled", "Refactored"]
+
+
+def synthetic_analysis(seed: int, user_id: ObjectId) -> dict:
+    rng = random.Random(seed)
+    experience = [
+        {
+            "role": rng.choice(ROLES),
+            "company": rng.choice(COMPANIES),
+            "duration": f"{2024 - 2 * i - 2} - {2024 - 2 * i}",
+            "achievements": [
+                f"{rng.choice(VERBS)} {rng.choice(SKILLS)} services handling {rng.randint(1, 900)}k requests per day "
+                f"while cutting p95 latency by {rng.randint(5, 60)}% across {rng.randint(2, 40)} teams"
+                for _ in range(rng.randint(3, 7))
+            ],
+        }
+        for i in range(rng.randint(2, 6))
+    ]
+    parsed_resume = {
+        **DEFAULT_RESPONSES["RESUME PARSING ASSISTANT"],
+        "skills": {bucket: rng.sample(SKILLS, rng.randint(2, 6)) for bucket in ("languages", "backend", "databases", "tools_devops", "concepts")},
+        "work_experience": experience,
+        "certifications_and_projects": {
+            "projects": [
+                {"name": f"Project {i}", "technologies": rng.sample(SKILLS, 4), "description": "Internal platform for " + rng.choice(ROLES).lower() + "s", "achievements": []}
+                for i in range(rng.randint(1, 4))
+            ],
+            "certifications": [],
+        },
+    }
+    return {
+        "_id": ObjectId(),
+        "user_id": user_id,
+        "company": rng.choice(COMPANIES),
+        "job_title": rng.choice(ROLES),
+        "match_percentage": rng.randint(20, 95),
+        "match_analysis": {
+            "overall_match_percentage": rng.randint(20, 95),
+            "skill_match": {"matched": rng.sample(SKILLS, 4), "missing": rng.sample(SKILLS, 2)},
+            "experience_level": "match",
+            "education_alignment": "match",
+            "detailed_breakdown": {key: "Explanation of the " + key + " score " * 4 for key in ("skills", "experience", "education", "soft_skills")},
+        },
+        "parsed_resume": parsed_resume,
+        "job_analysis": DEFAULT_RESPONSES["JOB DESCRIPTION ANALYSIS ASSISTANT"],
+        "recommendations": DEFAULT_RESPONSES["RESUME IMPROVEMENT RECOMMENDATIONS ASSISTANT"],
+        "input_texts": {"resume": "\n".join(resume_lines(seed)), "jd": JOB_DESCRIPTION},
+        "compressed_fields": None,
+    }
+
+
+def compressed(document: dict, level: int) -> dict:
+    fields = {field: document[field] for field in HEAVY_FIELDS}
+    return {**document, **list_view(fields), "compressed_fields": Binary(compress_json(fields, level))}
+
+
+def rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1)
+
+
+def offline(plain: list, packed: list, page_size: int) -> dict:
+    plain_bson = [bson.encode(document) for document in plain]
+    packed_bson = [bson.encode(document) for document in packed]
+
+    def list_reads(encoded):
+        started = time.perf_counter()
+        for document in encoded:
+            decoded = bson.decode(document)
+            decoded.pop("compressed_fields", None)
+        return rate(len(encoded), time.perf_counter() - started)
+
+    def detail_reads(encoded):
+        started = time.perf_counter()
+        for document in encoded:
+            decoded = bson.decode(document)
+            if decoded.get("compressed_fields") is not None:
+                decoded.update(decompress_json(decoded.pop("compressed_fields")))
+        return rate(len(encoded), time.perf_counter() - started)
+
+    plain_bytes, packed_bytes = sum(map(len, plain_bson)), sum(map(len, packed_bson))
+    return {
+        "avg_document_bytes": {"plain": plain_bytes // len(plain), "compressed": packed_bytes // len(packed)},
+        "size_ratio": round(plain_bytes / packed_bytes, 2),
+        "list_page_bytes": {"plain": plain_bytes * page_size // len(plain), "compressed": packed_bytes * page_size // len(packed)},
+        "list_decode_docs_per_s": {"plain": list_reads(plain_bson), "compressed": list_reads(packed_bson)},
+        "detail_decode_docs_per_s": {"plain": detail_reads(plain_bson), "compressed": detail_reads(packed_bson)},
+    }
+
+
+async def live(mongo_uri: str, plain: list, packed: list, page_size: int) -> dict:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(mongo_uri)
+    database = client["jd-analyzer-benchmark"]
+    report = {}
+    try:
+        for name, documents in (("plain", plain), ("compressed", packed)):
+            collection = database[f"Analysis_{name}"]
+            await collection.drop()
+            await collection.insert_many(documents)
+            stats = await database.command("collStats", collection.name)
+
+            user_id = documents[0]["user_id"]
+            pages = len(documents) // page_size
+            started = time.perf_counter()
+            last_id = None
+            for _ in range(pages):
+                query = {"user_id": user_id, **({"_id": {"$lt": last_id}} if last_id else {})}
+                page = await collection.find(query, {"compressed_fields": 0}).sort("_id", -1).limit(page_size).to_list(length=page_size)
+                last_id = page[-1]["_id"]
+            list_elapsed = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for document in documents[:500]:
+                stored = await collection.find_one({"_id": document["_id"]})
+                if stored.get("compressed_fields") is not None:
+                    stored.update(decompress_json(stored.pop("compressed_fields")))
+            detail_elapsed = time.perf_counter() - started
+
+            report[name] = {
+                "size_bytes": stats["size"],
+                "storage_bytes": stats["storageSize"],
+                "list_docs_per_s": rate(pages * page_size, list_elapsed),
+                "detail_reads_per_s": rate(min(500, len(documents)), detail_elapsed),
+            }
+            await collection.drop()
+    finally:
+        client.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--level", type=int, default=3)
+    parser.add_argument("--mongo-uri", default=None)
+    args = parser.parse_args()
+
+    user_id = ObjectId()
+    plain = [synthetic_analysis(seed, user_id) for seed in range(args.documents)]
+    packed = [compressed(document, args.level) for document in plain]
+
+    report = {"documents": args.documents, "zstd_level": args.level, "offline": offline(plain, packed, args.page_size)}
+    if args.mongo_uri:
+        report["mongo"] = asyncio.run(live(args.mongo_uri, plain, packed, args.page_size))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark of per-request analyzer setup cost.
+
+Compares building a fresh ``JDResumeAnalyzer`` (new ``genai.Client``, new HTTP
+connection pools, recompiled graphs) for every request with reusing the one
+built at startup. The LLM is the zero-latency fake, so the numbers isolate the
+service's own overhead. Connection reuse to the real API (TLS handshakes) is on
+top of what is measured here.
+
+    python -m benchmarks.analyzer_overhead --requests 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.state import create_initial_state
+from backend.llm.fake import FakeGeminiClient
+from backend.llm.gemini import GeminiClient
+from backend.utils.parse_cache import ParseCache
+
+
+def summarize(samples: list) -> dict:
+    samples = sorted(samples)
+    return {
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "p50_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1] * 1000, 3),
+        "p99_ms": round(samples[max(0, int(len(samples) * 0.99) - 1)] * 1000, 3),
+    }
+
+
+async def per_request(requests: int) -> list:
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        gemini_client = GeminiClient()
+        analyzer = JDResumeAnalyzer(gemini_client=gemini_client, parse_cache=ParseCache(max_size=0))
+        # Swap in the fake so nothing leaves the process; setup cost is already paid
+        analyzer.gemini_client = FakeGeminiClient(latency=0)
+        await analyzer.workflow.ainvoke(create_initial_state("resume", "job description"))
+        await gemini_client.aclose()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def shared(requests: int) -> list:
+    analyzer = JDResumeAnalyzer(gemini_client=FakeGeminiClient(latency=0), parse_cache=ParseCache(max_size=0))
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await analyzer.workflow.ainvoke(create_initial_state("resume", "job description"))
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    before = asyncio.run(per_request(args.requests))
+    after = asyncio.run(shared(args.requests))
+
+    report = {
+        "requests": args.requests,
+        "per_request_analyzer": summarize(before),
+        "shared_analyzer": summarize(after),
+        "overhead_saved_ms": round((statistics.mean(before) - statistics.mean(after)) * 1000, 3),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
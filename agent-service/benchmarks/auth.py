@@ -0,0 +1,76 @@
+"""Micro-benchmark of per-request JWT verification cost.
+
+Signs an RS256 token with a throwaway key pair and verifies it repeatedly:
+
+``per_request``   - the previous behaviour: load the PEM, re-serialize it and
+                    let jose parse it again on every call
+``prepared_key``  - the key prepared once by ``load_public_key``, no cache
+``cached``        - ``verify_jwt_token`` with the verified-token cache
+
+    python -m benchmarks.auth --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from backend.utils import jwt as auth
+from benchmarks.analyzer_overhead import summarize
+
+
+def make_token() -> tuple:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    payload = {"_id": "64b7f0c2a1b2c3d4e5f60718", "email": "jane@example.com", "exp": int(time.time()) + 3600}
+    return jwt.encode(payload, private_pem.decode(), algorithm="RS256"), public_pem
+
+
+def legacy_verify(token: str, public_pem: bytes) -> dict:
+    public_key = serialization.load_pem_public_key(public_pem, backend=default_backend())
+    pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return jwt.decode(token, pem.decode("utf-8"), algorithms=["RS256"])
+
+
+def measure(verify, requests: int) -> dict:
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        verify()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    token, public_pem = make_token()
+    key = auth.load_public_key(public_pem)
+    auth.token_cache.clear()
+    loop = asyncio.new_event_loop()
+
+    report = {
+        "requests": args.requests,
+        "per_request": measure(lambda: legacy_verify(token, public_pem), args.requests),
+        "prepared_key": measure(lambda: jwt.decode(token, key, algorithms=["RS256"]), args.requests),
+        "cached": measure(lambda: loop.run_until_complete(auth.verify_jwt_token(token)), args.requests),
+    }
+    loop.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of resume text extraction over a synthetic corpus.
+
+``inline``  - the previous behaviour: PyPDF2/python-docx run on the event loop
+              and text is built with repeated ``+=``, no page cap.
+``pooled``  - ``extract_resume_text_async``: process pool, per-page fan-out for
+              large PDFs, page/byte caps, DOCX tables included.
+
+Event-loop lag is sampled during each run; it is what other requests on the
+same worker wait for.
+
+    python -m benchmarks.extraction --count 40 --max-pages 40
+"""
+import argparse
+import asyncio
+import io
+import json
+import time
+
+import PyPDF2
+from docx import Document
+
+from backend.config.main import EXTRACTION_WORKERS
+from backend.utils.reuseable_functions import extract_resume_text_async, shutdown_extraction_pool, warm_extraction_pool
+from benchmarks.fixtures import resume_corpus
+from benchmarks.load_test_async import probe_loop_lag
+
+
+def legacy_extract(filename: str, file_content: bytes) -> str:
+    text = ""
+    if filename.endswith(".pdf"):
+        for page in PyPDF2.PdfReader(io.BytesIO(file_content)).pages:
+            text += page.extract_text() + "\n"
+    else:
+        for paragraph in Document(io.BytesIO(file_content)).paragraphs:
+            text += paragraph.text + "\n"
+    return text
+
+
+async def run_inline(corpus: list) -> dict:
+    async def extract(filename, content):
+        return legacy_extract(filename, content)
+
+    return await measure(corpus, extract)
+
+
+async def run_pooled(corpus: list) -> dict:
+    await warm_extraction_pool()
+    try:
+        return await measure(corpus, extract_resume_text_async)
+    finally:
+        shutdown_extraction_pool()
+
+
+async def measure(corpus: list, extract) -> dict:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    texts = await asyncio.gather(*(extract(filename, content) for filename, content in corpus))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    return {
+        "files": len(corpus),
+        "wall_time_s": round(elapsed, 3),
+        "files_per_s": round(len(corpus) / elapsed, 1),
+        "characters": sum(len(text) for text in texts),
+        "max_event_loop_lag_ms": round(await probe * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=40)
+    parser.add_argument("--max-pages", type=int, default=40)
+    args = parser.parse_args()
+
+    corpus = resume_corpus(count=args.count, max_pages=args.max_pages)
+    report = {
+        "corpus_bytes": sum(len(content) for _, content in corpus),
+        "extraction_workers": EXTRACTION_WORKERS,
+        "inline": asyncio.run(run_inline(corpus)),
+        "pooled": asyncio.run(run_pooled(corpus)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Synthetic resume and job-description fixtures for the offline benchmarks.
+
+PDFs are written by hand (one Helvetica text stream per page) so no PDF
+authoring library is needed; PyPDF2 extracts them like ordinary text PDFs.
+"""
+import io
+import random
+
+from docx import Document
+
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Diego", "Elif", "Farah", "Goran", "Hana", "Ivan", "Jia"]
+LAST_NAMES = ["Kumar", "Lopez", "Meyer", "Nakamura", "Okafor", "Petrov", "Quinn", "Rossi", "Singh", "Tanaka"]
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "FastAPI", "Django", "PostgreSQL",
+    "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "GCP", "Terraform", "GraphQL", "Kafka", "Go",
+]
+ROLES = ["Software Engineer", "Backend Developer", "Full Stack Engineer", "Data Engineer", "Platform Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+
+JOB_DESCRIPTION = """Backend Engineer
+We are hiring a Backend Engineer with 3+ years of professional experience.
+Must have: Python, FastAPI, MongoDB, REST APIs.
+Nice to have: Docker, Kubernetes, AWS.
+Bachelor's degree in Computer Science or a related field required.
+Strong communication and teamwork skills.
+Full-time, remote friendly."""
+
+
+def resume_lines(seed: int, pages: int = 1) -> list:
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | +1 555 010 {seed % 10000:04d}",
+        "SKILLS",
+        ", ".join(rng.sample(SKILLS, 8)),
+        "EXPERIENCE",
+    ]
+    year = 2024
+    # Roughly 40 lines per page
+    while len(lines) < pages * 40:
+        start = year - rng.randint(1, 3)
+        lines.append(f"{rng.choice(ROLES)} - {rng.choice(COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- Built {rng.choice(SKILLS)} services handling {rng.randint(1, 900)}k requests per day")
+        year = start
+    lines += ["EDUCATION", "Bachelor of Technology in Computer Science, State University (2014 - 2018)"]
+    return lines
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(lines: list, lines_per_page: int = 40) -> bytes:
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>".encode(),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, page_lines in zip(page_ids, pages):
+        text = "BT /F1 10 Tf 14 TL 50 790 Td " + " ".join(f"({_escape(line)}) Tj T*" for line in page_lines) + " ET"
+        stream = text.encode("latin-1", "replace")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode()
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = out.tell()
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+
+    xref_offset = out.tell()
+    size = max(objects) + 1
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+    for object_id in range(1, size):
+        out.write(b"%010d 00000 n \n" % offsets[object_id])
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+    return out.getvalue()
+
+
+def make_docx(lines: list, with_table: bool = True) -> bytes:
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    if with_table:
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text, table.cell(0, 1).text = "Certification", "Year"
+        table.cell(1, 0).text, table.cell(1, 1).text = "AWS Certified Developer", "2022"
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def resume_corpus(count: int = 40, max_pages: int = 40, seed: int = 7) -> list:
+    """Returns (filename, bytes) pairs: mostly short PDFs, some long PDFs and DOCX files."""
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(count):
+        if index % 5 == 4:
+            corpus.append((f"resume_{index}.docx", make_docx(resume_lines(index, pages=rng.randint(1, 3)))))
+        else:
+            pages = rng.choice([1, 1, 2, 2, 3, max_pages])
+            corpus.append((f"resume_{index}.pdf", make_pdf(resume_lines(index, pages=pages))))
+    return corpus
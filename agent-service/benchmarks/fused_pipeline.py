@@ -0,0 +1,157 @@
+"""Latency, token and output-agreement comparison of the two pipeline modes.
+
+Runs the same resumes against the fixture job description through
+
+* ``graph`` - resume parser and JD analyzer in parallel, then matcher and
+  recommender (four Gemini calls with ``--match-mode explain``)
+* ``fused`` - one Gemini call returning the whole analysis
+
+and reports per-analysis latency, Gemini calls, estimated input/output tokens
+and how closely the fused results agree with the graph results (match score
+difference, Jaccard similarity of skill sets and recommendation wording).
+
+Offline, the fake client's latency grows with the size of its answer
+(``--ttft`` plus ``--per-output-token`` per estimated token), so a single large
+answer and four small ones are compared fairly. ``--live`` uses the real
+Gemini client and needs GEMINI_API_KEY.
+
+    python -m benchmarks.fused_pipeline --resumes 20
+    python -m benchmarks.fused_pipeline --resumes 5 --live
+"""
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import time
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.state import create_initial_state
+from backend.llm.fake import FakeGeminiClient
+from backend.utils.parse_cache import ParseCache
+from backend.utils.prompt_compactor import estimate_tokens
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.fixtures import JOB_DESCRIPTION, resume_lines
+
+
+class TokenLatencyFakeGeminiClient(FakeGeminiClient):
+    def __init__(self, ttft: float = 0.4, per_output_token: float = 0.004):
+        super().__init__(latency=0)
+        self.ttft = ttft
+        self.per_output_token = per_output_token
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        response = self._respond(prompt, text, node)
+        await asyncio.sleep(self.ttft + estimate_tokens(response) * self.per_output_token)
+        return response
+
+
+# Counts calls and estimated tokens for whichever client it wraps
+class MeteredClient:
+    def __init__(self, client):
+        self.client = client
+        self.model = client.model
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        response = await self.client.analyze_text_async(prompt, text, response_schema=response_schema, node=node)
+        self.calls += 1
+        self.input_tokens += estimate_tokens(prompt + text)
+        self.output_tokens += estimate_tokens(response or "")
+        return response
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+def jaccard(left: set, right: set) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def resume_skills(result: dict) -> set:
+    skills = (result.get("parsed_resume") or {}).get("skills") or {}
+    return {skill.lower() for values in skills.values() for skill in values}
+
+
+def must_have(result: dict) -> set:
+    required = (result.get("parsed_jd") or {}).get("required_skills") or {}
+    return {skill.lower() for skill in required.get("must_have", [])}
+
+
+def words(recommendations: list) -> set:
+    return set(re.findall(r"[a-z0-9+#.]+", " ".join(recommendations).lower()))
+
+
+async def run_mode(analyzer: JDResumeAnalyzer, client: MeteredClient, mode: str, resumes: list) -> tuple:
+    samples, results = [], []
+    client.reset()
+    for resume_text in resumes:
+        started = time.perf_counter()
+        results.append(await analyzer.workflow_for(mode).ainvoke(create_initial_state(resume_text, JOB_DESCRIPTION)))
+        samples.append(time.perf_counter() - started)
+    report = {
+        **summarize(samples),
+        "gemini_calls_per_analysis": round(client.calls / len(resumes), 2),
+        "input_tokens_per_analysis": round(client.input_tokens / len(resumes)),
+        "output_tokens_per_analysis": round(client.output_tokens / len(resumes)),
+    }
+    return report, results
+
+
+def agreement(graph_results: list, fused_results: list) -> dict:
+    pairs = list(zip(graph_results, fused_results))
+    return {
+        "match_score_abs_diff": round(statistics.mean(abs(g["match_score"] - f["match_score"]) for g, f in pairs), 2),
+        "resume_skills_jaccard": round(statistics.mean(jaccard(resume_skills(g), resume_skills(f)) for g, f in pairs), 3),
+        "jd_must_have_jaccard": round(statistics.mean(jaccard(must_have(g), must_have(f)) for g, f in pairs), 3),
+        "recommendation_words_jaccard": round(statistics.mean(jaccard(words(g["recommendations"]), words(f["recommendations"])) for g, f in pairs), 3),
+    }
+
+
+async def run(args) -> dict:
+    if args.live:
+        from backend.llm.gemini import GeminiClient
+        client = MeteredClient(GeminiClient())
+    else:
+        client = MeteredClient(TokenLatencyFakeGeminiClient(args.ttft, args.per_output_token))
+    analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0), match_mode=args.match_mode)
+    resumes = ["\n".join(resume_lines(seed)) for seed in range(args.resumes)]
+
+    try:
+        graph, graph_results = await run_mode(analyzer, client, "graph", resumes)
+        fused, fused_results = await run_mode(analyzer, client, "fused", resumes)
+    finally:
+        await analyzer.aclose()
+
+    return {
+        "resumes": args.resumes,
+        "backend": "gemini" if args.live else "fake",
+        "match_mode": args.match_mode,
+        "graph": graph,
+        "fused": fused,
+        "mean_latency_saved_ms": round(graph["mean_ms"] - fused["mean_ms"], 3),
+        "agreement": agreement(graph_results, fused_results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--match-mode", choices=["local", "explain"], default="explain")
+    parser.add_argument("--ttft", type=float, default=0.4, help="fake time to first token (seconds)")
+    parser.add_argument("--per-output-token", type=float, default=0.004, help="fake generation time per output token (seconds)")
+    parser.add_argument("--live", action="store_true", help="call Gemini instead of the fake")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Load test for the async analysis path against a stubbed Gemini backend.
+
+Runs the same batch of analyses twice on a single event loop:
+
+* ``blocking`` - the fake client sleeps synchronously inside the coroutine, which
+  is what calling ``generate_content`` from an ``async def`` used to do.
+* ``async``    - the fake client awaits, like ``GeminiClient.analyze_text_async``.
+
+A probe coroutine measures event-loop lag during each run, standing in for
+``/health`` requests queued behind the analyses.
+
+    python -m benchmarks.load_test_async --requests 32 --latency 0.2
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.state import create_initial_state
+from backend.llm.fake import FakeGeminiClient
+from backend.utils.parse_cache import ParseCache
+
+
+class BlockingFakeGeminiClient(FakeGeminiClient):
+    async def analyze_text_async(self, prompt: str, text: str, response_schema=None, node: str = None) -> str:
+        return self.analyze_text(prompt, text, response_schema, node)
+
+
+def initial_state() -> dict:
+    return create_initial_state(
+        "Jane Doe - Software Engineer - Python, FastAPI, MongoDB",
+        "Backend Engineer, 3+ years Python and FastAPI"
+    )
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run(client, requests: int, concurrency: int) -> dict:
+    # A zero-size parse cache keeps every run honest: all four nodes hit the fake LLM
+    analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await analyzer.workflow.ainvoke(initial_state())
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    worst_lag = await probe
+
+    return {
+        "requests": requests,
+        "completed": sum(1 for r in results if r.get("match_score")),
+        "wall_time_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2),
+        "max_event_loop_lag_ms": round(worst_lag * 1000, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2, help="fake Gemini latency per call (seconds)")
+    args = parser.parse_args()
+
+    report = {
+        "blocking": asyncio.run(run(BlockingFakeGeminiClient(latency=args.latency), args.requests, args.concurrency)),
+        "async": asyncio.run(run(FakeGeminiClient(latency=args.latency), args.requests, args.concurrency))
+    }
+    report["speedup"] = round(report["blocking"]["wall_time_s"] / report["async"]["wall_time_s"], 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Multi-process check of the shared Gemini rate limiter.
+
+Starts several worker processes (standing in for uvicorn workers) that each
+fire concurrent fake Gemini calls as fast as they can through their own
+``TokenBucketLimiter`` on one shared state file. Reports the admitted rate
+against the configured limit and the per-second throughput, which should be
+flat at the limit after the initial one-minute burst allowance is spent.
+
+    python -m benchmarks.rate_limiter --workers 4 --rpm 600 --seconds 20
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+from backend.llm.errors import GeminiRateLimitTimeout
+from backend.llm.rate_limiter import TokenBucketLimiter
+
+
+async def hammer(limiter: TokenBucketLimiter, seconds: float, concurrency: int, tokens: int) -> dict:
+    stop_at = time.time() + seconds
+    admitted, timeouts = [], 0
+
+    async def caller():
+        nonlocal timeouts
+        while time.time() < stop_at:
+            try:
+                await limiter.acquire(tokens, max_wait=max(0.0, stop_at - time.time()))
+            except GeminiRateLimitTimeout:
+                timeouts += 1
+                return
+            admitted.append(time.time())
+            await asyncio.sleep(0.01)  # the fake call
+
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return {"admitted": admitted, "timeouts": timeouts}
+
+
+def worker(state_path: str, rpm: int, tpm: int, seconds: float, concurrency: int, tokens: int, results):
+    limiter = TokenBucketLimiter(requests_per_minute=rpm, tokens_per_minute=tpm, state_path=state_path)
+    results.put(asyncio.run(hammer(limiter, seconds, concurrency, tokens)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=600)
+    parser.add_argument("--tpm", type=int, default=0)
+    parser.add_argument("--tokens", type=int, default=1500, help="tokens per call")
+    parser.add_argument("--seconds", type=float, default=20)
+    args = parser.parse_args()
+
+    state_path = os.path.join(tempfile.mkdtemp(), "limiter.bin")
+    # Start with empty buckets so the steady state is visible without waiting out the burst
+    TokenBucketLimiter(args.rpm, args.tpm, state_path)._update(args.rpm, args.tpm, commit_partial=True)
+
+    results = multiprocessing.Queue()
+    started = time.time()
+    processes = [
+        multiprocessing.Process(target=worker, args=(state_path, args.rpm, args.tpm, args.seconds, args.concurrency, args.tokens, results))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    admitted = sorted(t for outcome in outcomes for t in outcome["admitted"])
+    per_second = [0] * int(args.seconds + 1)
+    for t in admitted:
+        per_second[min(len(per_second) - 1, int(t - started))] += 1
+
+    limits = [limit / 60 for limit in (args.rpm, args.tpm / args.tokens if args.tpm else 0) if limit]
+    report = {
+        "workers": args.workers,
+        "limit_per_s": round(min(limits), 2) if limits else None,
+        "admitted": len(admitted),
+        "admitted_per_s": round(len(admitted) / args.seconds, 2),
+        "per_second": per_second,
+        "by_worker": [len(outcome["admitted"]) for outcome in outcomes],
+        "deadline_timeouts": sum(outcome["timeouts"] for outcome in outcomes),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
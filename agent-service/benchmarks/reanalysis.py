@@ -0,0 +1,93 @@
+"""Gemini calls and latency of a re-analysis compared with a full analysis.
+
+Runs one full analysis per resume through the node graph, then re-analyzes it
+the way users resubmit, seeding the state with ``create_reanalysis_state``:
+
+* ``full``            - the first analysis (every node runs)
+* ``unchanged``       - same resume and JD again
+* ``refresh``         - same inputs, fresh recommendations
+* ``resume_changed``  - one line added to the resume, JD omitted
+* ``jd_changed``      - one line added to the JD, resume omitted
+
+The parse cache is disabled, so every saved call comes from the reused state.
+
+    python -m benchmarks.reanalysis --resumes 20
+    python -m benchmarks.reanalysis --resumes 20 --match-mode explain
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.state import create_initial_state, create_reanalysis_state
+from backend.utils.parse_cache import ParseCache
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.fixtures import JOB_DESCRIPTION, resume_lines
+from benchmarks.fused_pipeline import MeteredClient, TokenLatencyFakeGeminiClient
+
+
+# What an analysis stores with REANALYSIS_STORE_INPUTS on; without it the
+# *_changed scenarios would have to resend the omitted input
+def stored(result: dict) -> dict:
+    return {
+        **{key: result[key] for key in ("parsed_resume", "parsed_jd", "match_analysis", "recommendations", "input_hashes")},
+        "input_texts": {"resume": result["resume_text"], "jd": result["job_description"]},
+    }
+
+
+SCENARIOS = {
+    "unchanged": lambda resume_text: dict(resume_text=resume_text, job_description=JOB_DESCRIPTION),
+    "refresh": lambda resume_text: dict(refresh_recommendations=True),
+    "resume_changed": lambda resume_text: dict(resume_text=resume_text + "\nCertified Kubernetes Administrator, 2024"),
+    "jd_changed": lambda resume_text: dict(job_description=JOB_DESCRIPTION + "\nExperience with Terraform is a plus."),
+}
+
+
+async def run(args) -> dict:
+    client = MeteredClient(TokenLatencyFakeGeminiClient(args.ttft, args.per_output_token))
+    analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0), match_mode=args.match_mode)
+    resumes = ["\n".join(resume_lines(seed)) for seed in range(args.resumes)]
+    samples = {name: [] for name in ["full", *SCENARIOS]}
+    calls = dict.fromkeys(samples, 0)
+
+    try:
+        for resume_text in resumes:
+            client.reset()
+            started = time.perf_counter()
+            previous = stored(await analyzer.workflow.ainvoke(create_initial_state(resume_text, JOB_DESCRIPTION)))
+            samples["full"].append(time.perf_counter() - started)
+            calls["full"] += client.calls
+
+            for name, inputs in SCENARIOS.items():
+                client.reset()
+                started = time.perf_counter()
+                await analyzer.workflow.ainvoke(create_reanalysis_state(previous, **inputs(resume_text)))
+                samples[name].append(time.perf_counter() - started)
+                calls[name] += client.calls
+    finally:
+        await analyzer.aclose()
+
+    return {
+        "resumes": args.resumes,
+        "match_mode": args.match_mode,
+        **{
+            name: {"gemini_calls_per_analysis": round(calls[name] / len(resumes), 2), **summarize(samples[name])}
+            for name in samples
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--match-mode", choices=["local", "explain"], default="explain")
+    parser.add_argument("--ttft", type=float, default=0.4, help="fake time to first token (seconds)")
+    parser.add_argument("--per-output-token", type=float, default=0.004, help="fake generation time per output token (seconds)")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Records live Gemini responses for offline replay by the benchmark suite.
+
+Runs one analysis of a fixture resume against the fixture job description in
+both pipeline modes (explain match mode, so every prompt is exercised) and
+saves the raw response for each prompt heading. Needs GEMINI_API_KEY.
+
+    python -m benchmarks.record_responses --output benchmarks/recordings/gemini.json
+    python -m benchmarks.suite --responses benchmarks/recordings/gemini.json
+"""
+import argparse
+import asyncio
+import os
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.state import create_initial_state
+from backend.llm.fake import RecordingGeminiClient
+from backend.llm.gemini import GeminiClient
+from backend.utils.parse_cache import ParseCache
+from benchmarks.fixtures import JOB_DESCRIPTION, resume_lines
+
+
+async def record(output: str, seed: int):
+    client = RecordingGeminiClient(GeminiClient())
+    analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0), match_mode="explain")
+    state = create_initial_state("\n".join(resume_lines(seed, pages=2)), JOB_DESCRIPTION)
+    try:
+        for mode in ("graph", "fused"):
+            await analyzer.workflow_for(mode).ainvoke(state)
+    finally:
+        await analyzer.aclose()
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    client.save(output)
+    print(f"Recorded {len(client.recorded)} responses to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="benchmarks/recordings/gemini.json")
+    parser.add_argument("--seed", type=int, default=0, help="fixture resume to analyze")
+    args = parser.parse_args()
+    asyncio.run(record(args.output, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Fault-injection run of the Gemini retry, hedging and circuit-breaker layer.
+
+Runs the full analysis graph against ``FaultyGeminiClient`` in several
+scenarios and reports how many analyses succeed, how many Gemini calls they
+cost and the latency distribution:
+
+``bare``        - the faulty client with no resilience (previous behaviour)
+``retry``       - ResilientGeminiClient with per-node attempt budgets
+``hedged``      - retry plus hedging once p95 latency is known
+``outage``      - the provider is down; the circuit opens and calls fail fast
+
+    python -m benchmarks.resilience --requests 200 --failure-rate 0.2 --slow-rate 0.03
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.llm.errors import GeminiCircuitOpenError
+from backend.llm.fake import FaultyGeminiClient
+from backend.llm.resilience import CircuitBreaker, ResilientGeminiClient
+from backend.utils.parse_cache import ParseCache
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.load_test_async import initial_state
+
+
+async def run_scenario(client, faulty: FaultyGeminiClient, requests: int, concurrency: int) -> dict:
+    analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], {}
+
+    async def analyze():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await analyzer.workflow.ainvoke(initial_state())
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                code = getattr(e, "code", type(e).__name__)
+                errors[code] = errors.get(code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(analyze() for _ in range(requests)))
+    report = {
+        "succeeded": len(latencies),
+        "failed": errors,
+        "gemini_calls": faulty.calls,
+        "injected_failures": faulty.failures,
+        "wall_time_s": round(time.perf_counter() - started, 3),
+    }
+    if latencies:
+        report["latency"] = summarize(latencies)
+    return report
+
+
+def faulty_client(args) -> FaultyGeminiClient:
+    return FaultyGeminiClient(
+        latency=args.latency, failure_rate=args.failure_rate,
+        slow_rate=args.slow_rate, slow_latency=args.slow_latency, seed=args.seed
+    )
+
+
+async def outage(args) -> dict:
+    faulty = faulty_client(args)
+    faulty.down = True
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    client = ResilientGeminiClient(faulty, base_delay=0.01, max_delay=0.05, breaker=breaker)
+    report = await run_scenario(client, faulty, args.requests, args.concurrency)
+    report["circuit_state"] = breaker.state
+    report["fail_fast"] = report["failed"].get(GeminiCircuitOpenError.code, 0)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--slow-rate", type=float, default=0.03)
+    parser.add_argument("--slow-latency", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # A high threshold keeps the breaker closed under random (not sustained) faults
+    def resilient(faulty, hedge):
+        return ResilientGeminiClient(
+            faulty, base_delay=0.01, max_delay=0.1, hedge=hedge,
+            breaker=CircuitBreaker(failure_threshold=10 ** 6)
+        )
+
+    bare, with_retry, with_hedge = faulty_client(args), faulty_client(args), faulty_client(args)
+    report = {
+        "bare": asyncio.run(run_scenario(bare, bare, args.requests, args.concurrency)),
+        "retry": asyncio.run(run_scenario(resilient(with_retry, False), with_retry, args.requests, args.concurrency)),
+        "hedged": asyncio.run(run_scenario(resilient(with_hedge, True), with_hedge, args.requests, args.concurrency)),
+        "outage": asyncio.run(outage(args)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Latency of the stored-analysis search index behind /search/resumes and /search/jobs.
+
+Saves ``--analyses`` synthetic analyses for one user (random taxonomy skills,
+experience, education and job requirements; a share of them compressed) to
+mongomock, or to ``--mongo-uri`` when given, then measures
+
+* ``build_ms``       - first query of the user: reading and indexing everything
+* ``rank_resumes``   - ranking the stored resumes for a new JD
+* ``rank_jobs``      - ranking the stored JDs for a resume
+* ``add_us``         - indexing one newly saved analysis
+
+No Gemini calls are made anywhere.
+
+    python -m benchmarks.search_index --analyses 10000 --queries 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from beanie import PydanticObjectId, init_beanie
+
+from backend.models.Analysis import Analysis
+from backend.models.ParseCacheEntry import ParseCacheEntry
+from backend.utils.search_index import AnalysisSearchIndex
+from backend.utils.skill_taxonomy import TAXONOMY
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.fixtures import COMPANIES, ROLES
+
+DEGREES = ["", "Diploma in Computing", "B.Tech in Computer Science", "MSc in Data Science", "PhD in Machine Learning"]
+REQUIREMENTS = ["", "Bachelor's degree in Computer Science or a related field", "Master's degree preferred"]
+
+
+def parsed_resume(rng: random.Random, index: int, skills: list) -> dict:
+    start = rng.randint(2005, 2023)
+    return {
+        "personal_details": {"name": f"Candidate {index}", "contact_info": {"email": f"candidate{index}@example.com"}},
+        "skills": {"languages": rng.sample(skills, rng.randint(5, 25))},
+        "work_experience": [{"role": rng.choice(ROLES), "duration": f"Jan {start} - Present"}],
+        "education": [{"degree": rng.choice(DEGREES)}],
+    }
+
+
+def parsed_jd(rng: random.Random, skills: list) -> dict:
+    required = rng.sample(skills, 8)
+    return {
+        "required_skills": {"must_have": required[:5], "nice_to_have": required[5:]},
+        "experience_level_required": f"{rng.randint(0, 8)}+ years",
+        "educational_requirements": rng.choice(REQUIREMENTS),
+    }
+
+
+def make_analysis(rng: random.Random, user_id, index: int, skills: list) -> Analysis:
+    analysis = Analysis(
+        user_id=user_id,
+        job_title=rng.choice(ROLES),
+        company=rng.choice(COMPANIES),
+        parsed_resume=parsed_resume(rng, index, skills),
+        job_analysis=parsed_jd(rng, skills),
+    )
+    return analysis.compress() if rng.random() < 0.3 else analysis
+
+
+async def run(args) -> dict:
+    if args.mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        mongo = AsyncIOMotorClient(args.mongo_uri)
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        mongo = AsyncMongoMockClient()
+    database = mongo["jd-analyzer-search-benchmark"]
+    await init_beanie(database=database, document_models=[Analysis, ParseCacheEntry])
+
+    rng = random.Random(args.seed)
+    skills = [skill for bucket in TAXONOMY.values() for skill in bucket]
+    user_id = PydanticObjectId()
+    try:
+        for start in range(0, args.analyses, 1000):
+            await Analysis.insert_many([make_analysis(rng, user_id, i, skills) for i in range(start, min(start + 1000, args.analyses))])
+
+        index = AnalysisSearchIndex()
+        started = time.perf_counter()
+        await index.user_index(user_id)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        resume_samples, job_samples = [], []
+        for _ in range(args.queries):
+            started = time.perf_counter()
+            await index.rank_resumes(user_id, parsed_jd(rng, skills), limit=args.limit)
+            resume_samples.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await index.rank_jobs(user_id, parsed_resume(rng, -1, skills), limit=args.limit)
+            job_samples.append(time.perf_counter() - started)
+
+        added = []
+        for i in range(args.analyses, args.analyses + args.queries):
+            analysis = make_analysis(rng, user_id, i, skills)
+            await analysis.insert()
+            started = time.perf_counter()
+            index.add(analysis)
+            added.append(time.perf_counter() - started)
+
+        return {
+            "analyses": args.analyses,
+            "indexed": index.stats(),
+            "build_ms": round(build_ms, 1),
+            "rank_resumes": summarize(resume_samples),
+            "rank_jobs": summarize(job_samples),
+            "add_us": round(1_000_000 * sum(added) / len(added), 1),
+        }
+    finally:
+        await mongo.drop_database(database.name)
+        mongo.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--analyses", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--mongo-uri", default=None)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
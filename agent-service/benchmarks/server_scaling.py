@@ -0,0 +1,206 @@
+"""Throughput of the production server as the worker count grows, against the fake LLM.
+
+For each ``--workers`` value, starts ``run_production_server`` in a subprocess
+serving this module's ``app``: the real application and routes, with a
+lifespan that gives every worker a fake Gemini client, its own mongomock
+database and a throwaway JWT key. Over real HTTP connections it then
+
+* posts ``--requests`` DOCX resumes to /analyse-resume at ``--concurrency``
+  and reports requests/s and latency
+* starts another ``--concurrency`` analyses, sends SIGTERM while they are in
+  flight and counts how many still complete before the server exits
+
+The fake LLM only sleeps, so extra workers help with the CPU work around it
+(upload parsing, text extraction, JSON decoding, scoring, serialization), and
+throughput stops growing at the number of cores.
+
+    python -m benchmarks.server_scaling --workers 1 2 4 --requests 400 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+
+import httpx
+from beanie import init_beanie
+
+from backend.agents.graph import JDResumeAnalyzer
+from backend.app import app
+from backend.config.lifespan import drain_jobs_on_exit_signal
+from backend.controllers.v1.agents import run_analysis_job
+from backend.llm.fake import FakeGeminiClient
+from backend.models.Analysis import Analysis
+from backend.models.AnalysisJobRecord import AnalysisJobRecord
+from backend.models.ParseCacheEntry import ParseCacheEntry
+from backend.utils.job_queue import job_queue
+from backend.utils.jwt import load_public_key
+from backend.utils.parse_cache import ParseCache
+from backend.utils.reuseable_functions import shutdown_extraction_pool, warm_extraction_pool
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.auth import make_token
+from benchmarks.fixtures import JOB_DESCRIPTION, make_docx, resume_lines
+
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@asynccontextmanager
+async def offline_lifespan(app):
+    from mongomock_motor import AsyncMongoMockClient
+    # Per-worker databases: a job is only visible to the worker that accepted it
+    await init_beanie(database=AsyncMongoMockClient()["jd-analyzer-scaling"], document_models=[Analysis, AnalysisJobRecord, ParseCacheEntry])
+    load_public_key(os.environ["SCALING_JWT_PUBLIC_KEY"].encode())
+    # A zero-size parse cache keeps every request honest: all nodes hit the fake LLM
+    client = FakeGeminiClient(latency=float(os.environ["SCALING_LLM_LATENCY"]), jitter=0.2, seed=os.getpid())
+    app.state.analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0))
+    await warm_extraction_pool()
+    job_queue.persistent = True
+    job_queue.start(partial(run_analysis_job, analyzer=app.state.analyzer))
+    drain_jobs_on_exit_signal()
+    yield
+    await job_queue.stop()
+    logging.info(f"Analysis jobs at shutdown: {job_queue.stats()}")
+    await app.state.analyzer.aclose()
+    shutdown_extraction_pool()
+
+
+app.router.lifespan_context = offline_lifespan
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, public_pem: bytes, latency: float) -> subprocess.Popen:
+    env = {**os.environ, "SCALING_JWT_PUBLIC_KEY": public_pem.decode(), "SCALING_LLM_LATENCY": str(latency)}
+    command = [sys.executable, "-m", "benchmarks.server_scaling", "--serve", "--workers", str(workers), "--port", str(port)]
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def wait_until_ready(http: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited during startup with code {server.returncode}")
+        try:
+            if (await http.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not become ready in time")
+
+
+async def post_analysis(http: httpx.AsyncClient, upload: bytes) -> tuple:
+    started = time.perf_counter()
+    try:
+        response = await http.post(
+            "/api/v1/agent/analyse-resume",
+            data={"jd": JOB_DESCRIPTION, "job_title": "Backend Engineer", "company": "Acme Corp"},
+            files={"resume": ("resume.docx", upload, DOCX)},
+        )
+        status_code = response.status_code
+    except httpx.TransportError:
+        status_code = None
+    return time.perf_counter() - started, status_code
+
+
+async def load(http: httpx.AsyncClient, uploads: list, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index):
+        async with semaphore:
+            return await post_analysis(http, uploads[index % len(uploads)])
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_s": round(requests / elapsed, 1),
+        "errors": sum(status_code != 200 for _, status_code in results),
+        **summarize([duration for duration, _ in results]),
+    }
+
+
+async def drain(http: httpx.AsyncClient, server: subprocess.Popen, uploads: list, in_flight: int) -> dict:
+    tasks = [asyncio.create_task(post_analysis(http, uploads[index % len(uploads)])) for index in range(in_flight)]
+    await asyncio.sleep(0.5)
+    signalled = time.perf_counter()
+    server.send_signal(signal.SIGTERM)
+    results = await asyncio.gather(*tasks)
+    while server.poll() is None:
+        await asyncio.sleep(0.05)
+    return {
+        "in_flight": in_flight,
+        "completed": sum(status_code == 200 for _, status_code in results),
+        "exit_s": round(time.perf_counter() - signalled, 2),
+        "exit_code": server.returncode,
+    }
+
+
+async def measure(workers: int, args, token: str, public_pem: bytes, uploads: list) -> dict:
+    port = free_port()
+    server = start_server(workers, port, public_pem, args.latency)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", headers={"Authorization": f"Bearer {token}"}, limits=limits, timeout=None) as http:
+            await wait_until_ready(http, server)
+            await load(http, uploads, args.concurrency, args.concurrency)
+            report = await load(http, uploads, args.requests, args.concurrency)
+            report["sigterm"] = await drain(http, server, uploads, args.concurrency)
+            return report
+    finally:
+        if server.poll() is None:
+            server.kill()
+            server.wait()
+
+
+async def run(args) -> dict:
+    token, public_pem = make_token()
+    uploads = [make_docx(resume_lines(seed)) for seed in range(20)]
+    report = {
+        "cpu_count": os.cpu_count(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "llm_latency_s": args.latency,
+    }
+    for workers in args.workers:
+        report[f"workers_{workers}"] = await measure(workers, args, token, public_pem, uploads)
+
+    baseline = report[f"workers_{args.workers[0]}"]["requests_per_s"]
+    report["speedup"] = {
+        workers: round(report[f"workers_{workers}"]["requests_per_s"] / baseline, 2) for workers in args.workers
+    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.2, help="fake Gemini latency per call (seconds)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.serve:
+        from backend.server import run_production_server
+        run_production_server("benchmarks.server_scaling:app", workers=args.workers[0], host="127.0.0.1", port=args.port)
+        return
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Speed and accuracy of skill matching: per-skill rapidfuzz vs the taxonomy index.
+
+Generates synthetic analyses whose resume and JD skills are taxonomy skills
+written the way people write them (aliases, casing, versions, spacing) plus
+some skills the taxonomy does not know. Every required skill carries the
+ground truth of whether the candidate has it, so both matchers are scored on
+precision/recall as well as time:
+
+* ``rapidfuzz`` - the previous matcher: exact alias lookup, then
+  ``process.extractOne`` with ``token_sort_ratio >= 90`` for each required skill
+* ``index``     - ``SkillIndex.match``, one vectorized pass per skill list
+
+It also times normalizing and categorizing every skill of every analysis in a
+single ``SkillIndex.normalize`` call, the way analytics over stored analyses
+would use it.
+
+    python -m benchmarks.skill_index --analyses 5000
+"""
+import argparse
+import json
+import random
+import time
+
+from rapidfuzz import fuzz, process
+
+from backend.utils.match_scoring import normalize_skill
+from backend.utils.skill_taxonomy import TAXONOMY, SkillIndex, skill_index
+from benchmarks.analyzer_overhead import summarize
+
+UNKNOWN_SKILLS = ["Salesforce", "SAP ABAP", "Unity3D", "Blender", "Solidity", "COBOL", "Tableau", "Power BI"]
+
+
+def spellings(rng: random.Random, skill: str, aliases: list) -> str:
+    name = rng.choice([skill, skill, *aliases])
+    variant = rng.random()
+    if variant < 0.3:
+        name = name.title()
+    elif variant < 0.4:
+        name = name.upper()
+    elif variant < 0.5:
+        name = f"{name} {rng.randint(2, 18)}"
+    elif variant < 0.55:
+        name = name.replace(".", "")
+    return name
+
+
+def make_analysis(rng: random.Random, catalogue: list) -> tuple:
+    owned = rng.sample(catalogue, rng.randint(10, 30))
+    candidate = [spellings(rng, skill, aliases) for skill, aliases in owned] + rng.sample(UNKNOWN_SKILLS, 2)
+
+    required, expected = [], []
+    for skill, aliases in rng.sample(owned, 4) + rng.sample(catalogue, 4):
+        required.append(spellings(rng, skill, aliases))
+        expected.append(any(skill == owned_skill for owned_skill, _ in owned))
+    return candidate, required, expected
+
+
+def rapidfuzz_match(required: list, candidate: list) -> list:
+    candidate_skills = sorted({normalize_skill(skill) for skill in candidate})
+    return [
+        bool(normalize_skill(skill) in candidate_skills or process.extractOne(
+            normalize_skill(skill), candidate_skills, scorer=fuzz.token_sort_ratio, score_cutoff=90
+        ))
+        for skill in required
+    ]
+
+
+def index_match(required: list, candidate: list) -> list:
+    matched, _ = skill_index.match(required, candidate)
+    return [skill in matched for skill in required]
+
+
+def accuracy(predicted: list, expected: list) -> dict:
+    true_positive = sum(p and e for p, e in zip(predicted, expected))
+    precision = true_positive / max(1, sum(predicted))
+    recall = true_positive / max(1, sum(expected))
+    return {"precision": round(precision, 3), "recall": round(recall, 3)}
+
+
+def run(matcher, analyses: list) -> dict:
+    samples, predicted, expected = [], [], []
+    for candidate, required, truth in analyses:
+        started = time.perf_counter()
+        predicted += matcher(required, candidate)
+        samples.append(time.perf_counter() - started)
+        expected += truth
+    return {
+        "total_ms": round(sum(samples) * 1000, 1),
+        "per_analysis": summarize(samples),
+        **accuracy(predicted, expected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--analyses", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    catalogue = [(skill, aliases) for skills in TAXONOMY.values() for skill, aliases in skills.items()]
+    analyses = [make_analysis(rng, catalogue) for _ in range(args.analyses)]
+
+    report = {
+        "analyses": args.analyses,
+        "rapidfuzz": run(rapidfuzz_match, analyses),
+        "index": run(index_match, analyses),
+    }
+
+    # A fresh index, so the bulk pass does not reuse the resolutions memoized above
+    every_skill = [skill for candidate, required, _ in analyses for skill in candidate + required]
+    started = time.perf_counter()
+    normalized = SkillIndex().normalize(every_skill)
+    elapsed = time.perf_counter() - started
+    report["bulk_normalize"] = {
+        "skills": len(every_skill),
+        "total_ms": round(elapsed * 1000, 1),
+        "skills_per_s": round(len(every_skill) / elapsed),
+        "categorized_pct": round(100 * sum(category is not None for _, category, _ in normalized) / len(normalized), 1),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
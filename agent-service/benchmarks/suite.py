@@ -0,0 +1,288 @@
+"""Offline benchmark suite: extraction, agent nodes, end-to-end requests and load.
+
+Everything runs in-process against ``FakeGeminiClient``, so no Gemini key or
+network is needed. The fake answers with the canned responses, or with
+responses recorded from a live run (``--responses``, see
+``benchmarks.record_responses``), after ``--latency`` seconds +/- ``--jitter``.
+
+Sections (``--only`` picks a subset):
+
+``extraction``  - per-file latency and concurrent throughput of
+                  ``extract_resume_text_async`` over the fixture PDF/DOCX corpus
+``nodes``       - each agent node called on its own (parse_resume,
+                  analyze_job_description, calculate_match_score in local and
+                  explain mode, generate_recommendations, analyze_fused)
+``end_to_end``  - sequential ``POST /api/v1/agent/analyse-resume`` through the
+                  ASGI app with a signed JWT and multipart uploads
+``load``        - the same request at each ``--concurrency`` level: p50/p95/p99,
+                  throughput and errors
+
+Analyses are saved to mongomock (``pip install mongomock-motor``) unless
+``--mongo-uri`` points at a real server; the scratch database is dropped
+afterwards. Results are printed as JSON and written to ``--output``; two result
+files can be compared with ``--compare``.
+
+    python -m benchmarks.suite --output benchmarks/results/baseline.json
+    python -m benchmarks.suite --only nodes,load --latency 0.2 --concurrency 1,16,64
+    python -m benchmarks.suite --compare benchmarks/results/baseline.json benchmarks/results/new.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import httpx
+from beanie import init_beanie
+
+from backend.agents.fused_analysis_agent import analyze_fused
+from backend.agents.graph import JDResumeAnalyzer
+from backend.agents.jd_analysis_agent import analyze_job_description
+from backend.agents.match_and_score_agent import calculate_match_score
+from backend.agents.recommendation_agent import generate_recommendations
+from backend.agents.resume_parsing_agent import parse_resume
+from backend.agents.state import create_initial_state
+from backend.app import app
+from backend.llm.fake import FakeGeminiClient
+from backend.models.Analysis import Analysis
+from backend.models.ParseCacheEntry import ParseCacheEntry
+from backend.utils.jwt import load_public_key, token_cache
+from backend.utils.parse_cache import ParseCache
+from backend.utils.reuseable_functions import extract_resume_text_async, shutdown_extraction_pool, warm_extraction_pool
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.auth import make_token
+from benchmarks.extraction import measure
+from benchmarks.fixtures import JOB_DESCRIPTION, resume_corpus
+
+SECTIONS = ("extraction", "nodes", "end_to_end", "load")
+MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+# Leaves compared by --compare: latency summaries and rates
+COMPARED_SUFFIXES = ("_ms", "_rps", "_per_s")
+
+
+def make_client(args) -> FakeGeminiClient:
+    if args.responses:
+        return FakeGeminiClient.from_recording(args.responses, latency=args.latency, jitter=args.jitter, seed=args.seed)
+    return FakeGeminiClient(latency=args.latency, jitter=args.jitter, seed=args.seed)
+
+
+async def timed(call, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+async def bench_extraction(corpus: list) -> dict:
+    await warm_extraction_pool()
+    samples = []
+    for filename, content in corpus:
+        started = time.perf_counter()
+        await extract_resume_text_async(filename, content)
+        samples.append(time.perf_counter() - started)
+    concurrent = await measure(corpus, extract_resume_text_async)
+    return {
+        "files": len(corpus),
+        "per_file": summarize(samples),
+        "concurrent_files_per_s": concurrent["files_per_s"],
+        "max_event_loop_lag_ms": concurrent["max_event_loop_lag_ms"],
+    }
+
+
+async def bench_nodes(client, resume_text: str, runs: int) -> dict:
+    state = create_initial_state(resume_text, JOB_DESCRIPTION)
+    state.update((await parse_resume(state, client)))
+    state.update((await analyze_job_description(state, client)))
+    scored = {**state, **(await calculate_match_score(state, client, "local"))}
+
+    nodes = {
+        "resume_parser": lambda: parse_resume(state, client),
+        "jd_analyzer": lambda: analyze_job_description(state, client),
+        "matcher_local": lambda: calculate_match_score(state, client, "local"),
+        "matcher_explain": lambda: calculate_match_score(state, client, "explain"),
+        "recommender": lambda: generate_recommendations(scored, client),
+        "fused": lambda: analyze_fused(state, client),
+    }
+    return {node: await timed(call, runs) for node, call in nodes.items()}
+
+
+@asynccontextmanager
+async def offline_app(client, mongo_uri: str = None):
+    """The FastAPI app without its lifespan: scratch database, fake Gemini, throwaway JWT key."""
+    if mongo_uri:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        mongo = AsyncIOMotorClient(mongo_uri)
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        mongo = AsyncMongoMockClient()
+    database = mongo["jd-analyzer-benchmark"]
+    await init_beanie(database=database, document_models=[Analysis, ParseCacheEntry])
+
+    token, public_pem = make_token()
+    load_public_key(public_pem)
+    token_cache.clear()
+    # A zero-size parse cache keeps every request honest: all nodes hit the fake LLM
+    app.state.analyzer = JDResumeAnalyzer(gemini_client=client, parse_cache=ParseCache(max_size=0))
+    await warm_extraction_pool()
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", headers=headers, timeout=None) as http:
+            yield http
+    finally:
+        if mongo_uri:
+            await mongo.drop_database(database.name)
+        mongo.close()
+
+
+async def post_analysis(http: httpx.AsyncClient, upload: tuple, pipeline_mode: str = None) -> tuple:
+    filename, content = upload
+    data = {"jd": JOB_DESCRIPTION, "job_title": "Backend Engineer", "company": "Acme Corp"}
+    if pipeline_mode:
+        data["pipeline_mode"] = pipeline_mode
+    files = {"resume": (filename, content, MIME_TYPES[os.path.splitext(filename)[1]])}
+
+    started = time.perf_counter()
+    response = await http.post("/api/v1/agent/analyse-resume", data=data, files=files)
+    return time.perf_counter() - started, response.status_code
+
+
+async def bench_end_to_end(http: httpx.AsyncClient, corpus: list, requests: int, pipeline_mode: str) -> dict:
+    samples, errors = [], 0
+    for index in range(requests):
+        elapsed, status_code = await post_analysis(http, corpus[index % len(corpus)], pipeline_mode)
+        samples.append(elapsed)
+        errors += status_code != 200
+    return {"requests": requests, "errors": errors, **summarize(samples)}
+
+
+async def bench_load(http: httpx.AsyncClient, corpus: list, requests: int, concurrency_levels: list, pipeline_mode: str) -> dict:
+    report = {}
+    for concurrency in concurrency_levels:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(index):
+            async with semaphore:
+                return await post_analysis(http, corpus[index % len(corpus)], pipeline_mode)
+
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(one(index) for index in range(requests)))
+        elapsed = time.perf_counter() - started
+
+        report[f"concurrency_{concurrency}"] = {
+            "requests": requests,
+            "errors": sum(status_code != 200 for _, status_code in outcomes),
+            "throughput_rps": round(requests / elapsed, 2),
+            **summarize([latency for latency, _ in outcomes]),
+        }
+    return report
+
+
+async def run(args) -> dict:
+    sections = args.only.split(",") if args.only else list(SECTIONS)
+    corpus = resume_corpus(count=args.resumes, max_pages=args.max_pages)
+    client = make_client(args)
+    results = {}
+
+    try:
+        if "extraction" in sections:
+            results["extraction"] = await bench_extraction(corpus)
+        if "nodes" in sections:
+            resume_text = await extract_resume_text_async(*corpus[0])
+            results["nodes"] = await bench_nodes(client, resume_text, args.node_runs)
+        if "end_to_end" in sections or "load" in sections:
+            async with offline_app(client, args.mongo_uri) as http:
+                if "end_to_end" in sections:
+                    results["end_to_end"] = await bench_end_to_end(http, corpus, args.requests, args.pipeline_mode)
+                if "load" in sections:
+                    levels = [int(level) for level in args.concurrency.split(",")]
+                    results["load"] = await bench_load(http, corpus, args.load_requests, levels, args.pipeline_mode)
+    finally:
+        shutdown_extraction_pool()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(report: dict, prefix: str = "") -> dict:
+    leaves = {}
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            leaves.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and key.endswith(COMPARED_SUFFIXES):
+            leaves[path] = value
+    return leaves
+
+
+def compare(before_path: str, after_path: str) -> dict:
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before = flatten(json.load(before_file)["results"])
+        after = flatten(json.load(after_file)["results"])
+    return {
+        path: {
+            "before": before[path],
+            "after": after[path],
+            "change_pct": round(100 * (after[path] - before[path]) / before[path], 1) if before[path] else None,
+        }
+        for path in before
+        if path in after
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", default=None, help=f"comma-separated subset of {','.join(SECTIONS)}")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake Gemini latency per call (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="latency variation as a fraction of --latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--responses", default=None, help="recorded responses JSON to replay")
+    parser.add_argument("--resumes", type=int, default=20, help="fixture corpus size")
+    parser.add_argument("--max-pages", type=int, default=10, help="longest fixture PDF")
+    parser.add_argument("--node-runs", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=20, help="sequential end-to-end requests")
+    parser.add_argument("--load-requests", type=int, default=100, help="requests per concurrency level")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--pipeline-mode", choices=["graph", "fused"], default=None)
+    parser.add_argument("--mongo-uri", default=None)
+    parser.add_argument("--output", default=None, help="also write the report to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two saved reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(json.dumps(compare(*args.compare), indent=2))
+        return
+
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "results": asyncio.run(run(args)),
+    }
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            output.write(rendered + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Token savings and cost of resume/JD text normalization.
+
+Builds PDF resumes from the fixtures with the noise real PDFs carry (a
+repeated header and "Page i of n" footer on every page, wide spacing, bullet
+glyphs, duplicated bullet lines, hyphenated line breaks), extracts them like
+an upload and normalizes the text. Reports estimated tokens before and after,
+how many resumes hit the token budget, and normalization time per resume.
+
+    python -m benchmarks.text_normalizer --resumes 40 --max-pages 10
+"""
+import argparse
+import json
+import random
+import time
+
+from backend.utils.prompt_compactor import estimate_tokens
+from backend.utils.reuseable_functions import extract_text_from_pdf
+from backend.utils.text_normalizer import normalize_text
+from benchmarks.analyzer_overhead import summarize
+from benchmarks.fixtures import JOB_DESCRIPTION, make_pdf, resume_lines
+
+LINES_PER_PAGE = 40
+JD_NOISE = """
+
+About us
+We are a fast growing company building tools for modern teams.
+Benefits
+Competitive salary, equity and flexible hours.
+Acme Corp is an equal opportunity employer and considers applicants without regard to race, color or religion.
+Apply now"""
+
+
+def noisy_resume_lines(seed: int, pages: int) -> list:
+    rng = random.Random(seed)
+    body = []
+    for line in resume_lines(seed, pages=pages):
+        if line.startswith("- "):
+            line = "•   " + line[2:]
+            if rng.random() < 0.15:
+                body.append(line)
+        if rng.random() < 0.1 and len(line) > 30:
+            cut = line.index(" ", 20)
+            body.extend([line[:cut] + " exper-", "ience" + line[cut:]])
+            continue
+        body.append(line.replace(" ", "  ") if rng.random() < 0.3 else line)
+
+    header = f"{body[0]} - Curriculum Vitae"
+    per_page = LINES_PER_PAGE - 2
+    chunks = [body[i:i + per_page] for i in range(0, len(body), per_page)]
+    lines = []
+    for number, chunk in enumerate(chunks, start=1):
+        lines += [header, *chunk, f"Page {number} of {len(chunks)}"]
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=40)
+    parser.add_argument("--max-pages", type=int, default=10)
+    parser.add_argument("--max-tokens", type=int, default=None, help="resume budget (defaults to RESUME_MAX_TOKENS)")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    texts = [
+        extract_text_from_pdf(make_pdf(noisy_resume_lines(seed, rng.randint(1, args.max_pages)), LINES_PER_PAGE))
+        for seed in range(args.resumes)
+    ]
+
+    samples, results = [], []
+    for text in texts:
+        started = time.perf_counter()
+        results.append(normalize_text(text, "resume", args.max_tokens)[1])
+        samples.append(time.perf_counter() - started)
+
+    before = sum(stats["tokens_before"] for stats in results)
+    after = sum(stats["tokens_after"] for stats in results)
+    jd_text, jd_stats = normalize_text(JOB_DESCRIPTION + JD_NOISE, "jd")
+
+    report = {
+        "resumes": args.resumes,
+        "resume_tokens_per_resume": {"raw": before // len(results), "normalized": after // len(results)},
+        "resume_tokens_saved_pct": round(100 * (before - after) / before, 1),
+        "resumes_truncated": sum(stats["truncated"] for stats in results),
+        "duplicate_lines_removed": sum(stats["duplicate_lines"] for stats in results),
+        "boilerplate_lines_removed": sum(stats["boilerplate_lines"] for stats in results),
+        "normalize_time": summarize(samples),
+        "jd_tokens": {"raw": jd_stats["tokens_before"], "normalized": estimate_tokens(jd_text)},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from beanie import PydanticObjectId
+
+from backend.models.Analysis import Analysis, list_view
+
+PARSED_RESUME = {"personal_details": {"name": "Jane Doe", "contact_info": {"email": "jane@example.com"}}, "skills": {"languages": ["Python"]}}
+MATCH_ANALYSIS = {
+    "overall_match_percentage": 80,
+    "skill_match": {"matched": ["Python"], "missing": ["Go"]},
+    "experience_level": "match",
+    "education_alignment": "partial",
+    "detailed_breakdown": {"skills": "Matched 1/2 must-have skills."},
+}
+
+
+def test_compressed_analysis_keeps_its_list_view_fields():
+    analysis = Analysis.model_construct(
+        user_id=PydanticObjectId(), parsed_resume=PARSED_RESUME, job_analysis={"job_title": "Engineer"},
+        match_analysis=MATCH_ANALYSIS, input_texts={"resume": "Jane Doe", "jd": "Engineer"}, compressed_fields=None,
+    ).compress()
+
+    assert analysis.parsed_resume == {"personal_details": {"name": "Jane Doe"}}
+    assert analysis.match_analysis == {key: value for key, value in MATCH_ANALYSIS.items() if key != "detailed_breakdown"}
+    assert analysis.job_analysis == {} and analysis.input_texts == {}
+
+    analysis.decompress()
+    assert analysis.parsed_resume == PARSED_RESUME
+    assert analysis.match_analysis == MATCH_ANALYSIS
+
+
+def test_list_view_of_an_empty_analysis():
+    assert list_view({}) == {"parsed_resume": {"personal_details": {"name": ""}}, "job_analysis": {}, "match_analysis": {}, "input_texts": {}}
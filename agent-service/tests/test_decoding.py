@@ -0,0 +1,49 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.llm.decoding import ResponseDecodeError, generate_structured, strip_code_fences
+from backend.llm.fake import DEFAULT_RESPONSES, FakeGeminiClient
+from backend.llm.schemas import ParsedJobDescription
+
+JD_PROMPT = "JOB DESCRIPTION ANALYSIS ASSISTANT\nAnalyze the job description."
+PARSED_JD = DEFAULT_RESPONSES["JOB DESCRIPTION ANALYSIS ASSISTANT"]
+
+
+# The fake answers with the first heading found in the prompt, so the repair
+# heading goes first: a repair prompt quotes the broken response
+def generate(responses: dict) -> tuple:
+    client = FakeGeminiClient(latency=0, responses=responses)
+    result = asyncio.run(generate_structured(client, JD_PROMPT, "Backend Engineer ...", ParsedJobDescription, node="jd_analyzer"))
+    return result, client.calls
+
+
+@pytest.mark.parametrize("text", ['```json\n{"a": 1}\n```', '```\n{"a": 1}\n```', '  ```json\n{"a": 1}```  ', '{"a": 1}'])
+def test_strip_code_fences(text):
+    assert json.loads(strip_code_fences(text)) == {"a": 1}
+
+
+def test_fenced_response_is_decoded_without_a_repair_call():
+    result, calls = generate({"JOB DESCRIPTION ANALYSIS ASSISTANT": f"```json\n{json.dumps(PARSED_JD)}\n```"})
+    assert result.model_dump() == PARSED_JD
+    assert calls == 1
+
+
+def test_invalid_response_is_fixed_by_one_repair_call():
+    result, calls = generate({
+        "JSON REPAIR ASSISTANT": json.dumps(PARSED_JD),
+        "JOB DESCRIPTION ANALYSIS ASSISTANT": 'Here is the analysis: {"job_title": "Backend Engineer",',
+    })
+    assert result.model_dump() == PARSED_JD
+    assert calls == 2
+
+
+def test_response_still_invalid_after_repair_raises():
+    with pytest.raises(ResponseDecodeError) as error:
+        generate({
+            "JSON REPAIR ASSISTANT": '["Backend Engineer"]',
+            "JOB DESCRIPTION ANALYSIS ASSISTANT": "not json",
+        })
+    assert error.value.raw_response == '["Backend Engineer"]'
+    assert "ParsedJobDescription" in str(error.value)
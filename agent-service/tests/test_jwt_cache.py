@@ -0,0 +1,72 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jose import jwt
+
+from backend.utils import jwt as auth
+from backend.utils.jwt import VerifiedTokenCache
+
+USER_ID = "64b7f0c2a1b2c3d4e5f60718"
+
+
+@pytest.fixture
+def sign(monkeypatch):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode()
+    public_pem = private_key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    monkeypatch.setattr(auth, "_public_key", None)
+    auth.load_public_key(public_pem)
+    monkeypatch.setattr(auth, "token_cache", VerifiedTokenCache(max_size=100, ttl=300))
+    return lambda payload: jwt.encode(payload, private_pem, algorithm="RS256")
+
+
+def verify(token: str) -> dict:
+    return asyncio.run(auth.verify_jwt_token(token))
+
+
+def test_cache_entry_ends_at_the_token_exp(monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(auth.time, "time", lambda: now)
+    cache = VerifiedTokenCache(max_size=10, ttl=300)
+    cache.set("token", {"_id": USER_ID, "exp": now + 5})
+    assert cache.get("token") == {"_id": USER_ID, "exp": now + 5}
+
+    now += 5
+    assert cache.get("token") is None
+
+
+def test_expired_token_is_not_served_from_cache(sign):
+    exp = int(time.time()) + 1
+    token = sign({"_id": USER_ID, "exp": exp})
+    assert verify(token)["_id"] == USER_ID
+    assert auth.token_cache.get(token) is not None
+
+    while int(time.time()) <= exp:
+        time.sleep(0.1)
+    assert auth.token_cache.get(token) is None
+    with pytest.raises(HTTPException) as error:
+        verify(token)
+    assert error.value.status_code == 401
+
+
+def test_tampered_token_misses_the_cache_and_fails_verification(sign):
+    token = sign({"_id": USER_ID, "exp": int(time.time()) + 3600})
+    assert verify(token)["_id"] == USER_ID
+
+    header, _, signature = token.split(".")
+    forged = base64.urlsafe_b64encode(json.dumps({"_id": "0" * 24, "exp": int(time.time()) + 3600}).encode()).decode().rstrip("=")
+    tampered = f"{header}.{forged}.{signature}"
+    assert auth.token_cache.get(tampered) is None
+    with pytest.raises(HTTPException) as error:
+        verify(tampered)
+    assert error.value.status_code == 401
+    assert auth.token_cache.get(tampered) is None
+
+    # The genuine token is still served from cache
+    assert verify(token)["_id"] == USER_ID
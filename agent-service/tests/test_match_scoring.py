@@ -0,0 +1,95 @@
+from datetime import date
+
+import pytest
+
+from backend.utils.match_scoring import WEIGHTS, education_level, extract_experience_years, required_education, score_match
+
+TODAY = date(2025, 6, 1)
+
+
+def jobs(*durations) -> dict:
+    return {"work_experience": [{"role": "Engineer", "duration": duration} for duration in durations]}
+
+
+def test_overlapping_roles_are_counted_once():
+    assert extract_experience_years(jobs("Jan 2018 - Dec 2019", "Jun 2019 - Dec 2020"), TODAY) == 3.0
+
+
+def test_adjacent_and_separate_roles_add_up():
+    assert extract_experience_years(jobs("Jan 2018 - Dec 2018", "Jan 2019 - Dec 2019"), TODAY) == 2.0
+    assert extract_experience_years(jobs("Jan 2015 - Dec 2015", "Jan 2018 - Dec 2018"), TODAY) == 2.0
+
+
+def test_present_and_loose_durations():
+    assert extract_experience_years(jobs("Jun 2024 - Present"), TODAY) == 1.1
+    assert extract_experience_years(jobs("2 years", "6 months", "Jan 2020 - Dec 2020"), TODAY) == 3.5
+
+
+@pytest.mark.parametrize("text, level", [
+    ("PhD in Machine Learning", 5),
+    ("Doctorate", 5),
+    ("Master of Science", 4),
+    ("MS in Computer Science", 4),
+    ("M.S. Computer Science", 4),
+    ("M.Tech", 4),
+    ("MBA", 4),
+    ("Bachelor of Engineering", 3),
+    ("B.Sc Physics", 3),
+    ("BS in Mathematics", 3),
+    ("Engineering degree", 3),
+    ("Diploma in IT", 2),
+    ("Associate degree", 2),
+    ("High School", 1),
+    ("MS Office", 0),
+    ("Proficient in MS Excel and MS Word", 0),
+    ("", 0),
+])
+def test_education_levels(text, level):
+    assert education_level(text)[0] == level
+
+
+def test_ms_office_in_a_jd_is_not_a_masters_requirement():
+    assert required_education("Bachelor's degree; proficiency in MS Office")[0] == 3
+
+
+RESUME = {
+    "skills": {"languages": ["Python"], "backend": ["FastAPI"]},
+    "work_experience": [{"role": "Engineer", "duration": "Jan 2015 - Dec 2019", "achievements": ["Led a team, strong communication"]}],
+    "education": [{"degree": "Bachelor of Science", "major": "Computer Science"}],
+}
+JD = {
+    "required_skills": {"must_have": ["Python", "FastAPI"], "nice_to_have": []},
+    "experience_level_required": "3+ years",
+    "educational_requirements": "Bachelor's degree in Computer Science",
+    "soft_skills_mentioned": ["communication"],
+}
+
+
+def overall(resume: dict = RESUME, jd: dict = JD) -> int:
+    return score_match(resume, jd)["overall_match_percentage"]
+
+
+def test_weights_add_up_to_one():
+    assert sum(WEIGHTS.values()) == pytest.approx(1)
+    assert WEIGHTS == {"skills": 0.4, "experience": 0.3, "education": 0.2, "soft_skills": 0.1}
+
+
+def test_full_match_scores_100():
+    assert overall() == 100
+
+
+def test_each_category_weighs_in_by_its_weight():
+    # No must-have skill matched: loses the 40% skills weight
+    assert overall({**RESUME, "skills": {"languages": ["Go"]}}) == 60
+    # Experience mismatch (30 of 100) costs 70% of the 30% weight
+    assert overall(jd={**JD, "experience_level_required": "10+ years"}) == 79
+    # Education mismatch (40 of 100) costs 60% of the 20% weight
+    assert overall(jd={**JD, "educational_requirements": "Master's degree in Computer Science"}) == 88
+    # No soft-skill evidence loses the 10% weight
+    assert overall(jd={**JD, "soft_skills_mentioned": ["negotiation"]}) == 90
+
+
+def test_ms_office_on_a_resume_does_not_meet_a_masters_requirement():
+    resume = {**RESUME, "education": [{"degree": "Bachelor of Science", "major": "Computer Science, MS Office"}]}
+    result = score_match(resume, {**JD, "educational_requirements": "Master's degree"})
+    assert result["education_alignment"] == "mismatch"
@@ -0,0 +1,30 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.app import app
+
+OPS_PATHS = ["/metrics", "/cache-stats", "/job-stats"]
+
+
+def get(path: str, client_host: str) -> httpx.Response:
+    async def request():
+        transport = httpx.ASGITransport(app=app, client=(client_host, 40000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.get(path)
+    return asyncio.run(request())
+
+
+@pytest.mark.parametrize("path", OPS_PATHS)
+def test_ops_endpoints_answer_loopback(path):
+    assert get(path, "127.0.0.1").status_code == 200
+
+
+@pytest.mark.parametrize("path", OPS_PATHS)
+def test_ops_endpoints_refuse_other_networks(path):
+    assert get(path, "203.0.113.7").status_code == 403
+
+
+def test_health_stays_public():
+    assert get("/health", "203.0.113.7").status_code == 200
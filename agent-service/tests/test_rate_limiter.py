@@ -0,0 +1,137 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from backend.llm import rate_limiter
+from backend.llm.errors import GeminiRateLimitTimeout
+from backend.llm.rate_limiter import STATE, TokenBucketLimiter
+
+
+def limiter(tmp_path, rpm: int = 60, tpm: int = 0, max_wait: float = 0) -> TokenBucketLimiter:
+    return TokenBucketLimiter(requests_per_minute=rpm, tokens_per_minute=tpm, state_path=str(tmp_path / "limiter.bin"), max_wait=max_wait)
+
+
+def levels(bucket: TokenBucketLimiter) -> tuple:
+    with open(bucket.state_path, "rb") as state:
+        return STATE.unpack(state.read())[:2]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_refills_at_the_per_minute_rate(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    bucket = limiter(tmp_path, rpm=60)
+
+    for _ in range(60):
+        assert bucket._update(1, 0) == 0.0
+    assert bucket._update(1, 0) == pytest.approx(1.0)
+
+    clock.now += 5
+    for _ in range(5):
+        assert bucket._update(1, 0) == 0.0
+    assert bucket._update(1, 0) > 0
+
+    # Refill never goes past one minute of budget
+    clock.now += 3600
+    bucket._update(0, 0)
+    assert levels(bucket)[0] == pytest.approx(60)
+
+
+def test_acquire_times_out_instead_of_waiting_past_max_wait(tmp_path):
+    bucket = limiter(tmp_path, rpm=60, max_wait=0.1)
+    asyncio.run(bucket.acquire(0))
+    bucket._update(59, 0)
+    with pytest.raises(GeminiRateLimitTimeout):
+        asyncio.run(bucket.acquire(0))
+
+
+def test_limiters_on_one_state_file_share_the_budget(tmp_path):
+    first, second = limiter(tmp_path, rpm=10), limiter(tmp_path, rpm=10)
+    for _ in range(5):
+        assert first._update(1, 0) == 0.0
+        assert second._update(1, 0) == 0.0
+    assert first._update(1, 0) > 0
+    assert second._update(1, 0) > 0
+
+
+def _take(state_path: str, count: int):
+    bucket = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=0, state_path=state_path)
+    for _ in range(count):
+        bucket._update(1, 0)
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="needs flock")
+def test_processes_share_the_budget(tmp_path):
+    bucket = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=0, state_path=str(tmp_path / "limiter.bin"))
+    bucket._update(0, 0)
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_take, args=(bucket.state_path, 20)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    # 60 taken by the workers; at most a second of refill since
+    assert levels(bucket)[0] == pytest.approx(40, abs=2)
+
+
+def test_record_usage_settles_the_token_estimate(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    bucket = limiter(tmp_path, rpm=0, tpm=1000)
+
+    reserved = asyncio.run(bucket.acquire(300))
+    assert levels(bucket)[1] == pytest.approx(700)
+
+    bucket.record_usage(reserved, 500)
+    assert levels(bucket)[1] == pytest.approx(500)
+
+    asyncio.run(bucket.record_usage_async(reserved, 100))
+    assert levels(bucket)[1] == pytest.approx(700)
+
+    # Nothing reported, or nothing reserved: the estimate stands
+    bucket.record_usage(reserved, 0)
+    bucket.record_usage(0, 500)
+    assert levels(bucket)[1] == pytest.approx(700)
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="needs flock")
+def test_acquire_waits_for_the_file_lock_off_the_event_loop(tmp_path):
+    bucket = limiter(tmp_path, rpm=60)
+    bucket._update(0, 0)
+
+    async def main():
+        holder = os.open(bucket.state_path, os.O_RDWR)
+        rate_limiter.fcntl.flock(holder, rate_limiter.fcntl.LOCK_EX)
+        # Released from another thread, so a blocked event loop shows up as a lack of ticks
+        threading.Timer(0.3, rate_limiter.fcntl.flock, (holder, rate_limiter.fcntl.LOCK_UN)).start()
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.create_task(heartbeat())
+        started = time.monotonic()
+        try:
+            await bucket.acquire(0)
+        finally:
+            beat.cancel()
+            os.close(holder)
+        return ticks, time.monotonic() - started
+
+    ticks, elapsed = asyncio.run(main())
+    assert elapsed >= 0.25
+    assert ticks >= 10
@@ -0,0 +1,52 @@
+import pytest
+
+from backend.agents.state import MissingInputError, create_initial_state, create_reanalysis_state
+from backend.utils.match_scoring import score_match
+
+RESUME = "Jane Doe\nBackend engineer known for clear communication and mentoring\nPython, FastAPI"
+JD = "Backend Engineer\nPython and FastAPI required\nStrong communication skills"
+PARSED_RESUME = {"skills": {"languages": ["Python"], "backend": ["FastAPI"]}, "work_experience": []}
+PARSED_JD = {"required_skills": {"must_have": ["Python", "FastAPI"]}, "soft_skills_mentioned": ["communication"]}
+
+
+def stored_analysis() -> dict:
+    state = create_initial_state(RESUME, JD)
+    return {
+        "parsed_resume": PARSED_RESUME,
+        "parsed_jd": PARSED_JD,
+        "match_analysis": {},
+        "recommendations": [],
+        "input_hashes": state["input_hashes"],
+        "input_texts": {"resume": state["resume_text"], "jd": state["job_description"]},
+    }
+
+
+def test_omitted_resume_is_scored_on_its_stored_text():
+    fresh = create_initial_state(RESUME, JD)
+    state = create_reanalysis_state(stored_analysis(), job_description=JD + "\nDocker is a plus")
+
+    assert state["resume_text"] == fresh["resume_text"]
+    assert state["parsed_resume"] == PARSED_RESUME
+    assert state["parsed_jd"] == {}
+    assert score_match(PARSED_RESUME, PARSED_JD, state["resume_text"]) == score_match(PARSED_RESUME, PARSED_JD, fresh["resume_text"])
+
+
+def test_omitted_jd_keeps_its_stored_text():
+    state = create_reanalysis_state(stored_analysis(), resume_text=RESUME + "\nDocker")
+
+    assert state["job_description"] == create_initial_state(RESUME, JD)["job_description"]
+    assert state["parsed_resume"] == {}
+    assert state["parsed_jd"] == PARSED_JD
+
+
+def test_without_stored_text_an_omitted_input_is_requested_when_the_match_is_rescored():
+    previous = {**stored_analysis(), "input_texts": {}}
+    with pytest.raises(MissingInputError):
+        create_reanalysis_state(previous, job_description=JD + "\nDocker is a plus")
+
+
+def test_without_stored_text_an_unchanged_match_is_reused():
+    previous = {**stored_analysis(), "input_texts": {}, "match_analysis": {"overall_match_percentage": 90}, "recommendations": ["Add metrics"]}
+    state = create_reanalysis_state(previous)
+    assert state["match_analysis"] == {"overall_match_percentage": 90}
+    assert state["recommendations"] == ["Add metrics"]
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from backend.llm.resilience import CircuitBreaker, ResilientGeminiClient
+
+
+class HangingClient:
+    model = "hanging"
+
+    async def analyze_text_async(self, prompt, text, response_schema=None, node=None):
+        await asyncio.sleep(3600)
+
+
+class OkClient:
+    model = "ok"
+
+    async def analyze_text_async(self, prompt, text, response_schema=None, node=None):
+        return "{}"
+
+
+def test_cancelled_half_open_trial_releases_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.state = "open"
+
+    async def scenario():
+        hanging = ResilientGeminiClient(HangingClient(), breaker=breaker)
+        task = asyncio.create_task(hanging.analyze_text_async("p", "t", node="matcher"))
+        await asyncio.sleep(0.01)
+        assert breaker.state == "half_open"
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        return await ResilientGeminiClient(OkClient(), breaker=breaker).analyze_text_async("p", "t", node="matcher")
+
+    assert asyncio.run(scenario()) == "{}"
+    assert breaker.state == "closed"
@@ -0,0 +1,37 @@
+from bson import ObjectId
+
+from backend.utils.search_index import UserIndex
+
+
+def analysis(name: str, email: str = "", phone: str = "") -> dict:
+    return {
+        "_id": ObjectId(),
+        "parsed_resume": {
+            "personal_details": {"name": name, "contact_info": {"email": email, "phone": phone}},
+            "skills": {"languages": ["Python"]},
+        },
+    }
+
+
+def test_resumes_with_the_same_name_and_different_emails_are_separate_rows():
+    index = UserIndex()
+    index.add(analysis("John Smith", "john.smith@acme.com"))
+    index.add(analysis("John Smith", "jsmith@example.org"))
+    assert len(index.resumes.entries) == 2
+
+
+def test_resubmitted_resume_replaces_its_row():
+    index = UserIndex()
+    index.add(analysis("John Smith", "John.Smith@acme.com"))
+    newer = analysis("John Smith", "john.smith@acme.com ")
+    index.add(newer)
+    assert [entry["analysis_id"] for entry in index.resumes.entries] == [newer["_id"]]
+
+
+def test_resumes_without_email_dedupe_on_name_and_phone_only():
+    index = UserIndex()
+    index.add(analysis("John Smith", phone="+1 (555) 010-2000"))
+    index.add(analysis("John Smith", phone="+1 555 010 2000"))
+    index.add(analysis("John Smith"))
+    index.add(analysis("John Smith"))
+    assert len(index.resumes.entries) == 3
@@ -0,0 +1,34 @@
+import tracemalloc
+
+from backend.utils.skill_taxonomy import SkillIndex
+
+
+def test_skills_outside_the_taxonomy_match_by_spelling():
+    index = SkillIndex()
+    matched, missing = index.match(["Salesforce Marketing Cloud", "SAP ABAP"], ["salesforce marketing-cloud", "Python"])
+    assert matched == ["Salesforce Marketing Cloud"]
+    assert missing == ["SAP ABAP"]
+
+
+def test_matching_unknown_skills_does_not_keep_dense_rows():
+    index = SkillIndex()
+    tracemalloc.start()
+    try:
+        for i in range(2000):
+            index.match([f"inhouse tool {i:x}z"], [f"in-house tool {i:x}z"])
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # One dense row is 16 KB, so keeping them would retain over 60 MB here
+    assert retained < 20 * 2 ** 20
+
+
+def test_normalize_survives_the_cache_filling_up():
+    skills = ["python", "java", "go", "rust", "react"]
+    expected = SkillIndex().normalize(skills)
+    index = SkillIndex(cache_size=4)
+    index.normalize(skills[:2])
+    # Resolving the three new skills overflows the cache and clears it
+    assert index.normalize(skills) == expected
+    assert len(index._resolved) <= 4
+    assert index.normalize(skills[:2]) == expected[:2]
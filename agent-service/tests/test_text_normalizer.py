@@ -0,0 +1,41 @@
+from backend.utils.text_normalizer import normalize_text
+
+
+def test_single_paragraph_jd_keeps_everything_but_the_boilerplate_sentence():
+    jd = (
+        "Senior Python Engineer. We need 5+ years of Python, Django and PostgreSQL. "
+        "Acme is an equal opportunity employer. Apply by May 1."
+    )
+    text, stats = normalize_text(jd, "jd")
+    assert text == "Senior Python Engineer. We need 5+ years of Python, Django and PostgreSQL. Apply by May 1."
+    assert stats["boilerplate_lines"] == 1
+
+
+def test_standalone_boilerplate_lines_are_dropped():
+    jd = "Requirements\nPython and Django\nAcme is an equal opportunity employer.\nApply now"
+    text, _ = normalize_text(jd, "jd")
+    assert text == "Requirements\nPython and Django"
+
+
+def test_repeated_job_titles_are_kept():
+    resume = "\n".join([
+        "Experience",
+        "Software Engineer", "Acme Corp, 2021 - Present", "- Built billing APIs",
+        "Software Engineer", "Globex, 2018 - 2021", "- Migrated services to Kubernetes",
+        "Software Engineer", "Initech, 2015 - 2018", "- Wrote reporting jobs",
+        "Education", "BSc Computer Science",
+    ])
+    text, stats = normalize_text(resume, "resume")
+    assert text.count("Software Engineer") == 3
+    assert stats["duplicate_lines"] == 0
+
+
+def test_running_headers_and_footers_are_dropped():
+    pages = [
+        f"Jane Doe\nPython developer with {page} things to say\nDetail line {page}\nConfidential\n{page}"
+        for page in range(1, 4)
+    ]
+    text, _ = normalize_text("\f".join(pages), "resume")
+    assert text.count("Jane Doe") == 1
+    assert text.count("Confidential") == 1
+    assert "Detail line 3" in text
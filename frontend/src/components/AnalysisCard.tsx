@@ -131,17 +131,17 @@ const AnalysisCard: React.FC<AnalysisCardProps> = ({ analysis, onView, onDelete
                 <div className='grid grid-cols-2 gap-4 mb-4 text-sm'>
                     <div className='flex justify-between'>
                         <span className='text-gray-600'>Skills Matched:</span>
-                        <span className='font-medium text-green-600'>{analysis.match_analysis.skill_match.matched.length}</span>
+                        <span className='font-medium text-green-600'>{analysis.match_analysis?.skill_match?.matched?.length || 0}</span>
                     </div>
                     <div className='flex justify-between'>
                         <span className='text-gray-600'>Skills Missing:</span>
-                        <span className='font-medium text-red-600'>{analysis.match_analysis.skill_match.missing.length}</span>
+                        <span className='font-medium text-red-600'>{analysis.match_analysis?.skill_match?.missing?.length || 0}</span>
                     </div>
                     <div className='flex justify-between items-center col-span-2'>
                         <span className='text-gray-600'>Experience:</span>
                         <div className='flex items-center space-x-1'>
-                            {getExperienceIcon(analysis.match_analysis.experience_level)}
-                            <span className='font-medium capitalize'>{analysis.match_analysis.experience_level}</span>
+                            {getExperienceIcon(analysis.match_analysis?.experience_level)}
+                            <span className='font-medium capitalize'>{analysis.match_analysis?.experience_level}</span>
                         </div>
                     </div>
                 </div>
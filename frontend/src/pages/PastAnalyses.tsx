@@ -5,7 +5,7 @@ import AnalysisCard from '../components/AnalysisCard'
 import AnalysisModal from '../components/AnalysisModal'
 import DeleteConfirmModal from '../components/DeleteConfirmModal'
 import LoadingSpinner from '../components/LoadingSpinner'
-import { deleteAnalysis, pastAnalysis } from '@/services/v1/agent/agent.service'
+import { deleteAnalysis, getAnalysis, pastAnalysis } from '@/services/v1/agent/agent.service'
 import { useDispatch, useSelector, type TypedUseSelectorHook } from 'react-redux'
 import { openToast } from '@/redux/slice/toastSlice'
 import type { AppDispatch, RootState } from '@/redux/store'
@@ -80,12 +80,20 @@ const PastAnalyses: React.FC = () => {
         fetchAnalyses()
     }, [currentPage, fetchAnalyses])
 
-    const handleViewAnalysis = (analysisId: string) => {
-        console.log('analysisId: ', analysisId)
-        const analysis = analyses.find((a) => a._id === analysisId)
-        if (analysis) {
-            setSelectedAnalysis(analysis)
-            setShowAnalysisModal(true)
+    // The list only carries what the cards show (report details may be stored
+    // compressed), so the modal and its PDF download use the full report
+    const handleViewAnalysis = async (analysisId: string) => {
+        try {
+            const response = await getAnalysis(analysisId)
+            if (response?.success) {
+                setSelectedAnalysis(response.data as Analysis)
+                setShowAnalysisModal(true)
+            } else {
+                dispatch(openToast({ message: response.message, type: 'error' }))
+            }
+        } catch (error) {
+            console.log('error: ', error)
+            dispatch(openToast({ message: 'Something went wrong', type: 'error' }))
         }
     }
 
@@ -32,6 +32,19 @@ export const pastAnalysis = async (params: { currentPage: number; itemsPerPage:
     }
 }
 
+export const getAnalysis = async (id: string) => {
+    try {
+        const response = await axios({
+            url: `/v1/agent/report/${id}`,
+            method: 'GET',
+        })
+
+        return handleResponse(response, 'success')
+    } catch (error) {
+        return handleResponse(error, 'error')
+    }
+}
+
 export const deleteAnalysis = async (id: string | null) => {
     try {
         const response = await axios({